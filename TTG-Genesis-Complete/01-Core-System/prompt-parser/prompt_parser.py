@@ -1,65 +1,72 @@
+"""
+TTG Genesis - Prompt Parser
+Converts natural language prompts into structured game world data using Ollama
+
+PromptParser.parse_prompts() sends a batch of prompts to Ollama concurrently. The
+server only works on OLLAMA_NUM_PARALLEL requests per loaded model at a time, so
+export that variable before `ollama serve` to raise batch throughput; the same
+variable caps how many requests this module keeps in flight.
+"""
+
+import copy
+import functools
+import hashlib
 import json
-import requests
-import yaml
+import math
+import operator
+import re
+import sys
+import threading
+import time
 import os
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, Iterable, List, Any, Mapping, Optional, Tuple
+from collections import OrderedDict
+from types import MappingProxyType
+from dataclasses import dataclass, fields
 import logging
 
+try:
+    import orjson  # Optional C-accelerated JSON; stdlib json is used without it
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
-class OllamaConfig:
-    
-    """Configuration for Ollama LLM connection"""
-    host: str = "localhost"
-    port: int = 11434
-    model: str = "llama2"  # Default model, can be changed to llama3, mistral, etc.
-    timeout: int = 60
+# Requests kept in flight by parse_prompts(), matching the Ollama server setting
+OLLAMA_NUM_PARALLEL = int(os.environ.get("OLLAMA_NUM_PARALLEL", "4"))
 
-class PromptParser:
-    """
-    Advanced prompt parser that uses Ollama LLM to generate structured game world data
-    from natural language prompts for Unreal Engine 5 integration.
-    """
+# Circuit breaker: after this many consecutive failed Ollama calls, skip the
+# server for the cooldown and fall back immediately instead of timing out
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_COOLDOWN_SECONDS = 30.0
 
-    def __init__(self, config: OllamaConfig = None):
-        self.config = config or OllamaConfig()
-        self.base_url = f"http://{self.config.host}:{self.config.port}"
+# JSON helpers: orjson when installed. orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so callers catch the stdlib exception either way.
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps_bytes = orjson.dumps
 
-    def _call_ollama(self, prompt: str) -> str:
-        """Make API call to Ollama LLM"""
-        try:
-            url = f"{self.base_url}/api/generate"
-            payload = {
-                "model": self.config.model,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": 0.7,
-                    "top_p": 0.9,
-                    "max_tokens": 2000
-                }
-            }
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    _json_loads = json.loads
 
-            response = requests.post(url, json=payload, timeout=self.config.timeout)
-            response.raise_for_status()
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
 
-            result = response.json()
-            return result.get("response", "")
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error calling Ollama API: {e}")
-            raise Exception(f"Failed to connect to Ollama: {e}")
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
-    def _create_structured_prompt(self, user_prompt: str) -> str:
-        """Create a structured prompt for the LLM to generate game world JSON"""
-        return f"""
-You are a game world generator for Unreal Engine 5. Convert the following natural language prompt into a structured JSON format for game world creation.
+# Where raw LLM responses are persisted between runs
+LLM_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ttg", "llm")
 
-User Prompt: "{user_prompt}"
+# Fixed instructions sent as the chat system message. The user prompt follows
+# as its own message, so Ollama can reuse the KV cache for this whole prefix.
+SYSTEM_PROMPT = '''You are a game world generator for Unreal Engine 5. Convert the user's natural language prompt into a structured JSON format for game world creation.
 
 Generate a comprehensive JSON structure with the following components:
 
@@ -71,15 +78,15 @@ Generate a comprehensive JSON structure with the following components:
 6. WIN/LOSE CONDITIONS: Clear victory and failure states
 
 Output ONLY valid JSON in this exact structure:
-{{
-    "metadata": {{
+{
+    "metadata": {
         "level_name": "string",
         "description": "string",
         "difficulty": "easy|medium|hard",
         "estimated_playtime": "string",
         "theme": "string"
-    }},
-    "environment": {{
+    },
+    "environment": {
         "type": "string",
         "setting": "string",
         "terrain": ["string"],
@@ -88,26 +95,26 @@ Output ONLY valid JSON in this exact structure:
         "atmosphere": "string",
         "size": "small|medium|large",
         "assets": ["string"]
-    }},
+    },
     "quests": [
-        {{
+        {
             "id": "string",
             "name": "string",
             "type": "main|side|optional",
             "objective": "string",
             "description": "string",
             "requirements": ["string"],
-            "rewards": {{
+            "rewards": {
                 "experience": "number",
                 "gold": "number",
                 "items": ["string"]
-            }},
+            },
             "location": "string",
             "estimated_time": "string"
-        }}
+        }
     ],
     "npcs": [
-        {{
+        {
             "id": "string",
             "name": "string",
             "role": "string",
@@ -115,66 +122,1261 @@ Output ONLY valid JSON in this exact structure:
             "location": "string",
             "dialogue": ["string"],
             "behavior": "string",
-            "stats": {{
+            "stats": {
                 "health": "number",
                 "attack": "number",
                 "defense": "number"
-            }},
+            },
             "inventory": ["string"]
-        }}
+        }
     ],
-    "physics": {{
+    "physics": {
         "player_abilities": ["string"],
         "movement_speed": "number",
         "jump_height": "number",
         "combat_system": "string",
         "interaction_mechanics": ["string"],
         "special_mechanics": ["string"]
-    }},
+    },
     "win_conditions": ["string"],
     "lose_conditions": ["string"],
-    "assets_required": {{
+    "assets_required": {
         "models": ["string"],
         "textures": ["string"],
         "sounds": ["string"],
         "effects": ["string"],
         "animations": ["string"]
-    }}
-}}
+    }
+}
 
 Generate creative, detailed, and balanced content. Make it engaging and suitable for Unreal Engine 5 implementation.
-"""
+'''
+
+# Part of every response cache key, so editing the system prompt retires old answers
+_SYSTEM_PROMPT_DIGEST = hashlib.sha256(SYSTEM_PROMPT.encode("utf-8")).hexdigest()
+
+# User message asking for several game worlds from one generation, in order
+_BATCH_PROMPT_HEAD = '''Convert each of the following numbered prompts into its own game world. Output ONLY a valid JSON array with one object per prompt, in the same order, each in the exact structure above.
+
+'''
+
+# Keyword tables for prompt analysis. Dict order is match priority.
+_ENV_KEYWORDS = MappingProxyType({
+    "forest": frozenset(["forest", "woods", "woodland", "trees", "grove", "jungle"]),
+    "desert": frozenset(["desert", "sand", "dunes", "oasis", "arid", "sahara"]),
+    "dungeon": frozenset(["dungeon", "cave", "underground", "cavern", "crypt", "tomb"]),
+    "urban": frozenset(["city", "town", "urban", "street", "building", "metropolis"]),
+    "ocean": frozenset(["ocean", "sea", "underwater", "aquatic", "marine", "deep"]),
+    "mountain": frozenset(["mountain", "peak", "cliff", "alpine", "highland", "summit"]),
+    "space": frozenset(["space", "station", "spaceship", "alien", "galaxy", "cosmic"]),
+    "haunted": frozenset(["haunted", "ghost", "spooky", "mansion", "scary", "paranormal"]),
+    "medieval": frozenset(["castle", "medieval", "knight", "kingdom", "fortress", "manor"]),
+    "futuristic": frozenset(["futuristic", "cyberpunk", "sci-fi", "robot", "android", "neon"])
+})
+
+_ATMOSPHERE_KEYWORDS = MappingProxyType({
+    "mysterious": frozenset(["mysterious", "enigmatic", "secret", "hidden"]),
+    "peaceful": frozenset(["peaceful", "calm", "serene", "tranquil"]),
+    "dangerous": frozenset(["dangerous", "hostile", "threatening", "perilous"]),
+    "magical": frozenset(["magical", "mystical", "enchanted", "arcane"]),
+    "dark": frozenset(["dark", "gloomy", "sinister", "ominous"]),
+    "bright": frozenset(["bright", "sunny", "cheerful", "vibrant"])
+})
+
+_WEATHER_KEYWORDS = MappingProxyType({
+    "stormy": frozenset(["storm", "thunder", "lightning", "rain"]),
+    "foggy": frozenset(["fog", "mist", "misty", "hazy"]),
+    "snowy": frozenset(["snow", "blizzard", "winter", "cold"]),
+    "sunny": frozenset(["sunny", "bright", "clear", "warm"])
+})
+
+_QUEST_TYPE_KEYWORDS = MappingProxyType({
+    "collection": frozenset(["collect", "gather", "find", "retrieve"]),
+    "combat": frozenset(["defeat", "kill", "battle", "fight"]),
+    "rescue": frozenset(["rescue", "save", "help", "protect"]),
+    "puzzle": frozenset(["solve", "puzzle", "riddle", "mystery"]),
+    "exploration": frozenset(["explore", "discover", "investigate"])
+})
+
+_NPC_KEYWORDS = MappingProxyType({
+    "villager": frozenset(["villager", "citizen", "townspeople", "villagers"]),
+    "merchant": frozenset(["merchant", "trader", "shopkeeper", "vendor"]),
+    "guard": frozenset(["guard", "soldier", "warrior", "knight"]),
+    "elder": frozenset(["elder", "chief", "leader", "mayor"]),
+    "enemy": frozenset(["enemy", "bandit", "monster", "creature"]),
+    "wizard": frozenset(["wizard", "mage", "sorcerer", "witch"]),
+    "ghost": frozenset(["ghost", "spirit", "phantom", "specter"]),
+    "animal": frozenset(["animal", "creature", "beast", "wolf", "bear"])
+})
+
+_ABILITY_KEYWORDS = MappingProxyType({
+    "swim": frozenset(["swim", "swimming", "underwater"]),
+    "fly": frozenset(["fly", "flying", "flight"]),
+    "climb": frozenset(["climb", "climbing"]),
+    "cast_spells": frozenset(["magic", "spell", "cast"]),
+    "stealth": frozenset(["stealth", "sneak", "hide"])
+})
+
+_MECHANIC_KEYWORDS = MappingProxyType({
+    "crafting_system": frozenset(["craft", "crafting", "build"]),
+    "puzzle_solving": frozenset(["puzzle", "riddle", "solve"]),
+    "trading_system": frozenset(["trade", "trading", "merchant"]),
+    "time_mechanics": frozenset(["time", "temporal", "clock"])
+})
+
+_COMBAT_SYSTEM_KEYWORDS = MappingProxyType({
+    "turn_based": frozenset(["turn-based", "tactical"]),
+    "real_time": frozenset(["real-time", "action"]),
+    "stealth_based": frozenset(["stealth", "avoid", "sneak"])
+})
+
+_DIFFICULTY_KEYWORDS = MappingProxyType({
+    "easy": frozenset(["easy", "simple", "beginner", "casual", "peaceful"]),
+    "hard": frozenset(["hard", "difficult", "challenging", "complex", "expert", "hardcore"]),
+    "medium": frozenset(["medium", "moderate", "balanced", "normal"])
+})
+
+# Each group that appears in the prompt adds one point of complexity
+_COMPLEXITY_KEYWORDS = (
+    frozenset(["puzzle", "riddle", "complex", "multiple"]),
+    frozenset(["battle", "fight", "combat", "enemy"]),
+    frozenset(["stealth", "sneak", "avoid"])
+)
+
+class _KeywordScanner:
+    """
+    Finds every keyword occurring as a substring of a text in a single pass.
+
+    All keywords are compiled into one regex alternation (longest first) that
+    is tried at each position; each match also reports the shorter keywords it
+    contains, so scan(text) == {kw for kw in keywords if kw in text}.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        ordered = sorted(set(keywords), key=len, reverse=True)
+        self._pattern = re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+        self._contained = {kw: frozenset(other for other in ordered if other in kw) for kw in ordered}
+
+    def scan(self, text: str) -> FrozenSet[str]:
+        found = set()
+        for match in self._pattern.finditer(text):
+            found |= self._contained[match.group(1)]
+        return frozenset(found)
+
+class _KeywordTable:
+    """
+    Priority-ordered category -> keywords table, inverted into a
+    keyword -> category index that is resolved against scanner hits.
+    """
+
+    def __init__(self, table: Dict[str, Iterable[str]]):
+        self.categories = tuple(table)
+        self.lookup: Dict[str, Tuple[int, ...]] = {}
+        for rank, keywords in enumerate(table.values()):
+            for keyword in keywords:
+                self.lookup[keyword] = self.lookup.get(keyword, ()) + (rank,)
+
+    def first(self, hits: FrozenSet[str], default: Optional[str]) -> Optional[str]:
+        """Highest-priority category with a keyword in hits, else default"""
+        ranks = [rank for kw in hits if kw in self.lookup for rank in self.lookup[kw]]
+        return self.categories[min(ranks)] if ranks else default
+
+    def all(self, hits: FrozenSet[str]) -> List[str]:
+        """Every category with a keyword in hits, in priority order"""
+        ranks = {rank for kw in hits if kw in self.lookup for rank in self.lookup[kw]}
+        return [self.categories[rank] for rank in sorted(ranks)]
+
+_ENV_TABLE = _KeywordTable(_ENV_KEYWORDS)
+_ATMOSPHERE_TABLE = _KeywordTable(_ATMOSPHERE_KEYWORDS)
+_WEATHER_TABLE = _KeywordTable(_WEATHER_KEYWORDS)
+_QUEST_TYPE_TABLE = _KeywordTable(_QUEST_TYPE_KEYWORDS)
+_NPC_TABLE = _KeywordTable(_NPC_KEYWORDS)
+_ABILITY_TABLE = _KeywordTable(_ABILITY_KEYWORDS)
+_MECHANIC_TABLE = _KeywordTable(_MECHANIC_KEYWORDS)
+_COMBAT_SYSTEM_TABLE = _KeywordTable(_COMBAT_SYSTEM_KEYWORDS)
+_DIFFICULTY_TABLE = _KeywordTable(_DIFFICULTY_KEYWORDS)
+
+# Descriptive words promoted into the generated level name, in name order
+_LEVEL_NAME_ADJECTIVES = ("ancient", "mystical", "dark", "hidden", "lost", "forgotten", "sacred", "cursed", "magical", "haunted")
+_LEVEL_NAME_NOUNS = ("temple", "forest", "castle", "city", "ruins", "sanctuary", "chamber", "valley", "peak", "depths")
+_LEVEL_NAME_RANKS = MappingProxyType({word: rank for rank, word in enumerate(_LEVEL_NAME_ADJECTIVES + _LEVEL_NAME_NOUNS)})
+_LEVEL_NAME_WORDS = frozenset(_LEVEL_NAME_RANKS)
+
+# Prompt details that add to the setting description and environment assets
+_CONTEXT_KEYWORDS = ("ancient", "magical", "mystical", "dangerous", "peaceful", "puzzle", "treasure", "temple")
+
+# Quest and NPC location, first match wins
+_LOCATIONS = ("temple", "forest", "village", "cave", "castle", "city", "desert", "mountain", "ocean")
+
+# Words that switch on NPC variants and win/lose conditions
+_TRIGGER_KEYWORDS = ("save", "rescue", "defeat", "find", "discover", "time", "timer", "ghost", "wizard")
+
+# Environment assets added when the prompt mentions the keyword, in order
+_CONTEXT_ASSETS = (
+    ("ancient", ("ancient_ruins", "old_statues", "weathered_stones")),
+    ("magical", ("glowing_crystals", "magic_circles", "enchanted_items")),
+    ("puzzle", ("puzzle_mechanisms", "switches", "pressure_plates")),
+    ("treasure", ("treasure_chests", "gold_coins", "precious_gems")),
+    ("temple", ("temple_pillars", "altar", "sacred_symbols"))
+)
+
+_KEYWORD_SCANNER = _KeywordScanner([
+    keyword
+    for table in (_ENV_TABLE, _ATMOSPHERE_TABLE, _WEATHER_TABLE, _QUEST_TYPE_TABLE, _NPC_TABLE,
+                  _ABILITY_TABLE, _MECHANIC_TABLE, _COMBAT_SYSTEM_TABLE, _DIFFICULTY_TABLE)
+    for keyword in table.lookup
+] + [keyword for keywords in _COMPLEXITY_KEYWORDS for keyword in keywords]
+  + list(_LEVEL_NAME_ADJECTIVES + _LEVEL_NAME_NOUNS + _CONTEXT_KEYWORDS + _LOCATIONS + _TRIGGER_KEYWORDS))
+
+# Whole-word prompt tokens used by the size and quest-count analysis
+_SMALL_SIZE_WORDS = frozenset(["small", "tiny", "mini", "little"])
+_LARGE_SIZE_WORDS = frozenset(["large", "huge", "massive", "giant", "vast"])
+_QUEST_COUNT_VERBS = frozenset(["complete", "finish", "do"])
+
+_LEVEL_NAMES = MappingProxyType({
+    "forest": "Whispering Woods",
+    "desert": "Shifting Sands",
+    "dungeon": "Forgotten Depths",
+    "urban": "Neon Streets",
+    "ocean": "Abyssal Depths",
+    "mountain": "Frozen Peaks",
+    "space": "Stellar Void",
+    "haunted": "Phantom Manor",
+    "medieval": "Ancient Keep",
+    "futuristic": "Chrome Citadel"
+})
+
+_SETTING_DESCRIPTIONS = MappingProxyType({
+    "forest": "A lush woodland area",
+    "desert": "An arid desert landscape",
+    "dungeon": "Underground chambers and corridors",
+    "urban": "A bustling city environment",
+    "ocean": "Aquatic depths and marine environments",
+    "mountain": "High-altitude rocky terrain",
+    "space": "Futuristic space environment",
+    "haunted": "A spooky supernatural location",
+    "medieval": "A medieval fantasy setting",
+    "futuristic": "An advanced technological environment"
+})
+
+_LIGHTING_MAP = MappingProxyType({
+    ("forest", "dark"): "filtered_moonlight",
+    ("forest", "bright"): "dappled_sunlight",
+    ("forest", "mysterious"): "filtered_sunlight",
+    ("desert", "bright"): "harsh_sunlight",
+    ("desert", "dark"): "starlight",
+    ("dungeon", "dark"): "torch_light",
+    ("dungeon", "mysterious"): "ambient_glow",
+    ("space", "dark"): "artificial_lighting",
+    ("haunted", "dark"): "dim_flickering"
+})
+
+# Strings up to this length in cached game data are interned: keys and
+# enum-like values ("friendly", "stationary_helpful") repeat across worlds
+_INTERN_MAX_LEN = 40
+
+def _intern_strings(value: Any) -> Any:
+    """Deep-copy JSON-shaped data, interning dict keys and short string values"""
+    if isinstance(value, dict):
+        return {sys.intern(k) if isinstance(k, str) else k: _intern_strings(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_intern_strings(v) for v in value]
+    if isinstance(value, str) and len(value) <= _INTERN_MAX_LEN:
+        return sys.intern(value)
+    return copy.deepcopy(value)
+
+def _freeze(value: Any) -> Any:
+    """
+    Read-only view of JSON-shaped data: dicts become mapping proxies, lists
+    tuples, and short strings are interned so every copy shares one object
+    """
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, str) and len(value) <= _INTERN_MAX_LEN:
+        return sys.intern(value)
+    return value
+
+def _thaw(value: Any) -> Any:
+    """Mutable deep copy of data produced by _freeze"""
+    if isinstance(value, (NPCRecord, QuestRecord)):
+        return value.as_dict()
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+@functools.lru_cache(maxsize=None)
+def _compile_placeholders(text: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Split a quest template once into (literal, placeholder name) segments"""
+    segments = []
+    pos = 0
+    for match in _PLACEHOLDER_RE.finditer(text):
+        segments.append((text[pos:match.start()], match.group(1)))
+        pos = match.end()
+    segments.append((text[pos:], None))
+    return tuple(segments)
+
+def _fill_placeholders(segments: Tuple[Tuple[str, Optional[str]], ...], values: Mapping[str, str]) -> str:
+    """Join compiled template segments, substituting known placeholder values"""
+    parts = []
+    for literal, name in segments:
+        parts.append(literal)
+        if name is not None:
+            parts.append(values.get(name, "{" + name + "}"))
+    return "".join(parts)
+
+# Read-only generation tables shared by every parse; helpers copy what they hand out
+_TERRAIN_MAP = MappingProxyType({
+    "forest": ("grass", "dirt_paths", "rocky_areas", "streams"),
+    "desert": ("sand_dunes", "rocky_outcrops", "oasis", "canyons"),
+    "dungeon": ("stone_floors", "corridors", "chambers", "stairs"),
+    "urban": ("streets", "buildings", "parks", "plazas"),
+    "ocean": ("water", "beaches", "coral_reefs", "islands"),
+    "mountain": ("rocky_peaks", "cliffs", "caves", "snow_caps")
+})
+_DEFAULT_TERRAIN = ("grass", "dirt", "rocks")
+
+_ASSET_MAP = MappingProxyType({
+    "forest": ("trees", "bushes", "rocks", "flowers", "mushrooms"),
+    "desert": ("cacti", "sand_dunes", "rocks", "palm_trees", "ruins"),
+    "dungeon": ("torches", "pillars", "chests", "doors", "stairs"),
+    "urban": ("buildings", "streetlights", "benches", "fountains", "vehicles"),
+    "ocean": ("water", "coral", "seaweed", "fish", "boats"),
+    "mountain": ("rocks", "snow", "pine_trees", "caves", "peaks")
+})
+_DEFAULT_ASSETS = ("generic_props",)
+
+_MODEL_MAP = MappingProxyType({
+    "forest": ("tree_oak", "tree_pine", "bush_berry", "rock_moss", "flower_wild"),
+    "desert": ("cactus_large", "palm_tree", "sand_dune", "rock_desert", "ruins_pillar"),
+    "dungeon": ("wall_stone", "door_wooden", "torch_wall", "chest_treasure", "pillar_stone"),
+    "urban": ("building_house", "streetlight", "bench_park", "fountain", "car_generic"),
+    "ocean": ("water_plane", "coral_reef", "seaweed", "fish_tropical", "boat_small"),
+    "mountain": ("rock_cliff", "tree_pine", "snow_patch", "cave_entrance", "peak_summit")
+})
+_DEFAULT_MODELS = ("generic_prop",)
+
+_TEXTURE_MAP = MappingProxyType({
+    "forest": ("bark_oak", "grass_forest", "dirt_path", "moss_rock", "leaf_texture"),
+    "desert": ("sand_fine", "rock_sandstone", "palm_bark", "cactus_skin", "ruins_stone"),
+    "dungeon": ("stone_wall", "wood_aged", "metal_rusty", "flame_torch", "gem_crystal"),
+    "urban": ("concrete_sidewalk", "brick_building", "metal_street", "glass_window", "asphalt_road"),
+    "ocean": ("water_surface", "coral_colorful", "sand_beach", "seaweed_green", "wood_boat"),
+    "mountain": ("rock_granite", "snow_fresh", "ice_crystal", "pine_bark", "cliff_face")
+})
+_DEFAULT_TEXTURES = ("generic_texture",)
+
+# Texture lists in export order (deduplicated and sorted), computed once per environment
+_REQUIRED_TEXTURES = MappingProxyType({
+    env_type: tuple(sorted(set(textures))) for env_type, textures in _TEXTURE_MAP.items()
+})
+_DEFAULT_REQUIRED_TEXTURES = tuple(sorted(set(_DEFAULT_TEXTURES)))
+
+# Assets every level needs, plus extras per quest type and NPC disposition
+_BASE_SOUNDS = frozenset(["ambient_background", "footsteps", "ui_sounds"])
+_BASE_EFFECTS = frozenset(["particle_dust", "light_rays"])
+_BASE_ANIMATIONS = frozenset(["player_walk", "player_idle"])
+
+# Extra assets as (models, sounds, effects, animations), merged with four set unions
+_EMPTY_ASSETS = (frozenset(), frozenset(), frozenset(), frozenset())
+
+_QUEST_ASSETS = MappingProxyType({
+    "combat": (
+        frozenset(["weapon_sword", "shield"]),
+        frozenset(["combat_sounds", "weapon_clash"]),
+        frozenset(),
+        frozenset(["attack_animation", "defend_animation"])
+    ),
+    "collection": (
+        frozenset(["collectible_items", "item_glow"]),
+        frozenset(["pickup_sound", "item_collected"]),
+        frozenset(["pickup_sparkle"]),
+        frozenset()
+    ),
+    "puzzle": (
+        frozenset(["puzzle_pieces", "mechanisms"]),
+        frozenset(["puzzle_solve", "mechanism_activate"]),
+        frozenset(["puzzle_glow"]),
+        frozenset()
+    )
+})
+
+# NPCs that are not hostile get the friendly set
+_NPC_ASSETS = MappingProxyType({
+    "hostile": (
+        frozenset(),
+        frozenset(["enemy_growl", "combat_music"]),
+        frozenset(),
+        frozenset(["enemy_attack", "enemy_death"])
+    ),
+    "friendly": (
+        frozenset(),
+        frozenset(["npc_talk", "friendly_music"]),
+        frozenset(),
+        frozenset(["npc_idle", "npc_gesture"])
+    )
+})
+
+_QUEST_TEMPLATES = _freeze({
+    "collection": {
+        "name": "Gather Sacred Items",
+        "objective": "Collect {count} {items} from the {location}",
+        "description": "Ancient {items} are needed to {purpose}",
+        "items": ["herbs", "crystals", "artifacts", "scrolls"],
+        "locations": ["forest", "temple", "ruins", "cave"],
+        "purposes": ["save the village", "unlock the door", "restore balance", "break the curse"]
+    },
+    "combat": {
+        "name": "Defeat the Guardian",
+        "objective": "Defeat the {enemy} that guards the {location}",
+        "description": "A powerful {enemy} blocks your path to {goal}",
+        "enemies": ["guardian", "beast", "demon", "spirit"],
+        "locations": ["temple", "chamber", "grove", "sanctum"],
+        "goals": ["treasure", "exit", "artifact", "sanctuary"]
+    },
+    "rescue": {
+        "name": "Save the Villagers",
+        "objective": "Rescue {count} {people} from {danger}",
+        "description": "Innocent {people} are trapped and need your help",
+        "people": ["villagers", "travelers", "children", "elders"],
+        "dangers": ["bandits", "monsters", "curse", "prison"]
+    },
+    "puzzle": {
+        "name": "Solve Ancient Mysteries",
+        "objective": "Solve the {puzzle_type} to unlock {reward}",
+        "description": "Ancient {puzzle_type} guard the secrets of this place",
+        "puzzle_types": ["riddles", "mechanisms", "symbols", "patterns"],
+        "rewards": ["chamber", "treasure", "passage", "knowledge"]
+    },
+    "exploration": {
+        "name": "Explore the Unknown",
+        "objective": "Discover the secrets of the {location}",
+        "description": "Uncover the mysteries hidden within the {location}",
+        "locations": ["ancient ruins", "hidden chamber", "sacred grove", "lost temple"]
+    }
+})
+
+# Placeholder values each quest template fills in, as (placeholder, list key, default)
+_QUEST_PLACEHOLDERS = (
+    ("items", "items", "items"),
+    ("enemy", "enemies", "enemy"),
+    ("people", "people", "people"),
+    ("danger", "dangers", "danger"),
+    ("puzzle_type", "puzzle_types", "puzzles"),
+    ("reward", "rewards", "reward"),
+    ("purpose", "purposes", "achieve your goal"),
+    ("goal", "goals", "your goal")
+)
+
+def _quest_template_values(template: Mapping[str, Any]) -> Mapping[str, str]:
+    """Placeholder values for a quest template, minus the prompt-dependent location"""
+    values = {"count": "3"}
+    for name, key, default in _QUEST_PLACEHOLDERS:
+        values[name] = template[key][0] if key in template else default
+    return MappingProxyType(values)
+
+def _specialize_quest_text(text: str, values: Mapping[str, str]) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Compile quest text with its fixed values already substituted, leaving {location}"""
+    return _compile_placeholders(_fill_placeholders(_compile_placeholders(text), values))
+
+# Per quest type: (compiled objective, compiled description), only {location} left open
+_QUEST_RENDER = MappingProxyType({
+    quest_type: (
+        _specialize_quest_text(template["objective"], _quest_template_values(template)),
+        _specialize_quest_text(template["description"], _quest_template_values(template))
+    )
+    for quest_type, template in _QUEST_TEMPLATES.items()
+})
+
+_NPC_TEMPLATES = _freeze({
+    "villager": {
+        "name": "Village Elder",
+        "role": "quest_giver",
+        "type": "friendly",
+        "dialogue": ["Welcome, brave adventurer!", "Our village needs your help!", "Thank you for coming!"],
+        "behavior": "stationary_helpful",
+        "stats": {"health": 100, "attack": 0, "defense": 10}
+    },
+    "merchant": {
+        "name": "Traveling Merchant",
+        "role": "trader",
+        "type": "friendly",
+        "dialogue": ["Welcome to my shop!", "I have rare items for sale!", "Safe travels, friend!"],
+        "behavior": "stationary_trader",
+        "stats": {"health": 80, "attack": 5, "defense": 15}
+    },
+    "guard": {
+        "name": "Temple Guardian",
+        "role": "protector",
+        "type": "neutral",
+        "dialogue": ["Halt! State your business.", "This area is protected.", "You may pass."],
+        "behavior": "patrol_guard",
+        "stats": {"health": 120, "attack": 30, "defense": 25}
+    },
+    "enemy": {
+        "name": "Hostile Creature",
+        "role": "antagonist",
+        "type": "hostile",
+        "dialogue": ["*growls menacingly*", "*attacks without warning*"],
+        "behavior": "aggressive_patrol",
+        "stats": {"health": 80, "attack": 25, "defense": 15}
+    }
+})
+
+_BASIC_QUESTS = _freeze({
+    "forest": [
+        {
+            "id": "forest_quest_1",
+            "name": "Gather Forest Herbs",
+            "type": "main",
+            "objective": "Collect 10 healing herbs from the forest",
+            "description": "The village healer needs herbs to cure the sick",
+            "requirements": ["access_to_forest"],
+            "rewards": {"experience": 100, "gold": 50, "items": ["healing_potion"]},
+            "location": "forest_clearing",
+            "estimated_time": "10 minutes"
+        },
+        {
+            "id": "forest_quest_2",
+            "name": "Defeat the Forest Guardian",
+            "type": "main",
+            "objective": "Defeat the corrupted forest guardian",
+            "description": "A once-peaceful guardian has been corrupted by dark magic",
+            "requirements": ["complete_forest_quest_1"],
+            "rewards": {"experience": 200, "gold": 100, "items": ["guardian_sword"]},
+            "location": "ancient_grove",
+            "estimated_time": "15 minutes"
+        }
+    ],
+    "desert": [
+        {
+            "id": "desert_quest_1",
+            "name": "Find the Lost Oasis",
+            "type": "main",
+            "objective": "Locate the hidden oasis in the desert",
+            "description": "Travelers speak of a magical oasis that can save the dying town",
+            "requirements": ["desert_map"],
+            "rewards": {"experience": 150, "gold": 75, "items": ["water_crystal"]},
+            "location": "deep_desert",
+            "estimated_time": "12 minutes"
+        }
+    ]
+})
+_DEFAULT_BASIC_QUESTS = _freeze([
+    {
+        "id": "generic_quest_1",
+        "name": "Explore the Area",
+        "type": "main",
+        "objective": "Explore and discover the secrets of this place",
+        "description": "There are mysteries to uncover in this location",
+        "requirements": [],
+        "rewards": {"experience": 100, "gold": 50, "items": ["exploration_token"]},
+        "location": "starting_area",
+        "estimated_time": "10 minutes"
+    }
+])
+
+_BASIC_NPCS = _freeze({
+    "forest": [
+        {
+            "id": "forest_villager_1",
+            "name": "Elder Willow",
+            "role": "village_elder",
+            "type": "friendly",
+            "location": "village_center",
+            "dialogue": ["Welcome, traveler!", "The forest is in danger!", "Please help us!"],
+            "behavior": "stationary_helpful",
+            "stats": {"health": 100, "attack": 0, "defense": 10},
+            "inventory": ["village_key", "quest_scroll"]
+        },
+        {
+            "id": "forest_enemy_1",
+            "name": "Corrupted Wolf",
+            "role": "forest_enemy",
+            "type": "hostile",
+            "location": "dark_forest",
+            "dialogue": ["*growls menacingly*"],
+            "behavior": "aggressive_patrol",
+            "stats": {"health": 80, "attack": 25, "defense": 15},
+            "inventory": ["wolf_pelt"]
+        }
+    ]
+})
+_DEFAULT_BASIC_NPCS = _freeze([
+    {
+        "id": "generic_npc_1",
+        "name": "Mysterious Stranger",
+        "role": "guide",
+        "type": "neutral",
+        "location": "starting_point",
+        "dialogue": ["Greetings, adventurer!", "This place holds many secrets."],
+        "behavior": "helpful_guide",
+        "stats": {"health": 100, "attack": 10, "defense": 20},
+        "inventory": ["map", "compass"]
+    }
+])
+
+# Shape of the game data the LLM must produce, mirroring the structured prompt.
+# Numbers are checked where the UE5 loaders read them as numeric fields.
+_STRING = {"type": "string"}
+_NUMBER = {"type": "number"}
+_STRING_LIST = {"type": "array", "items": _STRING}
+
+GAME_DATA_SCHEMA = {
+    "type": "object",
+    "required": ["metadata", "environment", "quests", "npcs", "physics",
+                 "win_conditions", "lose_conditions", "assets_required"],
+    "properties": {
+        "metadata": {
+            "type": "object",
+            "required": ["level_name"],
+            "properties": {
+                "level_name": _STRING,
+                "description": _STRING,
+                "difficulty": _STRING,
+                "estimated_playtime": _STRING,
+                "theme": _STRING
+            }
+        },
+        "environment": {
+            "type": "object",
+            "required": ["type"],
+            "properties": {
+                "type": _STRING,
+                "setting": _STRING,
+                "terrain": _STRING_LIST,
+                "lighting": _STRING,
+                "weather": _STRING,
+                "atmosphere": _STRING,
+                "size": _STRING,
+                "assets": _STRING_LIST
+            }
+        },
+        "quests": {
+            "type": "array",
+            "minItems": 1,
+            "items": {
+                "type": "object",
+                "required": ["name", "objective"],
+                "properties": {
+                    "id": _STRING,
+                    "name": _STRING,
+                    "type": _STRING,
+                    "objective": _STRING,
+                    "description": _STRING,
+                    "requirements": _STRING_LIST,
+                    "rewards": {
+                        "type": "object",
+                        "properties": {
+                            "experience": _NUMBER,
+                            "gold": _NUMBER,
+                            "items": _STRING_LIST
+                        }
+                    },
+                    "location": _STRING,
+                    "estimated_time": _STRING
+                }
+            }
+        },
+        "npcs": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["name"],
+                "properties": {
+                    "id": _STRING,
+                    "name": _STRING,
+                    "role": _STRING,
+                    "type": _STRING,
+                    "location": _STRING,
+                    "dialogue": _STRING_LIST,
+                    "behavior": _STRING,
+                    "stats": {
+                        "type": "object",
+                        "properties": {
+                            "health": _NUMBER,
+                            "attack": _NUMBER,
+                            "defense": _NUMBER
+                        }
+                    },
+                    "inventory": _STRING_LIST
+                }
+            }
+        },
+        "physics": {
+            "type": "object",
+            "properties": {
+                "player_abilities": _STRING_LIST,
+                "movement_speed": _NUMBER,
+                "jump_height": _NUMBER,
+                "combat_system": _STRING,
+                "interaction_mechanics": _STRING_LIST,
+                "special_mechanics": _STRING_LIST
+            }
+        },
+        "win_conditions": _STRING_LIST,
+        "lose_conditions": _STRING_LIST,
+        "assets_required": {
+            "type": "object",
+            "properties": {
+                "models": _STRING_LIST,
+                "textures": _STRING_LIST,
+                "sounds": _STRING_LIST,
+                "effects": _STRING_LIST,
+                "animations": _STRING_LIST
+            }
+        }
+    }
+}
+
+class SchemaError(ValueError):
+    """Raised by a compiled schema validator when data does not match"""
+
+_JSON_TYPES = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "number": (int, float),
+    "integer": int,
+    "boolean": bool
+}
+
+def _compile_schema(schema: Dict[str, Any]) -> Callable[[Any, str], None]:
+    """
+    Compile a JSON Schema subset (type, required, properties, items, minItems)
+    into nested closures, so validation does no schema interpretation per call.
+    """
+    checks = []
+
+    expected = schema.get("type")
+    if expected:
+        python_type = _JSON_TYPES[expected]
+        allow_bool = expected == "boolean"
+
+        def check_type(value, path):
+            if not isinstance(value, python_type) or (isinstance(value, bool) and not allow_bool):
+                raise SchemaError(f"{path} must be of type {expected}")
+        checks.append(check_type)
+
+    required = tuple(schema.get("required", ()))
+    if required:
+        def check_required(value, path):
+            for key in required:
+                if key not in value:
+                    raise SchemaError(f"Missing required key: {path}.{key}")
+        checks.append(check_required)
+
+    properties = tuple((key, _compile_schema(sub)) for key, sub in schema.get("properties", {}).items())
+    if properties:
+        def check_properties(value, path):
+            for key, validate in properties:
+                if key in value:
+                    validate(value[key], f"{path}.{key}")
+        checks.append(check_properties)
+
+    min_items = schema.get("minItems")
+    if min_items:
+        def check_min_items(value, path):
+            if len(value) < min_items:
+                raise SchemaError(f"{path} must have at least {min_items} item(s)")
+        checks.append(check_min_items)
+
+    if "items" in schema:
+        validate_item = _compile_schema(schema["items"])
+
+        def check_items(value, path):
+            for i, item in enumerate(value):
+                validate_item(item, f"{path}[{i}]")
+        checks.append(check_items)
+
+    checks = tuple(checks)
+
+    def validate(value, path):
+        for check in checks:
+            check(value, path)
+    return validate
+
+_validate_schema = _compile_schema(GAME_DATA_SCHEMA)
+
+def _validate_game_data_schema(game_data: Any) -> None:
+    """Raise SchemaError if game_data does not match GAME_DATA_SCHEMA"""
+    _validate_schema(game_data, "game_data")
+
+# slots= needs Python 3.10; older interpreters still get a frozen dataclass
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class OllamaConfig:
+    
+    """Configuration for Ollama LLM connection (immutable and hashable)"""
+    host: str = "localhost"
+    port: int = 11434
+    model: str = "llama2"  # Default model, can be changed to llama3, mistral, etc.
+    timeout: int = 60
+    temperature: float = 0.0  # Deterministic by default; raise (e.g. 0.7) for creative, uncached output
+    cache_enabled: bool = True  # Reuse raw LLM responses for identical prompts
+    semantic_cache: bool = True
+    embedding_model: str = "all-minilm"  # Small local model used to embed prompts
+    similarity_threshold: float = 0.87
+    keep_alive: str = "30m"  # How long Ollama keeps the model loaded between calls
+
+class _Record:
+    """Base for the immutable records the prompt analysis builds"""
+    __slots__ = ()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain dict of the record, in field order, for export"""
+        return {f.name: _thaw(getattr(self, f.name)) for f in fields(self)}
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class NPCRecord(_Record):
+    """NPC produced by prompt analysis; dialogue, stats and inventory are read-only"""
+    id: str
+    name: str
+    role: str
+    type: str
+    location: str
+    dialogue: Tuple[str, ...]
+    behavior: str
+    stats: Mapping[str, Any]
+    inventory: Tuple[str, ...]
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class QuestRecord(_Record):
+    """Quest produced by prompt analysis"""
+    id: str
+    name: str
+    type: str
+    objective: str
+    description: str
+    requirements: Tuple[str, ...]
+    rewards: Mapping[str, Any]
+    location: str
+    estimated_time: str
+
+class _JsonObjectScanner:
+    """
+    Incrementally locates the first complete top-level JSON object in text
+    that arrives in chunks, so a streamed LLM response can be cut off as
+    soon as the object closes instead of waiting for trailing chatter.
+    Pass opener="[" to look for a top-level array instead.
+    """
+
+    def __init__(self, opener: str = "{"):
+        self._opener = opener
+        self._closer = "}" if opener == "{" else "]"
+        self.start = -1   # offset of the opening brace, -1 until seen
+        self.end = -1     # offset just past the closing brace, -1 until complete
+        self._offset = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: str) -> bool:
+        """Consume the next chunk; True once the first object is complete"""
+        if self.end != -1:
+            return True
+        for i, ch in enumerate(chunk):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == self._opener:
+                if self._depth == 0:
+                    self.start = self._offset + i
+                self._depth += 1
+            elif self._depth == 0:
+                continue
+            elif ch == '"':
+                self._in_string = True
+            elif ch == self._closer:
+                self._depth -= 1
+                if self._depth == 0:
+                    self.end = self._offset + i + 1
+                    self._offset += len(chunk)
+                    return True
+        self._offset += len(chunk)
+        return False
+
+class ResponseCache:
+    """
+    Exact-match cache of raw LLM responses keyed by SHA-256 of the request
+    (model, system prompt, sampling options and user prompt).
+
+    Entries are kept in an in-memory LRU and, when a directory is given, also
+    written to disk (one file per key) so later runs skip the LLM call too.
+    Without a directory any immutable value can be held, e.g. frozen game data.
+    """
+
+    def __init__(self, maxsize: int = 512, directory: Optional[str] = None):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Hash the parts that determine an LLM response into a cache key"""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+
+        if value is None and self.directory:
+            value = self._read(key)
+            if value is not None:
+                self._remember(key, value)
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        """Store a response under key"""
+        self._remember(key, value)
+        if self.directory:
+            self._write(key, value)
+
+    def discard(self, key: str) -> None:
+        """Drop the response stored under key, in memory and on disk"""
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.directory:
+            try:
+                os.remove(os.path.join(self.directory, key))
+            except OSError:
+                pass
+
+    def _remember(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _read(self, key: str) -> Optional[str]:
+        try:
+            with open(os.path.join(self.directory, key), "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write(self, key: str, value: str) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, key)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(value)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not persist LLM response: {e}")
+
+class SemanticCache:
+    """
+    LRU cache of generated game data keyed by prompt embedding.
+
+    A lookup returns the stored game data whose prompt embedding has the highest
+    cosine similarity with the query, provided it reaches the threshold, so
+    paraphrased prompts reuse an earlier LLM result.
+    """
+
+    def __init__(self, embed: Callable[[str], Optional[List[float]]],
+                 threshold: float = 0.87, maxsize: int = 1024):
+        self.embed = embed
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._vectors: List[List[float]] = []  # Unit-length embeddings, oldest first
+        self._entries: List[Dict[str, Any]] = []
+        self._last: Optional[tuple] = None  # (prompt, vector) of the latest lookup
+        self._lock = threading.Lock()
+
+    def _vector_for(self, prompt: str) -> Optional[List[float]]:
+        last = self._last
+        if last is not None and last[0] == prompt:
+            return last[1]
+
+        embedding = self.embed(prompt)
+        if not embedding:
+            return None
+        norm = math.sqrt(sum(x * x for x in embedding))
+        if norm == 0:
+            return None
+        vector = [x / norm for x in embedding]
+        self._last = (prompt, vector)
+        return vector
+
+    def lookup(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached game data for a similar prompt, if any"""
+        query = self._vector_for(prompt)
+        if query is None:
+            return None
+
+        with self._lock:
+            best_index, best_score = -1, self.threshold
+            for i, vector in enumerate(self._vectors):
+                score = sum(map(operator.mul, vector, query))
+                if score >= best_score:
+                    best_index, best_score = i, score
+
+            if best_index < 0:
+                return None
+
+            # Mark as most recently used
+            self._vectors.append(self._vectors.pop(best_index))
+            self._entries.append(self._entries.pop(best_index))
+            game_data = self._entries[-1]
+
+        logger.info(f"Semantic cache hit (similarity {best_score:.2f})")
+        return copy.deepcopy(game_data)
+
+    def store(self, prompt: str, game_data: Dict[str, Any]) -> None:
+        """Remember game data generated for a prompt"""
+        vector = self._vector_for(prompt)
+        if vector is None:
+            return
+
+        with self._lock:
+            self._vectors.append(vector)
+            self._entries.append(_intern_strings(game_data))
+            if len(self._entries) > self.maxsize:
+                del self._vectors[0]
+                del self._entries[0]
+
+class PromptParser:
+    """
+    Advanced prompt parser that uses Ollama LLM to generate structured game world data
+    from natural language prompts for Unreal Engine 5 integration.
+    """
+
+    def __init__(self, config: OllamaConfig = None):
+        self.config = config or OllamaConfig()
+        self.base_url = f"http://{self.config.host}:{self.config.port}"
+
+        # Keep-alive connection pool reused by every Ollama call, opened on first use
+        self._http = None
+        self._http_lock = threading.Lock()
+        self._timeout = (10, self.config.timeout)  # (connect, read) seconds
+        self._consecutive_failures = 0
+        self._breaker_open_until = 0.0
+
+        # Cached answers are only reproducible when sampling is deterministic
+        deterministic = self.config.temperature == 0
+        self._response_cache = None
+        if self.config.cache_enabled and deterministic:
+            self._response_cache = ResponseCache(directory=LLM_CACHE_DIR)
+        self._semantic_cache = None
+        if self.config.semantic_cache and deterministic:
+            self._semantic_cache = SemanticCache(self._embed_prompt, self.config.similarity_threshold)
+        # Frozen game data from validated LLM output, for repeated prompts
+        self._result_cache = None
+        if self.config.cache_enabled and deterministic:
+            self._result_cache = ResponseCache(maxsize=512)
+
+    def _session(self) -> "requests.Session":
+        """Return the pooled HTTP session, importing requests on first use"""
+        with self._http_lock:
+            if self._http is None:
+                self._http = _new_ollama_session(max(10, OLLAMA_NUM_PARALLEL))
+            return self._http
+
+    def warm_up(self) -> bool:
+        """
+        Load the model into Ollama and open a pooled connection ahead of the first prompt
+
+        Ollama loads a model without generating anything when it receives an
+        empty prompt, so this costs no tokens and leaves the caches untouched.
+
+        Returns:
+            True if Ollama accepted the request
+        """
+        import requests
+
+        payload = {"model": self.config.model, "keep_alive": self.config.keep_alive}
+        try:
+            response = self._session().post(f"{self.base_url}/api/generate", data=_json_dumps_bytes(payload),
+                                            headers=_JSON_HEADERS, timeout=self._timeout)
+            response.raise_for_status()
+            logger.info(f"Model {self.config.model} loaded in Ollama")
+            return True
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Could not warm up model {self.config.model}: {e}")
+            return False
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections to Ollama"""
+        if self._http is not None:
+            self._http.close()
+
+    def __enter__(self) -> "PromptParser":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _call_ollama(self, prompt: str, opener: str = "{") -> str:
+        """
+        Make API call to Ollama LLM, reading until the first JSON value opened by opener closes
+
+        The prompt is sent as the user message after the fixed SYSTEM_PROMPT.
+        """
+        import requests
+
+        cache_key = None
+        if self._response_cache is not None:
+            cache_key = self._response_key(prompt)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Using cached LLM response")
+                return cached
+
+        if time.monotonic() < self._breaker_open_until:
+            raise ConnectionError("Ollama circuit open after repeated failures, skipping call")
+
+        try:
+            url = f"{self.base_url}/api/chat"
+            payload = {
+                "model": self.config.model,
+                "messages": [
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                "stream": True,
+                "keep_alive": self.config.keep_alive,
+                "options": self._chat_options()
+            }
+
+            # Stream tokens and hang up once the first JSON object has closed
+            parts = []
+            scanner = _JsonObjectScanner(opener)
+            with self._session().post(url, data=_json_dumps_bytes(payload), headers=_JSON_HEADERS,
+                                      timeout=self._timeout, stream=True) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    result = _json_loads(line)
+                    chunk = result.get("message", {}).get("content", "")
+                    parts.append(chunk)
+                    if scanner.feed(chunk) or result.get("done"):
+                        break
+
+            self._consecutive_failures = 0
+            llm_response = "".join(parts)
+            if scanner.end != -1:
+                llm_response = llm_response[:scanner.end]
+            if cache_key is not None and llm_response:
+                self._response_cache.put(cache_key, llm_response)
+            return llm_response
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error calling Ollama API: {e}")
+            self._record_failure()
+            raise Exception(f"Failed to connect to Ollama: {e}")
+
+    def _chat_options(self) -> Dict[str, Any]:
+        """Sampling options sent with every chat request"""
+        return {
+            "temperature": self.config.temperature,
+            "top_p": 0.9,
+            "max_tokens": 2000
+        }
+
+    def _response_key(self, prompt: str) -> str:
+        """Key of the raw LLM response to a prompt: everything in the request that shapes the answer"""
+        options = json.dumps(self._chat_options(), sort_keys=True)
+        return ResponseCache.make_key(self.config.model, _SYSTEM_PROMPT_DIGEST, options, prompt)
+
+    def _forget_response(self, prompt: str) -> None:
+        """Evict an unusable LLM response so the next request for the prompt asks Ollama again"""
+        if self._response_cache is not None:
+            self._response_cache.discard(self._response_key(prompt))
+
+    def _record_failure(self) -> None:
+        """Count a failed Ollama request, opening the circuit breaker after too many in a row"""
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= BREAKER_FAILURE_THRESHOLD:
+            self._breaker_open_until = time.monotonic() + BREAKER_COOLDOWN_SECONDS
+            logger.warning(f"Ollama failed {self._consecutive_failures} times in a row, "
+                           f"using fallback generation for {BREAKER_COOLDOWN_SECONDS:.0f}s")
+
+    def _embed_prompt(self, prompt: str) -> Optional[List[float]]:
+        """Embed a prompt with the Ollama embedding model, or None if unavailable"""
+        import requests
+
+        # While Ollama is known to be down, skip the embedding instead of waiting on it
+        if time.monotonic() < self._breaker_open_until:
+            return None
+
+        try:
+            url = f"{self.base_url}/api/embeddings"
+            payload = {"model": self.config.embedding_model, "prompt": prompt}
+            response = self._session().post(url, data=_json_dumps_bytes(payload), headers=_JSON_HEADERS, timeout=10)
+            response.raise_for_status()
+            return _json_loads(response.content).get("embedding")
+
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            # Ollama unreachable: counts toward the breaker shared with the LLM calls
+            logger.debug(f"Prompt embedding unavailable: {e}")
+            self._record_failure()
+            return None
+        except requests.exceptions.RequestException as e:
+            # Ollama answered (e.g. embedding model not pulled), so the server is up
+            logger.debug(f"Prompt embedding unavailable: {e}")
+            return None
+
+    async def _call_ollama_async(self, prompt: str) -> str:
+        """Make API call to Ollama LLM without blocking the event loop"""
+        import asyncio
+        return await asyncio.to_thread(self._call_ollama, prompt)
+
+    def _create_batch_prompt(self, user_prompts: List[str]) -> str:
+        """Create a user message asking for one game world per user prompt"""
+        numbered = "".join(f'{n}. "{prompt}"\n' for n, prompt in enumerate(user_prompts, 1))
+        return _BATCH_PROMPT_HEAD + numbered
+
+    def _clean_json_array_response(self, response: str) -> str:
+        """Extract the first complete JSON array from an LLM response"""
+        return self._extract_first_json(response, "[")
 
     def _clean_json_response(self, response: str) -> str:
         """Clean and extract JSON from LLM response"""
-        # Find JSON content between curly braces
-        start_idx = response.find('{')
-        end_idx = response.rfind('}')
+        return self._extract_first_json(response, "{")
 
-        if start_idx == -1 or end_idx == -1:
+    def _extract_first_json(self, response: str, opener: str) -> str:
+        """Return the first balanced top-level JSON value opened by opener, in one pass"""
+        scanner = _JsonObjectScanner(opener)
+        if not scanner.feed(response):
             raise ValueError("No valid JSON found in LLM response")
-
-        json_str = response[start_idx:end_idx + 1]
-        return json_str
+        return response[scanner.start:scanner.end]
 
     def _validate_game_data(self, game_data: Dict[str, Any]) -> bool:
-        """Validate the generated game data structure"""
-        required_keys = ["metadata", "environment", "quests", "npcs", "physics",
-                        "win_conditions", "lose_conditions", "assets_required"]
-
-        for key in required_keys:
-            if key not in game_data:
-                logger.warning(f"Missing required key: {key}")
-                return False
-
-        # Validate quests structure
-        if not isinstance(game_data["quests"], list) or len(game_data["quests"]) == 0:
-            logger.warning("Quests must be a non-empty list")
-            return False
-
-        # Validate NPCs structure
-        if not isinstance(game_data["npcs"], list):
-            logger.warning("NPCs must be a list")
+        """Validate the generated game data structure against GAME_DATA_SCHEMA"""
+        try:
+            _validate_game_data_schema(game_data)
+        except SchemaError as e:
+            logger.warning(str(e))
             return False
 
         return True
@@ -190,43 +1392,193 @@ Generate creative, detailed, and balanced content. Make it engaging and suitable
         Returns:
             Dictionary containing structured game world data
         """
+        return self.parse_prompt_checked(prompt)[0]
+
+    def parse_prompt_checked(self, prompt: str) -> Tuple[Dict[str, Any], bool]:
+        """
+        Parse a prompt like parse_prompt, also reporting where the data came from
+
+        Args:
+            prompt: Natural language description of the game world
+
+        Returns:
+            The game data, and True if it is validated LLM output (fresh or
+            cached) rather than template fallback data
+        """
         logger.info(f"Processing prompt: {prompt}")
 
-        # Create structured prompt for LLM
-        structured_prompt = self._create_structured_prompt(prompt)
+        cached = self._cached_result(prompt)
+        if cached is not None:
+            return cached, True
+
+        if self._semantic_cache:
+            cached = self._semantic_cache.lookup(prompt)
+            if cached is not None:
+                return cached, True
 
         # Get response from Ollama
         try:
-            llm_response = self._call_ollama(structured_prompt)
+            llm_response = self._call_ollama(prompt)
             logger.info("Received response from Ollama LLM")
         except Exception as e:
             logger.error(f"Failed to get LLM response: {e}")
             # Fallback to template-based generation
+            return self._generate_fallback_data(prompt), False
+
+        return self._process_llm_response(prompt, llm_response)
+
+    async def parse_prompts(self, prompts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Parse several natural language prompts concurrently
+
+        Requests overlap on the network and inside Ollama; at most
+        OLLAMA_NUM_PARALLEL of them are in flight at once.
+
+        Args:
+            prompts: Natural language descriptions of game worlds
+
+        Returns:
+            List of structured game world data, in the same order as prompts
+        """
+        import asyncio
+        limit = asyncio.Semaphore(OLLAMA_NUM_PARALLEL)
+
+        async def bounded(prompt: str) -> Dict[str, Any]:
+            async with limit:
+                return await self._parse_one_async(prompt)
+
+        return list(await asyncio.gather(*(bounded(p) for p in prompts)))
+
+    def parse_prompts_batched(self, prompts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Parse several natural language prompts with a single LLM generation
+
+        The prompts are enumerated in one structured prompt and the model
+        answers with a JSON array of game worlds in the same order. Prompts
+        whose entry is missing or invalid are retried with parse_prompt.
+
+        Args:
+            prompts: Natural language descriptions of game worlds
+
+        Returns:
+            List of structured game world data, in the same order as prompts
+        """
+        results: List[Optional[Dict[str, Any]]] = [self._cached_result(prompt) for prompt in prompts]
+        if self._semantic_cache:
+            for i, prompt in enumerate(prompts):
+                if results[i] is None:
+                    results[i] = self._semantic_cache.lookup(prompt)
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+
+        logger.info(f"Processing {len(pending)} prompts in one batch")
+        batch_prompt = self._create_batch_prompt([prompts[i] for i in pending])
+
+        try:
+            llm_response = self._call_ollama(batch_prompt, opener="[")
+            logger.info("Received batch response from Ollama LLM")
+        except Exception as e:
+            logger.error(f"Failed to get LLM response: {e}")
+            for i in pending:
+                results[i] = self._generate_fallback_data(prompts[i])
+            return results
+
+        try:
+            worlds = _json_loads(self._clean_json_array_response(llm_response))
+        except ValueError as e:
+            logger.error(f"Failed to parse JSON array from LLM response: {e}")
+            worlds = []
+        if not isinstance(worlds, list) or len(worlds) != len(pending):
+            logger.warning("Batch response does not match the prompts, parsing them one by one")
+            worlds = []
+
+        all_valid = bool(worlds)
+        for n, i in enumerate(pending):
+            game_data = worlds[n] if n < len(worlds) else None
+            if isinstance(game_data, dict) and self._validate_game_data(game_data):
+                self._remember_result(prompts[i], game_data)
+                results[i] = game_data
+            else:
+                all_valid = False
+                results[i] = self.parse_prompt(prompts[i])
+
+        # Keep the raw batch response only if replaying it would not hit the same bad entries
+        if not all_valid:
+            self._forget_response(batch_prompt)
+
+        return results
+
+    async def _parse_one_async(self, prompt: str) -> Dict[str, Any]:
+        """Async counterpart of parse_prompt used by parse_prompts"""
+        logger.info(f"Processing prompt: {prompt}")
+
+        cached = self._cached_result(prompt)
+        if cached is not None:
+            return cached
+
+        if self._semantic_cache:
+            import asyncio
+            cached = await asyncio.to_thread(self._semantic_cache.lookup, prompt)
+            if cached is not None:
+                return cached
+
+        try:
+            llm_response = await self._call_ollama_async(prompt)
+            logger.info("Received response from Ollama LLM")
+        except Exception as e:
+            logger.error(f"Failed to get LLM response: {e}")
             return self._generate_fallback_data(prompt)
 
+        return self._process_llm_response(prompt, llm_response)[0]
+
+    def _process_llm_response(self, prompt: str, llm_response: str) -> Tuple[Dict[str, Any], bool]:
+        """Turn a raw LLM response into validated game data, falling back if unusable; the flag is False on fallback"""
         # Clean and parse JSON
         try:
             json_str = self._clean_json_response(llm_response)
-            game_data = json.loads(json_str)
+            game_data = _json_loads(json_str)
         except (ValueError, json.JSONDecodeError) as e:
             logger.error(f"Failed to parse JSON from LLM response: {e}")
             logger.info("Falling back to template-based generation")
-            return self._generate_fallback_data(prompt)
+            self._forget_response(prompt)
+            return self._generate_fallback_data(prompt), False
 
         # Validate structure
         if not self._validate_game_data(game_data):
             logger.warning("Generated data failed validation, using fallback")
-            return self._generate_fallback_data(prompt)
+            self._forget_response(prompt)
+            return self._generate_fallback_data(prompt), False
+
+        self._remember_result(prompt, game_data)
 
         logger.info("Successfully generated game world data")
-        return game_data
+        return game_data, True
+
+    def _cached_result(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh copy of the game data already generated for this exact prompt"""
+        if self._result_cache is None:
+            return None
+        cached = self._result_cache.get(ResponseCache.make_key(self.config.model, prompt))
+        if cached is None:
+            return None
+        logger.info("Using cached game world for repeated prompt")
+        return _thaw(cached)
+
+    def _remember_result(self, prompt: str, game_data: Dict[str, Any]) -> None:
+        """Keep validated LLM game data for repeats of the prompt, exact or similar"""
+        if self._result_cache is not None:
+            self._result_cache.put(ResponseCache.make_key(self.config.model, prompt), _freeze(game_data))
+        if self._semantic_cache:
+            self._semantic_cache.store(prompt, game_data)
 
     def _generate_fallback_data(self, prompt: str) -> Dict[str, Any]:
         """Generate intelligent fallback game data based on prompt analysis"""
         logger.info("Generating intelligent fallback game data based on prompt analysis")
 
         # Analyze the prompt in detail
-        analysis = self._analyze_prompt(prompt)
+        analysis = _thaw(self._analyze_prompt(prompt))
 
         # Generate data based on analysis
         fallback_data = {
@@ -257,31 +1609,44 @@ Generate creative, detailed, and balanced content. Make it engaging and suitable
 
         return fallback_data
 
-    def _analyze_prompt(self, prompt: str) -> Dict[str, Any]:
+    @staticmethod
+    def _analyze_prompt(prompt: str) -> Mapping[str, Any]:
+        """Read-only analysis of the user prompt, memoized across parsers (reads no parser state)"""
+        return _analyze_prompt_pure(prompt)
+
+    @staticmethod
+    def _analyze_prompt_uncached(prompt: str) -> Dict[str, Any]:
         """Analyze the user prompt to extract specific game world details"""
         prompt_lower = prompt.lower()
         words = prompt_lower.split()
+        words_set = frozenset(words)
+
+        # Every analysis keyword present in the prompt, found in one pass
+        hits = _KEYWORD_SCANNER.scan(prompt_lower)
+
+        # Quests and NPCs are all placed at the prompt's location
+        location = PromptParser._extract_location_from_prompt(hits)
 
         # Environment analysis
-        env_analysis = self._analyze_environment(prompt_lower, words)
+        env_analysis = PromptParser._analyze_environment(prompt_lower, words_set, hits)
 
         # Quest analysis
-        quest_analysis = self._analyze_quests(prompt_lower, words)
+        quest_analysis = PromptParser._analyze_quests(prompt_lower, words, hits, location)
 
         # NPC analysis
-        npc_analysis = self._analyze_npcs(prompt_lower, words)
+        npc_analysis = PromptParser._analyze_npcs(prompt_lower, words, hits, location)
 
         # Mechanics analysis
-        mechanics_analysis = self._analyze_mechanics(prompt_lower, words)
+        mechanics_analysis = PromptParser._analyze_mechanics(prompt_lower, words, hits)
 
         # Generate level name based on prompt
-        level_name = self._generate_level_name(prompt, env_analysis["type"])
+        level_name = PromptParser._generate_level_name(hits, env_analysis["type"])
 
         # Determine difficulty
-        difficulty = self._determine_difficulty(prompt_lower, words)
+        difficulty = PromptParser._determine_difficulty(prompt_lower, words, hits)
 
         # Estimate playtime
-        playtime = self._estimate_playtime(quest_analysis["count"], difficulty)
+        playtime = PromptParser._estimate_playtime(quest_analysis["count"], difficulty)
 
         return {
             "level_name": level_name,
@@ -293,87 +1658,48 @@ Generate creative, detailed, and balanced content. Make it engaging and suitable
             "quests": quest_analysis["quests"],
             "npcs": npc_analysis,
             "physics": mechanics_analysis,
-            "win_conditions": self._generate_win_conditions(prompt_lower, quest_analysis),
-            "lose_conditions": self._generate_lose_conditions(prompt_lower, mechanics_analysis),
-            "assets_required": self._generate_required_assets(env_analysis, quest_analysis, npc_analysis)
+            "win_conditions": PromptParser._generate_win_conditions(hits, quest_analysis),
+            "lose_conditions": PromptParser._generate_lose_conditions(hits, mechanics_analysis),
+            "assets_required": PromptParser._generate_required_assets(env_analysis, quest_analysis, npc_analysis)
         }
 
-    def _analyze_environment(self, prompt_lower: str, words: List[str]) -> Dict[str, Any]:
+    @staticmethod
+    def _analyze_environment(prompt_lower: str, words_set: FrozenSet[str], hits: FrozenSet[str]) -> Dict[str, Any]:
         """Analyze environment details from prompt"""
         # Environment type detection with more keywords
-        env_keywords = {
-            "forest": ["forest", "woods", "woodland", "trees", "grove", "jungle"],
-            "desert": ["desert", "sand", "dunes", "oasis", "arid", "sahara"],
-            "dungeon": ["dungeon", "cave", "underground", "cavern", "crypt", "tomb"],
-            "urban": ["city", "town", "urban", "street", "building", "metropolis"],
-            "ocean": ["ocean", "sea", "underwater", "aquatic", "marine", "deep"],
-            "mountain": ["mountain", "peak", "cliff", "alpine", "highland", "summit"],
-            "space": ["space", "station", "spaceship", "alien", "galaxy", "cosmic"],
-            "haunted": ["haunted", "ghost", "spooky", "mansion", "scary", "paranormal"],
-            "medieval": ["castle", "medieval", "knight", "kingdom", "fortress", "manor"],
-            "futuristic": ["futuristic", "cyberpunk", "sci-fi", "robot", "android", "neon"]
-        }
-
-        env_type = "forest"  # default
-        for env, keywords in env_keywords.items():
-            if any(keyword in prompt_lower for keyword in keywords):
-                env_type = env
-                break
+        env_type = _ENV_TABLE.first(hits, "forest")
 
         # Size analysis
         size = "medium"
-        if any(word in words for word in ["small", "tiny", "mini", "little"]):
+        if words_set & _SMALL_SIZE_WORDS:
             size = "small"
-        elif any(word in words for word in ["large", "huge", "massive", "giant", "vast"]):
+        elif words_set & _LARGE_SIZE_WORDS:
             size = "large"
 
         # Atmosphere analysis
-        atmosphere_keywords = {
-            "mysterious": ["mysterious", "enigmatic", "secret", "hidden"],
-            "peaceful": ["peaceful", "calm", "serene", "tranquil"],
-            "dangerous": ["dangerous", "hostile", "threatening", "perilous"],
-            "magical": ["magical", "mystical", "enchanted", "arcane"],
-            "dark": ["dark", "gloomy", "sinister", "ominous"],
-            "bright": ["bright", "sunny", "cheerful", "vibrant"]
-        }
-
-        atmosphere = "mysterious"
-        for atm, keywords in atmosphere_keywords.items():
-            if any(keyword in prompt_lower for keyword in keywords):
-                atmosphere = atm
-                break
+        atmosphere = _ATMOSPHERE_TABLE.first(hits, "mysterious")
 
         # Weather analysis
-        weather = "clear"
-        weather_keywords = {
-            "stormy": ["storm", "thunder", "lightning", "rain"],
-            "foggy": ["fog", "mist", "misty", "hazy"],
-            "snowy": ["snow", "blizzard", "winter", "cold"],
-            "sunny": ["sunny", "bright", "clear", "warm"]
-        }
-
-        for w, keywords in weather_keywords.items():
-            if any(keyword in prompt_lower for keyword in keywords):
-                weather = w
-                break
+        weather = _WEATHER_TABLE.first(hits, "clear")
 
         return {
             "type": env_type,
-            "setting": self._generate_setting_description(env_type, prompt_lower),
-            "terrain": self._get_terrain_for_env(env_type),
-            "lighting": self._determine_lighting(env_type, atmosphere),
+            "setting": PromptParser._generate_setting_description(env_type, hits),
+            "terrain": PromptParser._get_terrain_for_env(env_type),
+            "lighting": PromptParser._determine_lighting(env_type, atmosphere),
             "weather": weather,
             "atmosphere": atmosphere,
             "size": size,
-            "assets": self._get_contextual_assets(env_type, prompt_lower)
+            "assets": PromptParser._get_contextual_assets(env_type, hits)
         }
 
-    def _analyze_quests(self, prompt_lower: str, words: List[str]) -> Dict[str, Any]:
+    @staticmethod
+    def _analyze_quests(prompt_lower: str, words: List[str], hits: FrozenSet[str], location: str) -> Dict[str, Any]:
         """Analyze quest requirements from prompt"""
         # Extract quest count
         quest_count = 1
         for i, word in enumerate(words):
-            if word.isdigit() and i > 0 and words[i-1] in ["complete", "finish", "do"]:
+            if word.isdigit() and i > 0 and words[i-1] in _QUEST_COUNT_VERBS:
                 quest_count = int(word)
                 break
             elif word in ["three", "3"]:
@@ -386,23 +1712,13 @@ Generate creative, detailed, and balanced content. Make it engaging and suitable
                 quest_count = 5
 
         # Quest type analysis
-        quest_types = []
-        if any(word in prompt_lower for word in ["collect", "gather", "find", "retrieve"]):
-            quest_types.append("collection")
-        if any(word in prompt_lower for word in ["defeat", "kill", "battle", "fight"]):
-            quest_types.append("combat")
-        if any(word in prompt_lower for word in ["rescue", "save", "help", "protect"]):
-            quest_types.append("rescue")
-        if any(word in prompt_lower for word in ["solve", "puzzle", "riddle", "mystery"]):
-            quest_types.append("puzzle")
-        if any(word in prompt_lower for word in ["explore", "discover", "investigate"]):
-            quest_types.append("exploration")
+        quest_types = _QUEST_TYPE_TABLE.all(hits)
 
         if not quest_types:
             quest_types = ["exploration"]  # default
 
         # Generate quests based on analysis
-        quests = self._generate_contextual_quests(quest_count, quest_types, prompt_lower)
+        quests = PromptParser._generate_contextual_quests(quest_count, quest_types, location)
 
         return {
             "count": quest_count,
@@ -410,72 +1726,39 @@ Generate creative, detailed, and balanced content. Make it engaging and suitable
             "quests": quests
         }
 
-    def _analyze_npcs(self, prompt_lower: str, words: List[str]) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _analyze_npcs(prompt_lower: str, words: List[str], hits: FrozenSet[str], location: str) -> List[NPCRecord]:
         """Analyze NPC requirements from prompt"""
         npcs = []
 
         # NPC type detection
-        npc_keywords = {
-            "villager": ["villager", "citizen", "townspeople", "villagers"],
-            "merchant": ["merchant", "trader", "shopkeeper", "vendor"],
-            "guard": ["guard", "soldier", "warrior", "knight"],
-            "elder": ["elder", "chief", "leader", "mayor"],
-            "enemy": ["enemy", "bandit", "monster", "creature"],
-            "wizard": ["wizard", "mage", "sorcerer", "witch"],
-            "ghost": ["ghost", "spirit", "phantom", "specter"],
-            "animal": ["animal", "creature", "beast", "wolf", "bear"]
-        }
-
-        detected_npcs = []
-        for npc_type, keywords in npc_keywords.items():
-            if any(keyword in prompt_lower for keyword in keywords):
-                detected_npcs.append(npc_type)
+        detected_npcs = _NPC_TABLE.all(hits)
 
         # Generate NPCs based on detected types
         if not detected_npcs:
             detected_npcs = ["villager"]  # default
 
         for npc_type in detected_npcs:
-            npc = self._create_contextual_npc(npc_type, prompt_lower)
+            npc = PromptParser._create_contextual_npc(npc_type, hits, location)
             npcs.append(npc)
 
         return npcs
 
-    def _analyze_mechanics(self, prompt_lower: str, words: List[str]) -> Dict[str, Any]:
+    @staticmethod
+    def _analyze_mechanics(prompt_lower: str, words: List[str], hits: FrozenSet[str]) -> Dict[str, Any]:
         """Analyze game mechanics from prompt"""
         abilities = ["walk", "run", "jump", "interact"]
         mechanics = ["quest_tracking", "inventory_system"]
         combat_system = "action_based"
 
         # Special abilities
-        if any(word in prompt_lower for word in ["swim", "swimming", "underwater"]):
-            abilities.append("swim")
-        if any(word in prompt_lower for word in ["fly", "flying", "flight"]):
-            abilities.append("fly")
-        if any(word in prompt_lower for word in ["climb", "climbing"]):
-            abilities.append("climb")
-        if any(word in prompt_lower for word in ["magic", "spell", "cast"]):
-            abilities.append("cast_spells")
-        if any(word in prompt_lower for word in ["stealth", "sneak", "hide"]):
-            abilities.append("stealth")
+        abilities.extend(_ABILITY_TABLE.all(hits))
 
         # Special mechanics
-        if any(word in prompt_lower for word in ["craft", "crafting", "build"]):
-            mechanics.append("crafting_system")
-        if any(word in prompt_lower for word in ["puzzle", "riddle", "solve"]):
-            mechanics.append("puzzle_solving")
-        if any(word in prompt_lower for word in ["trade", "trading", "merchant"]):
-            mechanics.append("trading_system")
-        if any(word in prompt_lower for word in ["time", "temporal", "clock"]):
-            mechanics.append("time_mechanics")
+        mechanics.extend(_MECHANIC_TABLE.all(hits))
 
         # Combat system
-        if any(word in prompt_lower for word in ["turn-based", "tactical"]):
-            combat_system = "turn_based"
-        elif any(word in prompt_lower for word in ["real-time", "action"]):
-            combat_system = "real_time"
-        elif any(word in prompt_lower for word in ["stealth", "avoid", "sneak"]):
-            combat_system = "stealth_based"
+        combat_system = _COMBAT_SYSTEM_TABLE.first(hits, combat_system)
 
         return {
             "player_abilities": abilities,
@@ -486,60 +1769,26 @@ Generate creative, detailed, and balanced content. Make it engaging and suitable
             "special_mechanics": mechanics
         }
 
-    def _generate_level_name(self, prompt: str, env_type: str) -> str:
+    @staticmethod
+    def _generate_level_name(hits: FrozenSet[str], env_type: str) -> str:
         """Generate a creative level name based on the prompt"""
-        prompt_lower = prompt.lower()
-
-        # Extract key descriptive words
-        descriptive_words = []
-        adjectives = ["ancient", "mystical", "dark", "hidden", "lost", "forgotten", "sacred", "cursed", "magical", "haunted"]
-        nouns = ["temple", "forest", "castle", "city", "ruins", "sanctuary", "chamber", "valley", "peak", "depths"]
-
-        for adj in adjectives:
-            if adj in prompt_lower:
-                descriptive_words.append(adj.title())
-
-        for noun in nouns:
-            if noun in prompt_lower:
-                descriptive_words.append(noun.title())
+        # Extract key descriptive words, adjectives before nouns
+        descriptive_words = sorted(hits & _LEVEL_NAME_WORDS, key=_LEVEL_NAME_RANKS.__getitem__)
 
         if descriptive_words:
-            return f"The {' '.join(descriptive_words[:2])}"
+            return f"The {' '.join(word.title() for word in descriptive_words[:2])}"
         else:
-            env_names = {
-                "forest": "Whispering Woods",
-                "desert": "Shifting Sands",
-                "dungeon": "Forgotten Depths",
-                "urban": "Neon Streets",
-                "ocean": "Abyssal Depths",
-                "mountain": "Frozen Peaks",
-                "space": "Stellar Void",
-                "haunted": "Phantom Manor",
-                "medieval": "Ancient Keep",
-                "futuristic": "Chrome Citadel"
-            }
-            return env_names.get(env_type, "Mysterious Realm")
+            return _LEVEL_NAMES.get(env_type, "Mysterious Realm")
 
-    def _determine_difficulty(self, prompt_lower: str, words: List[str]) -> str:
+    @staticmethod
+    def _determine_difficulty(prompt_lower: str, words: List[str], hits: FrozenSet[str]) -> str:
         """Determine difficulty based on prompt complexity"""
-        difficulty_keywords = {
-            "easy": ["easy", "simple", "beginner", "casual", "peaceful"],
-            "hard": ["hard", "difficult", "challenging", "complex", "expert", "hardcore"],
-            "medium": ["medium", "moderate", "balanced", "normal"]
-        }
-
-        for diff, keywords in difficulty_keywords.items():
-            if any(keyword in prompt_lower for keyword in keywords):
-                return diff
+        difficulty = _DIFFICULTY_TABLE.first(hits, None)
+        if difficulty:
+            return difficulty
 
         # Analyze complexity indicators
-        complexity_score = 0
-        if any(word in prompt_lower for word in ["puzzle", "riddle", "complex", "multiple"]):
-            complexity_score += 1
-        if any(word in prompt_lower for word in ["battle", "fight", "combat", "enemy"]):
-            complexity_score += 1
-        if any(word in prompt_lower for word in ["stealth", "sneak", "avoid"]):
-            complexity_score += 1
+        complexity_score = sum(1 for keywords in _COMPLEXITY_KEYWORDS if hits & keywords)
 
         if complexity_score >= 2:
             return "hard"
@@ -548,7 +1797,8 @@ Generate creative, detailed, and balanced content. Make it engaging and suitable
         else:
             return "easy"
 
-    def _estimate_playtime(self, quest_count: int, difficulty: str) -> str:
+    @staticmethod
+    def _estimate_playtime(quest_count: int, difficulty: str) -> str:
         """Estimate playtime based on quest count and difficulty"""
         base_time = quest_count * 10  # 10 minutes per quest
 
@@ -566,253 +1816,115 @@ Generate creative, detailed, and balanced content. Make it engaging and suitable
         else:
             return "60+ minutes"
 
-    def _generate_setting_description(self, env_type: str, prompt_lower: str) -> str:
+    @staticmethod
+    def _generate_setting_description(env_type: str, hits: FrozenSet[str]) -> str:
         """Generate contextual setting description"""
-        base_descriptions = {
-            "forest": "A lush woodland area",
-            "desert": "An arid desert landscape",
-            "dungeon": "Underground chambers and corridors",
-            "urban": "A bustling city environment",
-            "ocean": "Aquatic depths and marine environments",
-            "mountain": "High-altitude rocky terrain",
-            "space": "Futuristic space environment",
-            "haunted": "A spooky supernatural location",
-            "medieval": "A medieval fantasy setting",
-            "futuristic": "An advanced technological environment"
-        }
-
-        base = base_descriptions.get(env_type, "A mysterious location")
+        base = _SETTING_DESCRIPTIONS.get(env_type, "A mysterious location")
 
         # Add contextual details from prompt
-        if "ancient" in prompt_lower:
+        if "ancient" in hits:
             base += " with ancient ruins and artifacts"
-        if "magical" in prompt_lower or "mystical" in prompt_lower:
+        if "magical" in hits or "mystical" in hits:
             base += " infused with magical energy"
-        if "dangerous" in prompt_lower:
+        if "dangerous" in hits:
             base += " filled with hidden dangers"
-        if "peaceful" in prompt_lower:
+        if "peaceful" in hits:
             base += " with a serene and tranquil atmosphere"
 
         return base
 
-    def _determine_lighting(self, env_type: str, atmosphere: str) -> str:
+    @staticmethod
+    def _determine_lighting(env_type: str, atmosphere: str) -> str:
         """Determine appropriate lighting based on environment and atmosphere"""
-        lighting_map = {
-            ("forest", "dark"): "filtered_moonlight",
-            ("forest", "bright"): "dappled_sunlight",
-            ("forest", "mysterious"): "filtered_sunlight",
-            ("desert", "bright"): "harsh_sunlight",
-            ("desert", "dark"): "starlight",
-            ("dungeon", "dark"): "torch_light",
-            ("dungeon", "mysterious"): "ambient_glow",
-            ("space", "dark"): "artificial_lighting",
-            ("haunted", "dark"): "dim_flickering"
-        }
-
-        return lighting_map.get((env_type, atmosphere), "dynamic_lighting")
+        return _LIGHTING_MAP.get((env_type, atmosphere), "dynamic_lighting")
 
-    def _get_contextual_assets(self, env_type: str, prompt_lower: str) -> List[str]:
+    @staticmethod
+    def _get_contextual_assets(env_type: str, hits: FrozenSet[str]) -> List[str]:
         """Get assets based on environment and prompt context"""
-        base_assets = self._get_assets_for_env(env_type)
+        assets = list(PromptParser._get_assets_for_env(env_type))
 
         # Add contextual assets based on prompt
-        additional_assets = []
-
-        if "ancient" in prompt_lower:
-            additional_assets.extend(["ancient_ruins", "old_statues", "weathered_stones"])
-        if "magical" in prompt_lower:
-            additional_assets.extend(["glowing_crystals", "magic_circles", "enchanted_items"])
-        if "puzzle" in prompt_lower:
-            additional_assets.extend(["puzzle_mechanisms", "switches", "pressure_plates"])
-        if "treasure" in prompt_lower:
-            additional_assets.extend(["treasure_chests", "gold_coins", "precious_gems"])
-        if "temple" in prompt_lower:
-            additional_assets.extend(["temple_pillars", "altar", "sacred_symbols"])
-
-        return base_assets + additional_assets
-
-    def _generate_contextual_quests(self, quest_count: int, quest_types: List[str], prompt_lower: str) -> List[Dict[str, Any]]:
-        """Generate quests based on prompt analysis"""
-        quests = []
+        for keyword, extra_assets in _CONTEXT_ASSETS:
+            if keyword in hits:
+                assets += extra_assets
 
-        quest_templates = {
-            "collection": {
-                "name": "Gather Sacred Items",
-                "objective": "Collect {count} {items} from the {location}",
-                "description": "Ancient {items} are needed to {purpose}",
-                "items": ["herbs", "crystals", "artifacts", "scrolls"],
-                "locations": ["forest", "temple", "ruins", "cave"],
-                "purposes": ["save the village", "unlock the door", "restore balance", "break the curse"]
-            },
-            "combat": {
-                "name": "Defeat the Guardian",
-                "objective": "Defeat the {enemy} that guards the {location}",
-                "description": "A powerful {enemy} blocks your path to {goal}",
-                "enemies": ["guardian", "beast", "demon", "spirit"],
-                "locations": ["temple", "chamber", "grove", "sanctum"],
-                "goals": ["treasure", "exit", "artifact", "sanctuary"]
-            },
-            "rescue": {
-                "name": "Save the Villagers",
-                "objective": "Rescue {count} {people} from {danger}",
-                "description": "Innocent {people} are trapped and need your help",
-                "people": ["villagers", "travelers", "children", "elders"],
-                "dangers": ["bandits", "monsters", "curse", "prison"]
-            },
-            "puzzle": {
-                "name": "Solve Ancient Mysteries",
-                "objective": "Solve the {puzzle_type} to unlock {reward}",
-                "description": "Ancient {puzzle_type} guard the secrets of this place",
-                "puzzle_types": ["riddles", "mechanisms", "symbols", "patterns"],
-                "rewards": ["chamber", "treasure", "passage", "knowledge"]
-            },
-            "exploration": {
-                "name": "Explore the Unknown",
-                "objective": "Discover the secrets of the {location}",
-                "description": "Uncover the mysteries hidden within the {location}",
-                "locations": ["ancient ruins", "hidden chamber", "sacred grove", "lost temple"]
-            }
-        }
+        return assets
 
-        import random
+    @staticmethod
+    def _generate_contextual_quests(quest_count: int, quest_types: List[str], location: str) -> List[QuestRecord]:
+        """Generate quests based on prompt analysis"""
+        quests = []
 
         for i in range(quest_count):
             quest_type = quest_types[i % len(quest_types)]
-            template = quest_templates[quest_type]
-
-            quest = {
-                "id": f"quest_{i+1}",
-                "name": template["name"],
-                "type": "main" if i < quest_count // 2 + 1 else "side",
-                "objective": self._format_quest_objective(template, prompt_lower),
-                "description": self._format_quest_description(template, prompt_lower),
-                "requirements": [] if i == 0 else [f"complete_quest_{i}"],
-                "rewards": {
+            template = _QUEST_TEMPLATES[quest_type]
+
+            quest = QuestRecord(
+                id=f"quest_{i+1}",
+                name=template["name"],
+                type="main" if i < quest_count // 2 + 1 else "side",
+                objective=PromptParser._format_quest_objective(quest_type, location),
+                description=PromptParser._format_quest_description(quest_type, location),
+                requirements=() if i == 0 else (f"complete_quest_{i}",),
+                rewards=MappingProxyType({
                     "experience": 100 + (i * 50),
                     "gold": 50 + (i * 25),
-                    "items": [f"quest_{i+1}_reward"]
-                },
-                "location": self._extract_location_from_prompt(prompt_lower),
-                "estimated_time": f"{10 + (i * 5)} minutes"
-            }
+                    "items": (f"quest_{i+1}_reward",)
+                }),
+                location=location,
+                estimated_time=f"{10 + (i * 5)} minutes"
+            )
 
             quests.append(quest)
 
         return quests
 
-    def _create_contextual_npc(self, npc_type: str, prompt_lower: str) -> Dict[str, Any]:
+    @staticmethod
+    def _create_contextual_npc(npc_type: str, hits: FrozenSet[str], location: str) -> NPCRecord:
         """Create NPC based on type and prompt context"""
-        npc_templates = {
-            "villager": {
-                "name": "Village Elder",
-                "role": "quest_giver",
-                "type": "friendly",
-                "dialogue": ["Welcome, brave adventurer!", "Our village needs your help!", "Thank you for coming!"],
-                "behavior": "stationary_helpful",
-                "stats": {"health": 100, "attack": 0, "defense": 10}
-            },
-            "merchant": {
-                "name": "Traveling Merchant",
-                "role": "trader",
-                "type": "friendly",
-                "dialogue": ["Welcome to my shop!", "I have rare items for sale!", "Safe travels, friend!"],
-                "behavior": "stationary_trader",
-                "stats": {"health": 80, "attack": 5, "defense": 15}
-            },
-            "guard": {
-                "name": "Temple Guardian",
-                "role": "protector",
-                "type": "neutral",
-                "dialogue": ["Halt! State your business.", "This area is protected.", "You may pass."],
-                "behavior": "patrol_guard",
-                "stats": {"health": 120, "attack": 30, "defense": 25}
-            },
-            "enemy": {
-                "name": "Hostile Creature",
-                "role": "antagonist",
-                "type": "hostile",
-                "dialogue": ["*growls menacingly*", "*attacks without warning*"],
-                "behavior": "aggressive_patrol",
-                "stats": {"health": 80, "attack": 25, "defense": 15}
-            }
-        }
-
-        template = npc_templates.get(npc_type, npc_templates["villager"])
-
-        # Customize based on prompt
-        if "ghost" in prompt_lower:
-            template["name"] = "Restless Spirit"
-            template["dialogue"] = ["*whispers eerily*", "Help me find peace...", "*fades away*"]
-        elif "wizard" in prompt_lower:
-            template["name"] = "Ancient Wizard"
-            template["dialogue"] = ["Magic flows through this place...", "Seek the ancient knowledge.", "Beware the dark forces."]
-
-        npc = {
-            "id": f"{npc_type}_npc",
-            "name": template["name"],
-            "role": template["role"],
-            "type": template["type"],
-            "location": self._extract_location_from_prompt(prompt_lower),
-            "dialogue": template["dialogue"],
-            "behavior": template["behavior"],
-            "stats": template["stats"],
-            "inventory": [f"{npc_type}_item", "common_item"]
-        }
-
-        return npc
-
-    def _format_quest_objective(self, template: Dict[str, Any], prompt_lower: str) -> str:
+        template = _NPC_TEMPLATES.get(npc_type, _NPC_TEMPLATES["villager"])
+
+        # Customize based on prompt, overriding the shared template in a new mapping
+        if "ghost" in hits:
+            template = {**template, "name": "Restless Spirit",
+                        "dialogue": ("*whispers eerily*", "Help me find peace...", "*fades away*")}
+        elif "wizard" in hits:
+            template = {**template, "name": "Ancient Wizard",
+                        "dialogue": ("Magic flows through this place...", "Seek the ancient knowledge.", "Beware the dark forces.")}
+
+        return NPCRecord(
+            id=f"{npc_type}_npc",
+            name=template["name"],
+            role=template["role"],
+            type=template["type"],
+            location=location,
+            dialogue=template["dialogue"],
+            behavior=template["behavior"],
+            stats=template["stats"],
+            inventory=(f"{npc_type}_item", "common_item")
+        )
+
+    @staticmethod
+    def _format_quest_objective(quest_type: str, location: str) -> str:
         """Format quest objective based on template and prompt"""
-        objective = template["objective"]
-
-        # Replace all template variables
-        replacements = {
-            "{count}": "3",
-            "{items}": template.get("items", ["mysterious items"])[0] if "items" in template else "items",
-            "{location}": self._extract_location_from_prompt(prompt_lower),
-            "{enemy}": template.get("enemies", ["guardian"])[0] if "enemies" in template else "enemy",
-            "{people}": template.get("people", ["villagers"])[0] if "people" in template else "people",
-            "{danger}": template.get("dangers", ["unknown threat"])[0] if "dangers" in template else "danger",
-            "{puzzle_type}": template.get("puzzle_types", ["ancient puzzles"])[0] if "puzzle_types" in template else "puzzles",
-            "{reward}": template.get("rewards", ["hidden treasure"])[0] if "rewards" in template else "reward"
-        }
-
-        for placeholder, replacement in replacements.items():
-            objective = objective.replace(placeholder, replacement)
+        return _fill_placeholders(_QUEST_RENDER[quest_type][0], {"location": location})
 
-        return objective
-
-    def _format_quest_description(self, template: Dict[str, Any], prompt_lower: str) -> str:
+    @staticmethod
+    def _format_quest_description(quest_type: str, location: str) -> str:
         """Format quest description based on template and prompt"""
-        description = template["description"]
-
-        # Replace all template variables
-        replacements = {
-            "{items}": template.get("items", ["mysterious items"])[0] if "items" in template else "items",
-            "{purpose}": template.get("purposes", ["complete your mission"])[0] if "purposes" in template else "achieve your goal",
-            "{people}": template.get("people", ["villagers"])[0] if "people" in template else "people",
-            "{enemy}": template.get("enemies", ["guardian"])[0] if "enemies" in template else "enemy",
-            "{goal}": template.get("goals", ["your destination"])[0] if "goals" in template else "your goal",
-            "{puzzle_type}": template.get("puzzle_types", ["ancient puzzles"])[0] if "puzzle_types" in template else "puzzles",
-            "{location}": self._extract_location_from_prompt(prompt_lower)
-        }
-
-        for placeholder, replacement in replacements.items():
-            description = description.replace(placeholder, replacement)
-
-        return description
+        return _fill_placeholders(_QUEST_RENDER[quest_type][1], {"location": location})
 
-    def _extract_location_from_prompt(self, prompt_lower: str) -> str:
-        """Extract location information from prompt"""
-        locations = ["temple", "forest", "village", "cave", "castle", "city", "desert", "mountain", "ocean"]
-
-        for location in locations:
-            if location in prompt_lower:
+    @staticmethod
+    def _extract_location_from_prompt(hits: FrozenSet[str]) -> str:
+        """Extract location information from the prompt's keyword hits"""
+        for location in _LOCATIONS:
+            if location in hits:
                 return location
 
         return "mysterious_location"
 
-    def _generate_win_conditions(self, prompt_lower: str, quest_analysis: Dict[str, Any]) -> List[str]:
+    @staticmethod
+    def _generate_win_conditions(hits: FrozenSet[str], quest_analysis: Dict[str, Any]) -> List[str]:
         """Generate win conditions based on prompt and quests"""
         conditions = []
 
@@ -821,214 +1933,87 @@ Generate creative, detailed, and balanced content. Make it engaging and suitable
         else:
             conditions.append("Complete the main objective")
 
-        if "save" in prompt_lower or "rescue" in prompt_lower:
+        if "save" in hits or "rescue" in hits:
             conditions.append("Successfully rescue all targets")
-        if "defeat" in prompt_lower:
+        if "defeat" in hits:
             conditions.append("Defeat all hostile enemies")
-        if "find" in prompt_lower or "discover" in prompt_lower:
+        if "find" in hits or "discover" in hits:
             conditions.append("Discover the hidden secret")
 
         return conditions if conditions else ["Complete the main objective"]
 
-    def _generate_lose_conditions(self, prompt_lower: str, mechanics: Dict[str, Any]) -> List[str]:
+    @staticmethod
+    def _generate_lose_conditions(hits: FrozenSet[str], mechanics: Dict[str, Any]) -> List[str]:
         """Generate lose conditions based on prompt and mechanics"""
         conditions = ["Player health reaches 0"]
 
-        if "time" in prompt_lower or "timer" in prompt_lower:
+        if "time" in hits or "timer" in hits:
             conditions.append("Time limit expires")
         if "stealth" in mechanics["special_mechanics"]:
             conditions.append("Player is detected by enemies")
-        if "rescue" in prompt_lower:
+        if "rescue" in hits:
             conditions.append("Targets are not rescued in time")
 
         return conditions
 
-    def _generate_required_assets(self, env_analysis: Dict[str, Any], quest_analysis: Dict[str, Any], npc_analysis: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+    @staticmethod
+    def _generate_required_assets(env_analysis: Dict[str, Any], quest_analysis: Dict[str, Any], npc_analysis: List[NPCRecord]) -> Dict[str, List[str]]:
         """Generate required assets based on all analyses"""
-        models = self._get_models_for_env(env_analysis["type"])
-        textures = self._get_textures_for_env(env_analysis["type"])
-        sounds = ["ambient_background", "footsteps", "ui_sounds"]
-        effects = ["particle_dust", "light_rays"]
-        animations = ["player_walk", "player_idle"]
+        models = set(PromptParser._get_models_for_env(env_analysis["type"]))
+        sounds = set(_BASE_SOUNDS)
+        effects = set(_BASE_EFFECTS)
+        animations = set(_BASE_ANIMATIONS)
 
         # Add quest-specific assets
         for quest_type in quest_analysis["types"]:
-            if quest_type == "combat":
-                models.extend(["weapon_sword", "shield"])
-                sounds.extend(["combat_sounds", "weapon_clash"])
-                animations.extend(["attack_animation", "defend_animation"])
-            elif quest_type == "collection":
-                models.extend(["collectible_items", "item_glow"])
-                sounds.extend(["pickup_sound", "item_collected"])
-                effects.extend(["pickup_sparkle"])
-            elif quest_type == "puzzle":
-                models.extend(["puzzle_pieces", "mechanisms"])
-                sounds.extend(["puzzle_solve", "mechanism_activate"])
-                effects.extend(["puzzle_glow"])
+            m, s, e, a = _QUEST_ASSETS.get(quest_type, _EMPTY_ASSETS)
+            models |= m
+            sounds |= s
+            effects |= e
+            animations |= a
 
         # Add NPC-specific assets
+        friendly = _NPC_ASSETS["friendly"]
         for npc in npc_analysis:
-            if npc["type"] == "hostile":
-                sounds.extend(["enemy_growl", "combat_music"])
-                animations.extend(["enemy_attack", "enemy_death"])
-            else:
-                sounds.extend(["npc_talk", "friendly_music"])
-                animations.extend(["npc_idle", "npc_gesture"])
+            m, s, e, a = _NPC_ASSETS["hostile"] if npc.type == "hostile" else friendly
+            models |= m
+            sounds |= s
+            effects |= e
+            animations |= a
 
+        # Sets dedupe as they fill; sorting keeps the export stable between runs
         return {
-            "models": list(set(models)),  # Remove duplicates
-            "textures": list(set(textures)),
-            "sounds": list(set(sounds)),
-            "effects": list(set(effects)),
-            "animations": list(set(animations))
+            "models": sorted(models),
+            "textures": list(_REQUIRED_TEXTURES.get(env_analysis["type"], _DEFAULT_REQUIRED_TEXTURES)),
+            "sounds": sorted(sounds),
+            "effects": sorted(effects),
+            "animations": sorted(animations)
         }
 
-    def _get_terrain_for_env(self, env_type: str) -> List[str]:
+    @staticmethod
+    def _get_terrain_for_env(env_type: str) -> Tuple[str, ...]:
         """Get terrain types for environment"""
-        terrain_map = {
-            "forest": ["grass", "dirt_paths", "rocky_areas", "streams"],
-            "desert": ["sand_dunes", "rocky_outcrops", "oasis", "canyons"],
-            "dungeon": ["stone_floors", "corridors", "chambers", "stairs"],
-            "urban": ["streets", "buildings", "parks", "plazas"],
-            "ocean": ["water", "beaches", "coral_reefs", "islands"],
-            "mountain": ["rocky_peaks", "cliffs", "caves", "snow_caps"]
-        }
-        return terrain_map.get(env_type, ["grass", "dirt", "rocks"])
+        return _TERRAIN_MAP.get(env_type, _DEFAULT_TERRAIN)
 
-    def _get_assets_for_env(self, env_type: str) -> List[str]:
+    @staticmethod
+    def _get_assets_for_env(env_type: str) -> Tuple[str, ...]:
         """Get basic assets for environment"""
-        asset_map = {
-            "forest": ["trees", "bushes", "rocks", "flowers", "mushrooms"],
-            "desert": ["cacti", "sand_dunes", "rocks", "palm_trees", "ruins"],
-            "dungeon": ["torches", "pillars", "chests", "doors", "stairs"],
-            "urban": ["buildings", "streetlights", "benches", "fountains", "vehicles"],
-            "ocean": ["water", "coral", "seaweed", "fish", "boats"],
-            "mountain": ["rocks", "snow", "pine_trees", "caves", "peaks"]
-        }
-        return asset_map.get(env_type, ["generic_props"])
+        return _ASSET_MAP.get(env_type, _DEFAULT_ASSETS)
 
-    def _generate_basic_quests(self, env_type: str) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _generate_basic_quests(env_type: str) -> List[Dict[str, Any]]:
         """Generate basic quests for environment"""
-        quest_templates = {
-            "forest": [
-                {
-                    "id": "forest_quest_1",
-                    "name": "Gather Forest Herbs",
-                    "type": "main",
-                    "objective": "Collect 10 healing herbs from the forest",
-                    "description": "The village healer needs herbs to cure the sick",
-                    "requirements": ["access_to_forest"],
-                    "rewards": {"experience": 100, "gold": 50, "items": ["healing_potion"]},
-                    "location": "forest_clearing",
-                    "estimated_time": "10 minutes"
-                },
-                {
-                    "id": "forest_quest_2",
-                    "name": "Defeat the Forest Guardian",
-                    "type": "main",
-                    "objective": "Defeat the corrupted forest guardian",
-                    "description": "A once-peaceful guardian has been corrupted by dark magic",
-                    "requirements": ["complete_forest_quest_1"],
-                    "rewards": {"experience": 200, "gold": 100, "items": ["guardian_sword"]},
-                    "location": "ancient_grove",
-                    "estimated_time": "15 minutes"
-                }
-            ],
-            "desert": [
-                {
-                    "id": "desert_quest_1",
-                    "name": "Find the Lost Oasis",
-                    "type": "main",
-                    "objective": "Locate the hidden oasis in the desert",
-                    "description": "Travelers speak of a magical oasis that can save the dying town",
-                    "requirements": ["desert_map"],
-                    "rewards": {"experience": 150, "gold": 75, "items": ["water_crystal"]},
-                    "location": "deep_desert",
-                    "estimated_time": "12 minutes"
-                }
-            ]
-        }
-
-        return quest_templates.get(env_type, [
-            {
-                "id": "generic_quest_1",
-                "name": "Explore the Area",
-                "type": "main",
-                "objective": "Explore and discover the secrets of this place",
-                "description": "There are mysteries to uncover in this location",
-                "requirements": [],
-                "rewards": {"experience": 100, "gold": 50, "items": ["exploration_token"]},
-                "location": "starting_area",
-                "estimated_time": "10 minutes"
-            }
-        ])
+        return _thaw(_BASIC_QUESTS.get(env_type, _DEFAULT_BASIC_QUESTS))
 
-    def _generate_basic_npcs(self, env_type: str) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _generate_basic_npcs(env_type: str) -> List[Dict[str, Any]]:
         """Generate basic NPCs for environment"""
-        npc_templates = {
-            "forest": [
-                {
-                    "id": "forest_villager_1",
-                    "name": "Elder Willow",
-                    "role": "village_elder",
-                    "type": "friendly",
-                    "location": "village_center",
-                    "dialogue": ["Welcome, traveler!", "The forest is in danger!", "Please help us!"],
-                    "behavior": "stationary_helpful",
-                    "stats": {"health": 100, "attack": 0, "defense": 10},
-                    "inventory": ["village_key", "quest_scroll"]
-                },
-                {
-                    "id": "forest_enemy_1",
-                    "name": "Corrupted Wolf",
-                    "role": "forest_enemy",
-                    "type": "hostile",
-                    "location": "dark_forest",
-                    "dialogue": ["*growls menacingly*"],
-                    "behavior": "aggressive_patrol",
-                    "stats": {"health": 80, "attack": 25, "defense": 15},
-                    "inventory": ["wolf_pelt"]
-                }
-            ]
-        }
+        return _thaw(_BASIC_NPCS.get(env_type, _DEFAULT_BASIC_NPCS))
 
-        return npc_templates.get(env_type, [
-            {
-                "id": "generic_npc_1",
-                "name": "Mysterious Stranger",
-                "role": "guide",
-                "type": "neutral",
-                "location": "starting_point",
-                "dialogue": ["Greetings, adventurer!", "This place holds many secrets."],
-                "behavior": "helpful_guide",
-                "stats": {"health": 100, "attack": 10, "defense": 20},
-                "inventory": ["map", "compass"]
-            }
-        ])
-
-    def _get_models_for_env(self, env_type: str) -> List[str]:
+    @staticmethod
+    def _get_models_for_env(env_type: str) -> Tuple[str, ...]:
         """Get required 3D models for environment"""
-        model_map = {
-            "forest": ["tree_oak", "tree_pine", "bush_berry", "rock_moss", "flower_wild"],
-            "desert": ["cactus_large", "palm_tree", "sand_dune", "rock_desert", "ruins_pillar"],
-            "dungeon": ["wall_stone", "door_wooden", "torch_wall", "chest_treasure", "pillar_stone"],
-            "urban": ["building_house", "streetlight", "bench_park", "fountain", "car_generic"],
-            "ocean": ["water_plane", "coral_reef", "seaweed", "fish_tropical", "boat_small"],
-            "mountain": ["rock_cliff", "tree_pine", "snow_patch", "cave_entrance", "peak_summit"]
-        }
-        return model_map.get(env_type, ["generic_prop"])
-
-    def _get_textures_for_env(self, env_type: str) -> List[str]:
-        """Get required textures for environment"""
-        texture_map = {
-            "forest": ["bark_oak", "grass_forest", "dirt_path", "moss_rock", "leaf_texture"],
-            "desert": ["sand_fine", "rock_sandstone", "palm_bark", "cactus_skin", "ruins_stone"],
-            "dungeon": ["stone_wall", "wood_aged", "metal_rusty", "flame_torch", "gem_crystal"],
-            "urban": ["concrete_sidewalk", "brick_building", "metal_street", "glass_window", "asphalt_road"],
-            "ocean": ["water_surface", "coral_colorful", "sand_beach", "seaweed_green", "wood_boat"],
-            "mountain": ["rock_granite", "snow_fresh", "ice_crystal", "pine_bark", "cliff_face"]
-        }
-        return texture_map.get(env_type, ["generic_texture"])
+        return _MODEL_MAP.get(env_type, _DEFAULT_MODELS)
 
     def save_to_file(self, game_data: Dict[str, Any], filename: str = None, format_type: str = "json") -> str:
         """
@@ -1044,8 +2029,7 @@ Generate creative, detailed, and balanced content. Make it engaging and suitable
         """
         if filename is None:
             level_name = game_data.get("metadata", {}).get("level_name", "generated_level")
-            safe_name = "".join(c for c in level_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            safe_name = safe_name.replace(' ', '_').lower()
+            safe_name = _safe_file_stem(level_name)
             filename = f"{safe_name}.{format_type}"
 
         # Ensure output directory exists
@@ -1053,16 +2037,69 @@ Generate creative, detailed, and balanced content. Make it engaging and suitable
         os.makedirs(output_dir, exist_ok=True)
         filepath = os.path.join(output_dir, filename)
 
-        # Save file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            if format_type.lower() == "yaml":
-                yaml.dump(game_data, f, default_flow_style=False, indent=2)
-            else:
-                json.dump(game_data, f, indent=4, ensure_ascii=False)
+        # Save file, serialized in one call straight to UTF-8 bytes
+        if format_type.lower() == "yaml":
+            content = _dump_yaml(game_data).encode("utf-8")
+        else:
+            content = _json_dumps_pretty(game_data)
+
+        if _file_has_content(filepath, content):
+            logger.info(f"Game data unchanged, keeping: {filepath}")
+            return filepath
+
+        with open(filepath, 'wb') as f:
+            f.write(content)
 
         logger.info(f"Game data saved to: {filepath}")
         return filepath
 
+class _SafeNameTable(dict):
+    """
+    str.translate table that drops characters not allowed in export file
+    names (anything but alphanumerics, space, '-' and '_'). Code points are
+    classified on first sight and remembered, so the table stays small.
+    """
+
+    def __missing__(self, code_point: int) -> Optional[int]:
+        char = chr(code_point)
+        value = code_point if char.isalnum() or char in " -_" else None
+        self[code_point] = value
+        return value
+
+_SAFE_NAME_TABLE = _SafeNameTable()
+
+# Byte values to drop from ASCII names, derived from the same rule as the table
+_UNSAFE_ASCII_BYTES = bytes(b for b in range(128) if _SAFE_NAME_TABLE[b] is None)
+
+def _safe_file_stem(level_name: str) -> str:
+    """Lowercase file name stem for a level, keeping alphanumerics, '-' and '_'"""
+    if level_name.isascii():
+        # Level names are almost always ASCII; bytes.translate skips the code point lookups
+        safe = level_name.encode("ascii").translate(None, _UNSAFE_ASCII_BYTES).rstrip()
+        return safe.replace(b" ", b"_").lower().decode("ascii")
+    return level_name.translate(_SAFE_NAME_TABLE).rstrip().replace(" ", "_").lower()
+
+def _dump_yaml(data: Any) -> str:
+    """Render data as YAML, importing PyYAML (and its libyaml emitter if built) on first use"""
+    import yaml
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml.dump(data, Dumper=dumper, default_flow_style=False, indent=2)
+
+def _file_has_content(filepath: str, content: bytes) -> bool:
+    """True if filepath already holds exactly these bytes, so rewriting it can be skipped"""
+    try:
+        if os.path.getsize(filepath) != len(content):
+            return False
+        with open(filepath, 'rb') as f:
+            return f.read() == content
+    except OSError:
+        return False
+
+@functools.lru_cache(maxsize=256)
+def _analyze_prompt_pure(prompt: str) -> Mapping[str, Any]:
+    """Frozen keyword analysis of a prompt, cached on the prompt text"""
+    return _freeze(PromptParser._analyze_prompt_uncached(prompt))
+
 def create_world_from_prompt(prompt: str, model: str = "llama2", output_format: str = "json") -> str:
     """
     Convenience function to create a game world from a natural language prompt
@@ -1082,20 +2119,23 @@ def create_world_from_prompt(prompt: str, model: str = "llama2", output_format:
         game_data = parser.parse_prompt(prompt, output_format)
         filepath = parser.save_to_file(game_data, format_type=output_format)
 
-        print(f"\n✅ Successfully generated game world!")
-        print(f"📁 Saved to: {filepath}")
-        print(f"🎮 Level: {game_data['metadata']['level_name']}")
-        print(f"🗺️  Environment: {game_data['environment']['type']}")
-        print(f"📋 Quests: {len(game_data['quests'])}")
-        print(f"👥 NPCs: {len(game_data['npcs'])}")
+        # One write for the whole summary
+        print(f"\n✅ Successfully generated game world!\n"
+              f"📁 Saved to: {filepath}\n"
+              f"🎮 Level: {game_data['metadata']['level_name']}\n"
+              f"🗺️  Environment: {game_data['environment']['type']}\n"
+              f"📋 Quests: {len(game_data['quests'])}\n"
+              f"👥 NPCs: {len(game_data['npcs'])}")
 
         return filepath
 
     except Exception as e:
-        logger.error(f"Failed to generate world: {e}")
-        print(f"❌ Error: {e}")
+        logger.error("Failed to generate world: %s", e)
         return ""
 
+    finally:
+        parser.close()
+
 def batch_generate_worlds(prompts: List[str], model: str = "llama2") -> List[str]:
     """
     Generate multiple game worlds from a list of prompts
@@ -1107,27 +2147,67 @@ def batch_generate_worlds(prompts: List[str], model: str = "llama2") -> List[str
     Returns:
         List of paths to generated files
     """
-    generated_files = []
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
     config = OllamaConfig(model=model)
     parser = PromptParser(config)
 
-    for i, prompt in enumerate(prompts, 1):
-        print(f"\n🔄 Processing prompt {i}/{len(prompts)}: {prompt[:50]}...")
-
-        try:
-            game_data = parser.parse_prompt(prompt)
-            filename = f"batch_world_{i}.json"
-            filepath = parser.save_to_file(game_data, filename)
-            generated_files.append(filepath)
-            print(f"✅ Generated: {filepath}")
-
-        except Exception as e:
-            logger.error(f"Failed to generate world {i}: {e}")
-            print(f"❌ Failed: {e}")
+    # Parse each distinct prompt once; the Ollama calls block on I/O, so a
+    # thread pool keeps several of them in flight at the same time
+    unique_prompts = list(dict.fromkeys(prompts))
+    parsed: Dict[str, Any] = {}
 
+    results: List[Optional[str]] = [None] * len(prompts)
+    try:
+        if unique_prompts:
+            with ThreadPoolExecutor(max_workers=min(8, len(unique_prompts))) as executor:
+                futures = {executor.submit(parser.parse_prompt, prompt): prompt for prompt in unique_prompts}
+                for future in as_completed(futures):
+                    prompt = futures[future]
+                    try:
+                        parsed[prompt] = future.result()
+                    except Exception as e:
+                        logger.error("Failed to parse prompt %.50r: %s", prompt, e)
+
+        for i, prompt in enumerate(prompts, 1):
+            if prompt not in parsed:
+                continue
+            try:
+                filepath = parser.save_to_file(parsed[prompt], f"batch_world_{i}.json")
+                results[i - 1] = filepath
+                logger.info("Generated: %s", filepath)
+            except Exception as e:
+                logger.error("Failed to generate world %d: %s", i, e)
+    finally:
+        parser.close()
+
+    generated_files = [path for path in results if path is not None]
     print(f"\n🎉 Batch generation complete! Generated {len(generated_files)} worlds.")
     return generated_files
 
+def _new_ollama_session(pool_size: int) -> "requests.Session":
+    """Keep-alive HTTP session with one connection pool sized for Ollama calls"""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.headers.update({"Connection": "keep-alive"})
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+# Session for connection probes, shared so repeated checks reuse one socket
+_probe_session = None
+_probe_session_lock = threading.Lock()
+
+def _get_probe_session() -> "requests.Session":
+    global _probe_session
+    with _probe_session_lock:
+        if _probe_session is None:
+            _probe_session = _new_ollama_session(1)
+        return _probe_session
+
 def validate_ollama_connection(host: str = "localhost", port: int = 11434) -> bool:
     """
     Validate connection to Ollama server
@@ -1141,7 +2221,7 @@ def validate_ollama_connection(host: str = "localhost", port: int = 11434) -> bo
     """
     try:
         url = f"http://{host}:{port}/api/tags"
-        response = requests.get(url, timeout=5)
+        response = _get_probe_session().get(url, timeout=(2, 5))  # (connect, read) seconds
         response.raise_for_status()
 
         models = response.json().get("models", [])
@@ -1,201 +1,153 @@
 #!/usr/bin/env python3
+# cython: language_level=3
 """
 TTG Genesis - UE5 Code Generator
 Converts JSON game world data into UE5-compatible C++ and Blueprint formats
 """
 
+import functools
 import json
 import os
-from typing import Dict, List, Any, Optional
+import re
+import sys
+from typing import Dict, List, Any, Optional, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 import logging
 
+try:
+    import orjson  # Optional C-accelerated JSON; stdlib json is used without it
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class UE5CodeGenerator:
-    """
-    Comprehensive UE5 code generator that creates C++ headers, implementations,
-    and Blueprint-compatible JSON from TTG Genesis world data
-    """
-
-    def __init__(self, output_base_path: str = "."):
-        self.output_base_path = Path(output_base_path)
-        self.cpp_output_path = self.output_base_path / "ue5-c++"
-        self.blueprint_output_path = self.output_base_path / "ue5-exports"
-
-        # Create output directories
-        self.cpp_output_path.mkdir(parents=True, exist_ok=True)
-        self.blueprint_output_path.mkdir(parents=True, exist_ok=True)
-
-    def generate_all(self, json_data: Dict[str, Any], world_name: str = "GeneratedWorld") -> Dict[str, str]:
-        """
-        Generate all UE5 compatible files from JSON data
-
-        Args:
-            json_data: The world data from prompt parser
-            world_name: Name for the generated world/classes
-
-        Returns:
-            Dictionary of generated file paths
-        """
-        logger.info(f"Generating UE5 files for world: {world_name}")
-
-        generated_files = {}
-
-        # Generate C++ files
-        generated_files.update(self._generate_cpp_files(json_data, world_name))
-
-        # Generate Blueprint JSON files
-        generated_files.update(self._generate_blueprint_files(json_data, world_name))
-
-        # Generate additional utility files
-        generated_files.update(self._generate_utility_files(json_data, world_name))
-
-        logger.info(f"Generated {len(generated_files)} files successfully")
-        return generated_files
-
-    def _generate_cpp_files(self, json_data: Dict[str, Any], world_name: str) -> Dict[str, str]:
-        """Generate C++ header and implementation files"""
-        files = {}
-
-        # Quest System
-        quest_header, quest_cpp = self._generate_quest_system_cpp(json_data, world_name)
-        files[f"{world_name}QuestSystem.h"] = self._write_file(
-            self.cpp_output_path / f"{world_name}QuestSystem.h", quest_header
-        )
-        files[f"{world_name}QuestSystem.cpp"] = self._write_file(
-            self.cpp_output_path / f"{world_name}QuestSystem.cpp", quest_cpp
-        )
-
-        # NPC System
-        npc_header, npc_cpp = self._generate_npc_system_cpp(json_data, world_name)
-        files[f"{world_name}NPCSystem.h"] = self._write_file(
-            self.cpp_output_path / f"{world_name}NPCSystem.h", npc_header
-        )
-        files[f"{world_name}NPCSystem.cpp"] = self._write_file(
-            self.cpp_output_path / f"{world_name}NPCSystem.cpp", npc_cpp
-        )
-
-        # Environment System
-        env_header, env_cpp = self._generate_environment_system_cpp(json_data, world_name)
-        files[f"{world_name}Environment.h"] = self._write_file(
-            self.cpp_output_path / f"{world_name}Environment.h", env_header
-        )
-        files[f"{world_name}Environment.cpp"] = self._write_file(
-            self.cpp_output_path / f"{world_name}Environment.cpp", env_cpp
-        )
-
-        # Player Controller
-        controller_header, controller_cpp = self._generate_player_controller_cpp(json_data, world_name)
-        files[f"{world_name}PlayerController.h"] = self._write_file(
-            self.cpp_output_path / f"{world_name}PlayerController.h", controller_header
-        )
-        files[f"{world_name}PlayerController.cpp"] = self._write_file(
-            self.cpp_output_path / f"{world_name}PlayerController.cpp", controller_cpp
-        )
-
-        return files
-
-    def _generate_blueprint_files(self, json_data: Dict[str, Any], world_name: str) -> Dict[str, str]:
-        """Generate Blueprint-compatible JSON files"""
-        files = {}
-
-        # Quest data for Blueprints
-        quest_bp_data = self._create_blueprint_quest_data(json_data)
-        files["QuestData.json"] = self._write_json_file(
-            self.blueprint_output_path / "QuestData.json", quest_bp_data
-        )
-
-        # NPC data for Blueprints
-        npc_bp_data = self._create_blueprint_npc_data(json_data)
-        files["NPCData.json"] = self._write_json_file(
-            self.blueprint_output_path / "NPCData.json", npc_bp_data
-        )
-
-        # Environment data for Blueprints
-        env_bp_data = self._create_blueprint_environment_data(json_data)
-        files["EnvironmentData.json"] = self._write_json_file(
-            self.blueprint_output_path / "EnvironmentData.json", env_bp_data
-        )
-
-        # Asset list for content browser
-        asset_data = self._create_blueprint_asset_data(json_data)
-        files["AssetList.json"] = self._write_json_file(
-            self.blueprint_output_path / "AssetList.json", asset_data
-        )
-
-        # Complete world data (VaRest compatible)
-        varest_data = self._create_varest_compatible_data(json_data)
-        files["WorldData_VaRest.json"] = self._write_json_file(
-            self.blueprint_output_path / "WorldData_VaRest.json", varest_data
-        )
-
-        return files
-
-    def _generate_utility_files(self, json_data: Dict[str, Any], world_name: str) -> Dict[str, str]:
-        """Generate utility files for UE5 integration"""
-        files = {}
+# Pretty-printed UTF-8 JSON for the Blueprint exports. orjson only indents by
+# two spaces, so the stdlib fallback uses the same width to keep files alike.
+# OPT_NON_STR_KEYS stringifies int/float/bool/None keys the way json.dumps
+# does instead of raising. Input files are parsed straight from their bytes
+# by either backend.
+if orjson is not None:
+    _json_loads = orjson.loads
+    _JSON_PRETTY_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=_JSON_PRETTY_OPTIONS)
+else:
+    _json_loads = json.loads
+
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Raw-fd writes skip the buffered file object; O_CLOEXEC/O_BINARY exist only on some platforms
+_WRITE_FLAGS = (os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+                | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0))
+
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 16  # POSIX minimum
+if _IOV_MAX <= 0:
+    _IOV_MAX = 16
+
+# Vectored writes send the chunks in order without joining them in memory
+if hasattr(os, "writev"):
+    def _write_chunks(fd: int, chunks: Tuple[bytes, ...]) -> None:
+        views = [memoryview(chunk) for chunk in chunks if chunk]
+        i = 0
+        while i < len(views):
+            written = os.writev(fd, views[i:i + _IOV_MAX])
+            # Skip the chunks written in full and trim a partially written one
+            while written and written >= len(views[i]):
+                written -= len(views[i])
+                i += 1
+            if written:
+                views[i] = views[i][written:]
+else:
+    def _write_chunks(fd: int, chunks: Tuple[bytes, ...]) -> None:
+        for chunk in chunks:
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(fd, view):]
+
+def _write_bytes(filepath: str, data: Union[bytes, Tuple[bytes, ...]]) -> None:
+    """Write an already-encoded buffer (or chunks of one) to filepath, replacing any existing file"""
+    # No posix_fadvise(DONTNEED) afterwards: freshly written pages are still dirty,
+    # so it would only start writeback early, and the outputs are usually read next
+    fd = os.open(filepath, _WRITE_FLAGS, 0o644)
+    try:
+        if isinstance(data, bytes):
+            # Whole file in one write(2); loop only if the kernel takes less
+            written = os.write(fd, data)
+            if written < len(data):
+                _write_chunks(fd, (memoryview(data)[written:],))
+        else:
+            _write_chunks(fd, data)
+    finally:
+        os.close(fd)
 
-        # Build.cs file for C++ compilation
-        build_cs = self._generate_build_cs(world_name)
-        files[f"{world_name}.Build.cs"] = self._write_file(
-            self.cpp_output_path / f"{world_name}.Build.cs", build_cs
-        )
+# (result key, output path, payload); bytes and tuples of bytes chunks are written as-is,
+# str as UTF-8, anything else as JSON
+WriteJob = Tuple[str, str, Any]
 
-        # Module header
-        module_header = self._generate_module_header(world_name)
-        files[f"{world_name}Module.h"] = self._write_file(
-            self.cpp_output_path / f"{world_name}Module.h", module_header
-        )
+_SLOT_RE = re.compile(r"\$\{(\w+)\}")
 
-        # Module implementation
-        module_cpp = self._generate_module_cpp(world_name)
-        files[f"{world_name}Module.cpp"] = self._write_file(
-            self.cpp_output_path / f"{world_name}Module.cpp", module_cpp
-        )
+class _SourceTemplate:
+    """
+    Source text split once at import into UTF-8 literal chunks and ${name} slots.
+    substitute() encodes only the slot values and joins the chunks in a single pass.
+    """
+    __slots__ = ("_parts",)
 
-        # README for integration
-        readme = self._generate_integration_readme(json_data, world_name)
-        files["UE5_Integration_README.md"] = self._write_file(
-            self.output_base_path / "UE5_Integration_README.md", readme
-        )
+    def __init__(self, text: str) -> None:
+        # re.split with one group alternates literal text and slot names
+        parts: List[Any] = _SLOT_RE.split(text)
+        for i in range(0, len(parts), 2):
+            parts[i] = parts[i].encode('utf-8')
+        self._parts = parts
 
-        return files
+    def substitute(self, **values: Any) -> bytes:
+        return b"".join(self.substitute_chunks(**values))
 
-    def _generate_quest_system_cpp(self, json_data: Dict[str, Any], world_name: str) -> tuple[str, str]:
-        """Generate Quest System C++ header and implementation"""
-        quests = json_data.get("quests", [])
+    def substitute_chunks(self, **values: Any) -> Tuple[bytes, ...]:
+        """Filled-in chunks without the final join, for writing straight to a file"""
+        parts = self._parts.copy()
+        for i in range(1, len(parts), 2):
+            parts[i] = str(values[parts[i]]).encode('utf-8')
+        return tuple(parts)
 
-        # Header file
-        header = f'''#pragma once
+# C++ sources are compiled once at import; generation only fills in ${world}
+# (and a few data values) instead of rebuilding f-strings
+_QUEST_HEADER_TPL = _SourceTemplate('''#pragma once
 
 #include "CoreMinimal.h"
 #include "GameFramework/Actor.h"
 #include "Engine/DataTable.h"
-#include "{world_name}QuestSystem.generated.h"
+#include "${world}QuestSystem.generated.h"
 
 UENUM(BlueprintType)
 enum class EQuestType : uint8
-{{
+{
     Main UMETA(DisplayName = "Main Quest"),
     Side UMETA(DisplayName = "Side Quest"),
     Optional UMETA(DisplayName = "Optional Quest")
-}};
+};
 
 UENUM(BlueprintType)
 enum class EQuestStatus : uint8
-{{
+{
     NotStarted UMETA(DisplayName = "Not Started"),
     InProgress UMETA(DisplayName = "In Progress"),
     Completed UMETA(DisplayName = "Completed"),
     Failed UMETA(DisplayName = "Failed")
-}};
+};
 
 USTRUCT(BlueprintType)
-struct F{world_name}QuestReward : public FTableRowBase
-{{
+struct F${world}QuestReward : public FTableRowBase
+{
     GENERATED_BODY()
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Reward")
@@ -206,11 +158,11 @@ struct F{world_name}QuestReward : public FTableRowBase
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Reward")
     TArray<FString> Items;
-}};
+};
 
 USTRUCT(BlueprintType)
-struct F{world_name}Quest : public FTableRowBase
-{{
+struct F${world}Quest : public FTableRowBase
+{
     GENERATED_BODY()
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Quest")
@@ -232,7 +184,7 @@ struct F{world_name}Quest : public FTableRowBase
     TArray<FString> Requirements;
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Quest")
-    F{world_name}QuestReward Rewards;
+    F${world}QuestReward Rewards;
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Quest")
     FString Location;
@@ -242,27 +194,41 @@ struct F{world_name}Quest : public FTableRowBase
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Quest")
     EQuestStatus Status = EQuestStatus::NotStarted;
-}};
+};
 
 UCLASS(BlueprintType, Blueprintable)
-class GAMEMODULE_API A{world_name}QuestSystem : public AActor
-{{
+class GAMEMODULE_API A${world}QuestSystem : public AActor
+{
     GENERATED_BODY()
 
 public:
-    A{world_name}QuestSystem();
+    A${world}QuestSystem();
 
 protected:
     virtual void BeginPlay() override;
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Quest System")
-    TArray<F{world_name}Quest> Quests;
+    TArray<F${world}Quest> Quests;
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Quest System")
-    TArray<F{world_name}Quest> ActiveQuests;
+    TArray<F${world}Quest> ActiveQuests;
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Quest System")
-    TArray<F{world_name}Quest> CompletedQuests;
+    TArray<F${world}Quest> CompletedQuests;
+
+    // Quest ID -> index into Quests, so lookups by ID avoid scanning the array
+    UPROPERTY()
+    TMap<FString, int32> QuestIDToIndex;
+
+    // IDs of completed quests, used for requirement checks
+    UPROPERTY()
+    TSet<FString> CompletedQuestIDs;
+
+    // QuestID column parallel to ActiveQuests, so ID scans skip the full structs
+    UPROPERTY()
+    TArray<FString> ActiveQuestIDs;
+
+    void RebuildQuestIndex();
 
 public:
     UFUNCTION(BlueprintCallable, Category = "Quest System")
@@ -278,20 +244,20 @@ public:
     bool IsQuestCompleted(const FString& QuestID) const;
 
     UFUNCTION(BlueprintCallable, Category = "Quest System")
-    F{world_name}Quest GetQuest(const FString& QuestID) const;
+    F${world}Quest GetQuest(const FString& QuestID) const;
 
     UFUNCTION(BlueprintCallable, Category = "Quest System")
-    TArray<F{world_name}Quest> GetActiveQuests() const;
+    TArray<F${world}Quest> GetActiveQuests() const;
 
     UFUNCTION(BlueprintCallable, Category = "Quest System")
-    TArray<F{world_name}Quest> GetAvailableQuests() const;
+    TArray<F${world}Quest> GetAvailableQuests() const;
 
     UFUNCTION(BlueprintCallable, Category = "Quest System")
     void LoadQuestsFromJSON();
 
-    DECLARE_DYNAMIC_MULTICAST_DELEGATE_OneParam(FOnQuestStarted, const F{world_name}Quest&, Quest);
-    DECLARE_DYNAMIC_MULTICAST_DELEGATE_OneParam(FOnQuestCompleted, const F{world_name}Quest&, Quest);
-    DECLARE_DYNAMIC_MULTICAST_DELEGATE_OneParam(FOnQuestFailed, const F{world_name}Quest&, Quest);
+    DECLARE_DYNAMIC_MULTICAST_DELEGATE_OneParam(FOnQuestStarted, const F${world}Quest&, Quest);
+    DECLARE_DYNAMIC_MULTICAST_DELEGATE_OneParam(FOnQuestCompleted, const F${world}Quest&, Quest);
+    DECLARE_DYNAMIC_MULTICAST_DELEGATE_OneParam(FOnQuestFailed, const F${world}Quest&, Quest);
 
     UPROPERTY(BlueprintAssignable, Category = "Quest System")
     FOnQuestStarted OnQuestStarted;
@@ -301,281 +267,272 @@ public:
 
     UPROPERTY(BlueprintAssignable, Category = "Quest System")
     FOnQuestFailed OnQuestFailed;
-}};'''
+};''')
 
-        # Implementation file
-        implementation = f'''#include "{world_name}QuestSystem.h"
+_QUEST_CPP_TPL = _SourceTemplate('''#include "${world}QuestSystem.h"
+#include "${world}JsonUtils.h"
 #include "Engine/Engine.h"
-#include "Misc/FileHelper.h"
-#include "HAL/PlatformFilemanager.h"
+#include "Misc/Paths.h"
 #include "Dom/JsonObject.h"
-#include "Serialization/JsonSerializer.h"
-#include "Serialization/JsonReader.h"
 
-A{world_name}QuestSystem::A{world_name}QuestSystem()
-{{
+A${world}QuestSystem::A${world}QuestSystem()
+{
     PrimaryActorTick.bCanEverTick = false;
 
     // Initialize quest data from generated JSON
     LoadQuestsFromJSON();
-}}
+}
 
-void A{world_name}QuestSystem::BeginPlay()
-{{
+void A${world}QuestSystem::BeginPlay()
+{
     Super::BeginPlay();
 
-    UE_LOG(LogTemp, Warning, TEXT("{world_name} Quest System initialized with %d quests"), Quests.Num());
-}}
-
-bool A{world_name}QuestSystem::StartQuest(const FString& QuestID)
-{{
-    for (F{world_name}Quest& Quest : Quests)
-    {{
-        if (Quest.QuestID == QuestID && Quest.Status == EQuestStatus::NotStarted)
-        {{
-            // Check requirements
-            bool RequirementsMet = true;
-            for (const FString& Requirement : Quest.Requirements)
-            {{
-                if (!IsQuestCompleted(Requirement))
-                {{
-                    RequirementsMet = false;
-                    break;
-                }}
-            }}
-
-            if (RequirementsMet)
-            {{
-                Quest.Status = EQuestStatus::InProgress;
-                ActiveQuests.Add(Quest);
-                OnQuestStarted.Broadcast(Quest);
-
-                UE_LOG(LogTemp, Warning, TEXT("Started quest: %s"), *Quest.QuestName);
-                return true;
-            }}
-            else
-            {{
-                UE_LOG(LogTemp, Warning, TEXT("Quest requirements not met: %s"), *Quest.QuestName);
-                return false;
-            }}
-        }}
-    }}
-
-    UE_LOG(LogTemp, Warning, TEXT("Quest not found or already started: %s"), *QuestID);
-    return false;
-}}
-
-bool A{world_name}QuestSystem::CompleteQuest(const FString& QuestID)
-{{
-    for (int32 i = 0; i < ActiveQuests.Num(); i++)
-    {{
-        if (ActiveQuests[i].QuestID == QuestID)
-        {{
-            F{world_name}Quest CompletedQuest = ActiveQuests[i];
-            CompletedQuest.Status = EQuestStatus::Completed;
-
-            // Update main quest array
-            for (F{world_name}Quest& Quest : Quests)
-            {{
-                if (Quest.QuestID == QuestID)
-                {{
-                    Quest.Status = EQuestStatus::Completed;
-                    break;
-                }}
-            }}
+    // Quest arrays may have been edited after construction
+    RebuildQuestIndex();
 
-            CompletedQuests.Add(CompletedQuest);
-            ActiveQuests.RemoveAt(i);
-            OnQuestCompleted.Broadcast(CompletedQuest);
+    UE_LOG(LogTemp, Warning, TEXT("${world} Quest System initialized with %d quests"), Quests.Num());
+}
 
-            UE_LOG(LogTemp, Warning, TEXT("Completed quest: %s"), *CompletedQuest.QuestName);
-            return true;
-        }}
-    }}
+void A${world}QuestSystem::RebuildQuestIndex()
+{
+    QuestIDToIndex.Reset();
+    for (int32 i = 0; i < Quests.Num(); i++)
+    {
+        if (!QuestIDToIndex.Contains(Quests[i].QuestID))
+        {
+            QuestIDToIndex.Add(Quests[i].QuestID, i);
+        }
+    }
+
+    CompletedQuestIDs.Reset();
+    for (const F${world}Quest& Quest : CompletedQuests)
+    {
+        CompletedQuestIDs.Add(Quest.QuestID);
+    }
+
+    ActiveQuestIDs.Reset(ActiveQuests.Num());
+    for (const F${world}Quest& Quest : ActiveQuests)
+    {
+        ActiveQuestIDs.Add(Quest.QuestID);
+    }
+}
+
+bool A${world}QuestSystem::StartQuest(const FString& QuestID)
+{
+    const int32* Index = QuestIDToIndex.Find(QuestID);
+    if (Index && Quests[*Index].Status == EQuestStatus::NotStarted)
+    {
+        F${world}Quest& Quest = Quests[*Index];
+
+        // Check requirements
+        bool RequirementsMet = true;
+        for (const FString& Requirement : Quest.Requirements)
+        {
+            if (!IsQuestCompleted(Requirement))
+            {
+                RequirementsMet = false;
+                break;
+            }
+        }
 
-    UE_LOG(LogTemp, Warning, TEXT("Active quest not found: %s"), *QuestID);
-    return false;
-}}
+        if (RequirementsMet)
+        {
+            Quest.Status = EQuestStatus::InProgress;
+            ActiveQuests.Add(Quest);
+            ActiveQuestIDs.Add(Quest.QuestID);
+            OnQuestStarted.Broadcast(Quest);
 
-bool A{world_name}QuestSystem::IsQuestActive(const FString& QuestID) const
-{{
-    for (const F{world_name}Quest& Quest : ActiveQuests)
-    {{
-        if (Quest.QuestID == QuestID)
-        {{
+            UE_LOG(LogTemp, Warning, TEXT("Started quest: %s"), *Quest.QuestName);
             return true;
-        }}
-    }}
-    return false;
-}}
+        }
+        else
+        {
+            UE_LOG(LogTemp, Warning, TEXT("Quest requirements not met: %s"), *Quest.QuestName);
+            return false;
+        }
+    }
 
-bool A{world_name}QuestSystem::IsQuestCompleted(const FString& QuestID) const
-{{
-    for (const F{world_name}Quest& Quest : CompletedQuests)
-    {{
-        if (Quest.QuestID == QuestID)
-        {{
-            return true;
-        }}
-    }}
+    UE_LOG(LogTemp, Warning, TEXT("Quest not found or already started: %s"), *QuestID);
     return false;
-}}
-
-F{world_name}Quest A{world_name}QuestSystem::GetQuest(const FString& QuestID) const
-{{
-    for (const F{world_name}Quest& Quest : Quests)
-    {{
-        if (Quest.QuestID == QuestID)
-        {{
-            return Quest;
-        }}
-    }}
-    return F{world_name}Quest();
-}}
-
-TArray<F{world_name}Quest> A{world_name}QuestSystem::GetActiveQuests() const
-{{
+}
+
+bool A${world}QuestSystem::CompleteQuest(const FString& QuestID)
+{
+    const int32 i = ActiveQuestIDs.IndexOfByKey(QuestID);
+    if (i == INDEX_NONE)
+    {
+        UE_LOG(LogTemp, Warning, TEXT("Active quest not found: %s"), *QuestID);
+        return false;
+    }
+
+    // Move the entry out and swap the last one into its slot; active order is not kept
+    F${world}Quest CompletedQuest = MoveTemp(ActiveQuests[i]);
+    ActiveQuests.RemoveAtSwap(i);
+    ActiveQuestIDs.RemoveAtSwap(i);
+    CompletedQuest.Status = EQuestStatus::Completed;
+
+    // Update main quest array
+    if (const int32* Index = QuestIDToIndex.Find(QuestID))
+    {
+        Quests[*Index].Status = EQuestStatus::Completed;
+    }
+
+    CompletedQuests.Add(CompletedQuest);
+    CompletedQuestIDs.Add(QuestID);
+    OnQuestCompleted.Broadcast(CompletedQuest);
+
+    UE_LOG(LogTemp, Warning, TEXT("Completed quest: %s"), *CompletedQuest.QuestName);
+    return true;
+}
+
+bool A${world}QuestSystem::IsQuestActive(const FString& QuestID) const
+{
+    return ActiveQuestIDs.Contains(QuestID);
+}
+
+bool A${world}QuestSystem::IsQuestCompleted(const FString& QuestID) const
+{
+    return CompletedQuestIDs.Contains(QuestID);
+}
+
+F${world}Quest A${world}QuestSystem::GetQuest(const FString& QuestID) const
+{
+    if (const int32* Index = QuestIDToIndex.Find(QuestID))
+    {
+        return Quests[*Index];
+    }
+    return F${world}Quest();
+}
+
+TArray<F${world}Quest> A${world}QuestSystem::GetActiveQuests() const
+{
     return ActiveQuests;
-}}
+}
 
-TArray<F{world_name}Quest> A{world_name}QuestSystem::GetAvailableQuests() const
-{{
-    TArray<F{world_name}Quest> AvailableQuests;
+TArray<F${world}Quest> A${world}QuestSystem::GetAvailableQuests() const
+{
+    TArray<F${world}Quest> AvailableQuests;
 
-    for (const F{world_name}Quest& Quest : Quests)
-    {{
+    for (const F${world}Quest& Quest : Quests)
+    {
         if (Quest.Status == EQuestStatus::NotStarted)
-        {{
+        {
             // Check if requirements are met
             bool RequirementsMet = true;
             for (const FString& Requirement : Quest.Requirements)
-            {{
+            {
                 if (!IsQuestCompleted(Requirement))
-                {{
+                {
                     RequirementsMet = false;
                     break;
-                }}
-            }}
+                }
+            }
 
             if (RequirementsMet)
-            {{
+            {
                 AvailableQuests.Add(Quest);
-            }}
-        }}
-    }}
+            }
+        }
+    }
 
     return AvailableQuests;
-}}
+}
 
-void A{world_name}QuestSystem::LoadQuestsFromJSON()
-{{
+void A${world}QuestSystem::LoadQuestsFromJSON()
+{
     // Load quest data from generated JSON file
-    FString FilePath = FPaths::ProjectContentDir() + TEXT("Data/QuestData.json");
-    FString JsonString;
+    TArray<TSharedPtr<FJsonValue>> QuestArray;
+    if (!F${world}JsonUtils::LoadArray(TEXT("Data/QuestData.json"), TEXT("quests"), QuestArray))
+    {
+        UE_LOG(LogTemp, Error, TEXT("Failed to load quest data from: %s"), *(FPaths::ProjectContentDir() + TEXT("Data/QuestData.json")));
+        return;
+    }
+
+    Quests.Reserve(Quests.Num() + QuestArray.Num());
+    for (const TSharedPtr<FJsonValue>& QuestValue : QuestArray)
+    {
+        const TSharedPtr<FJsonObject>& QuestObj = QuestValue->AsObject();
+
+        F${world}Quest NewQuest;
+        NewQuest.QuestID = QuestObj->GetStringField(TEXT("id"));
+        NewQuest.QuestName = QuestObj->GetStringField(TEXT("name"));
+        NewQuest.Objective = QuestObj->GetStringField(TEXT("objective"));
+        NewQuest.Description = QuestObj->GetStringField(TEXT("description"));
+        NewQuest.Location = QuestObj->GetStringField(TEXT("location"));
+        NewQuest.EstimatedTime = QuestObj->GetStringField(TEXT("estimated_time"));
+
+        // Parse quest type
+        FString TypeString = QuestObj->GetStringField(TEXT("type"));
+        if (TypeString == TEXT("main"))
+            NewQuest.QuestType = EQuestType::Main;
+        else if (TypeString == TEXT("side"))
+            NewQuest.QuestType = EQuestType::Side;
+        else
+            NewQuest.QuestType = EQuestType::Optional;
+
+        // Parse requirements
+        const TArray<TSharedPtr<FJsonValue>>* RequirementsArray;
+        if (QuestObj->TryGetArrayField(TEXT("requirements"), RequirementsArray))
+        {
+            NewQuest.Requirements.Reserve(RequirementsArray->Num());
+            for (const TSharedPtr<FJsonValue>& ReqValue : *RequirementsArray)
+            {
+                NewQuest.Requirements.Add(ReqValue->AsString());
+            }
+        }
 
-    if (FFileHelper::LoadFileToString(JsonString, *FilePath))
-    {{
-        TSharedPtr<FJsonObject> JsonObject;
-        TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(JsonString);
-
-        if (FJsonSerializer::Deserialize(Reader, JsonObject))
-        {{
-            const TArray<TSharedPtr<FJsonValue>>* QuestArray;
-            if (JsonObject->TryGetArrayField(TEXT("quests"), QuestArray))
-            {{
-                for (const TSharedPtr<FJsonValue>& QuestValue : *QuestArray)
-                {{
-                    const TSharedPtr<FJsonObject>& QuestObj = QuestValue->AsObject();
-
-                    F{world_name}Quest NewQuest;
-                    NewQuest.QuestID = QuestObj->GetStringField(TEXT("id"));
-                    NewQuest.QuestName = QuestObj->GetStringField(TEXT("name"));
-                    NewQuest.Objective = QuestObj->GetStringField(TEXT("objective"));
-                    NewQuest.Description = QuestObj->GetStringField(TEXT("description"));
-                    NewQuest.Location = QuestObj->GetStringField(TEXT("location"));
-                    NewQuest.EstimatedTime = QuestObj->GetStringField(TEXT("estimated_time"));
-
-                    // Parse quest type
-                    FString TypeString = QuestObj->GetStringField(TEXT("type"));
-                    if (TypeString == TEXT("main"))
-                        NewQuest.QuestType = EQuestType::Main;
-                    else if (TypeString == TEXT("side"))
-                        NewQuest.QuestType = EQuestType::Side;
-                    else
-                        NewQuest.QuestType = EQuestType::Optional;
-
-                    // Parse requirements
-                    const TArray<TSharedPtr<FJsonValue>>* RequirementsArray;
-                    if (QuestObj->TryGetArrayField(TEXT("requirements"), RequirementsArray))
-                    {{
-                        for (const TSharedPtr<FJsonValue>& ReqValue : *RequirementsArray)
-                        {{
-                            NewQuest.Requirements.Add(ReqValue->AsString());
-                        }}
-                    }}
-
-                    // Parse rewards
-                    const TSharedPtr<FJsonObject>* RewardsObj;
-                    if (QuestObj->TryGetObjectField(TEXT("rewards"), RewardsObj))
-                    {{
-                        NewQuest.Rewards.Experience = (*RewardsObj)->GetIntegerField(TEXT("experience"));
-                        NewQuest.Rewards.Gold = (*RewardsObj)->GetIntegerField(TEXT("gold"));
-
-                        const TArray<TSharedPtr<FJsonValue>>* ItemsArray;
-                        if ((*RewardsObj)->TryGetArrayField(TEXT("items"), ItemsArray))
-                        {{
-                            for (const TSharedPtr<FJsonValue>& ItemValue : *ItemsArray)
-                            {{
-                                NewQuest.Rewards.Items.Add(ItemValue->AsString());
-                            }}
-                        }}
-                    }}
-
-                    Quests.Add(NewQuest);
-                }}
-            }}
-        }}
-    }}
-    else
-    {{
-        UE_LOG(LogTemp, Error, TEXT("Failed to load quest data from: %s"), *FilePath);
-    }}
-}}'''
+        // Parse rewards
+        const TSharedPtr<FJsonObject>* RewardsObj;
+        if (QuestObj->TryGetObjectField(TEXT("rewards"), RewardsObj))
+        {
+            NewQuest.Rewards.Experience = (*RewardsObj)->GetIntegerField(TEXT("experience"));
+            NewQuest.Rewards.Gold = (*RewardsObj)->GetIntegerField(TEXT("gold"));
+
+            const TArray<TSharedPtr<FJsonValue>>* ItemsArray;
+            if ((*RewardsObj)->TryGetArrayField(TEXT("items"), ItemsArray))
+            {
+                NewQuest.Rewards.Items.Reserve(ItemsArray->Num());
+                for (const TSharedPtr<FJsonValue>& ItemValue : *ItemsArray)
+                {
+                    NewQuest.Rewards.Items.Add(ItemValue->AsString());
+                }
+            }
+        }
 
-        return header, implementation
+        Quests.Add(MoveTemp(NewQuest));
+    }
 
-    def _generate_npc_system_cpp(self, json_data: Dict[str, Any], world_name: str) -> tuple[str, str]:
-        """Generate NPC System C++ header and implementation"""
+    RebuildQuestIndex();
+}''')
 
-        # Header file
-        header = f'''#pragma once
+_NPC_HEADER_TPL = _SourceTemplate('''#pragma once
 
 #include "CoreMinimal.h"
 #include "GameFramework/Character.h"
 #include "Components/StaticMeshComponent.h"
 #include "Components/SphereComponent.h"
-#include "{world_name}NPCSystem.generated.h"
+#include "${world}NPCSystem.generated.h"
 
 UENUM(BlueprintType)
 enum class ENPCType : uint8
-{{
+{
     Friendly UMETA(DisplayName = "Friendly"),
     Neutral UMETA(DisplayName = "Neutral"),
     Hostile UMETA(DisplayName = "Hostile")
-}};
+};
 
 UENUM(BlueprintType)
 enum class ENPCBehavior : uint8
-{{
+{
     Stationary UMETA(DisplayName = "Stationary"),
     Patrol UMETA(DisplayName = "Patrol"),
     Follow UMETA(DisplayName = "Follow"),
     Aggressive UMETA(DisplayName = "Aggressive")
-}};
+};
 
 USTRUCT(BlueprintType)
-struct F{world_name}NPCStats
-{{
+struct F${world}NPCStats
+{
     GENERATED_BODY()
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Stats")
@@ -589,11 +546,11 @@ struct F{world_name}NPCStats
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Stats")
     float MovementSpeed = 300.0f;
-}};
+};
 
 USTRUCT(BlueprintType)
-struct F{world_name}NPCData
-{{
+struct F${world}NPCData
+{
     GENERATED_BODY()
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "NPC")
@@ -618,25 +575,25 @@ struct F{world_name}NPCData
     ENPCBehavior Behavior = ENPCBehavior::Stationary;
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "NPC")
-    F{world_name}NPCStats Stats;
+    F${world}NPCStats Stats;
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "NPC")
     TArray<FString> Inventory;
-}};
+};
 
 UCLASS(BlueprintType, Blueprintable)
-class GAMEMODULE_API A{world_name}NPC : public ACharacter
-{{
+class GAMEMODULE_API A${world}NPC : public ACharacter
+{
     GENERATED_BODY()
 
 public:
-    A{world_name}NPC();
+    A${world}NPC();
 
 protected:
     virtual void BeginPlay() override;
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "NPC Data")
-    F{world_name}NPCData NPCData;
+    F${world}NPCData NPCData;
 
     UPROPERTY(VisibleAnywhere, BlueprintReadOnly, Category = "Components")
     class USphereComponent* InteractionSphere;
@@ -651,7 +608,9 @@ public:
     virtual void Tick(float DeltaTime) override;
 
     UFUNCTION(BlueprintCallable, Category = "NPC")
-    void InitializeFromData(const F{world_name}NPCData& Data);
+    void InitializeFromData(const F${world}NPCData& Data);
+
+    const F${world}NPCData& GetNPCData() const { return NPCData; }
 
     UFUNCTION(BlueprintCallable, Category = "NPC")
     FString GetCurrentDialogue();
@@ -691,57 +650,77 @@ private:
     void UpdateBehavior();
     void HandlePatrolBehavior();
     void HandleAggressiveBehavior();
-}};
+};
 
 UCLASS(BlueprintType, Blueprintable)
-class GAMEMODULE_API A{world_name}NPCManager : public AActor
-{{
+class GAMEMODULE_API A${world}NPCManager : public AActor
+{
     GENERATED_BODY()
 
 public:
-    A{world_name}NPCManager();
+    A${world}NPCManager();
 
 protected:
     virtual void BeginPlay() override;
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "NPC Manager")
-    TArray<F{world_name}NPCData> NPCDatabase;
+    TArray<F${world}NPCData> NPCDatabase;
+
+    // NPCID column parallel to NPCDatabase, so ID scans skip the full structs
+    UPROPERTY()
+    TArray<FString> NPCIDs;
+
+    // NPC ID -> index into NPCDatabase (first entry wins), used by SpawnNPC
+    UPROPERTY()
+    TMap<FString, int32> NPCIDToIndex;
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "NPC Manager")
-    TSubclassOf<A{world_name}NPC> NPCClass;
+    TSubclassOf<A${world}NPC> NPCClass;
 
     UPROPERTY(BlueprintReadOnly, Category = "NPC Manager")
-    TArray<A{world_name}NPC*> SpawnedNPCs;
+    TArray<A${world}NPC*> SpawnedNPCs;
+
+    // Spawned NPCs by ID (first spawn wins) and by type, filled in SpawnNPC
+    UPROPERTY()
+    TMap<FString, A${world}NPC*> NPCByID;
+
+    TMap<ENPCType, TArray<TWeakObjectPtr<A${world}NPC>>> NPCsByType;
 
 public:
     UFUNCTION(BlueprintCallable, Category = "NPC Manager")
     void LoadNPCsFromJSON();
 
     UFUNCTION(BlueprintCallable, Category = "NPC Manager")
-    A{world_name}NPC* SpawnNPC(const FString& NPCID, const FVector& Location, const FRotator& Rotation);
+    A${world}NPC* SpawnNPC(const FString& NPCID, const FVector& Location, const FRotator& Rotation);
 
     UFUNCTION(BlueprintCallable, Category = "NPC Manager")
-    A{world_name}NPC* FindNPCByID(const FString& NPCID);
+    A${world}NPC* FindNPCByID(const FString& NPCID);
 
     UFUNCTION(BlueprintCallable, Category = "NPC Manager")
-    TArray<A{world_name}NPC*> GetNPCsByType(ENPCType NPCType);
+    TArray<A${world}NPC*> GetNPCsByType(ENPCType NPCType);
 
     UFUNCTION(BlueprintCallable, Category = "NPC Manager")
     void SpawnAllNPCs();
-}};'''
 
-        # Implementation file
-        implementation = f'''#include "{world_name}NPCSystem.h"
+    UFUNCTION(BlueprintCallable, Category = "NPC Manager")
+    void RemoveSpawnedNPC(A${world}NPC* NPC);
+
+protected:
+    void RebuildNPCColumns();
+
+    UFUNCTION()
+    void HandleNPCDestroyed(AActor* DestroyedActor);
+};''')
+
+_NPC_CPP_TPL = _SourceTemplate('''#include "${world}NPCSystem.h"
 #include "Engine/Engine.h"
 #include "Components/SphereComponent.h"
 #include "GameFramework/CharacterMovementComponent.h"
-#include "Misc/FileHelper.h"
+#include "${world}JsonUtils.h"
 #include "Dom/JsonObject.h"
-#include "Serialization/JsonSerializer.h"
-#include "Serialization/JsonReader.h"
 
-A{world_name}NPC::A{world_name}NPC()
-{{
+A${world}NPC::A${world}NPC()
+{
     PrimaryActorTick.bCanEverTick = true;
 
     // Create interaction sphere
@@ -753,110 +732,110 @@ A{world_name}NPC::A{world_name}NPC()
     InteractionSphere->SetCollisionResponseToChannel(ECC_Pawn, ECR_Overlap);
 
     // Bind overlap events
-    InteractionSphere->OnComponentBeginOverlap.AddDynamic(this, &A{world_name}NPC::OnInteractionSphereBeginOverlap);
-    InteractionSphere->OnComponentEndOverlap.AddDynamic(this, &A{world_name}NPC::OnInteractionSphereEndOverlap);
-}}
+    InteractionSphere->OnComponentBeginOverlap.AddDynamic(this, &A${world}NPC::OnInteractionSphereBeginOverlap);
+    InteractionSphere->OnComponentEndOverlap.AddDynamic(this, &A${world}NPC::OnInteractionSphereEndOverlap);
+}
 
-void A{world_name}NPC::BeginPlay()
-{{
+void A${world}NPC::BeginPlay()
+{
     Super::BeginPlay();
 
     // Apply stats to character
     if (GetCharacterMovement())
-    {{
+    {
         GetCharacterMovement()->MaxWalkSpeed = NPCData.Stats.MovementSpeed;
-    }}
-}}
+    }
+}
 
-void A{world_name}NPC::Tick(float DeltaTime)
-{{
+void A${world}NPC::Tick(float DeltaTime)
+{
     Super::Tick(DeltaTime);
 
     UpdateBehavior();
-}}
+}
 
-void A{world_name}NPC::InitializeFromData(const F{world_name}NPCData& Data)
-{{
+void A${world}NPC::InitializeFromData(const F${world}NPCData& Data)
+{
     NPCData = Data;
 
     // Apply movement speed
     if (GetCharacterMovement())
-    {{
+    {
         GetCharacterMovement()->MaxWalkSpeed = NPCData.Stats.MovementSpeed;
-    }}
+    }
 
     UE_LOG(LogTemp, Warning, TEXT("Initialized NPC: %s"), *NPCData.NPCName);
-}}
+}
 
-FString A{world_name}NPC::GetCurrentDialogue()
-{{
+FString A${world}NPC::GetCurrentDialogue()
+{
     if (NPCData.Dialogue.IsValidIndex(CurrentDialogueIndex))
-    {{
+    {
         return NPCData.Dialogue[CurrentDialogueIndex];
-    }}
+    }
     return TEXT("...");
-}}
+}
 
-FString A{world_name}NPC::GetNextDialogue()
-{{
+FString A${world}NPC::GetNextDialogue()
+{
     if (HasMoreDialogue())
-    {{
+    {
         CurrentDialogueIndex++;
         FString NewDialogue = GetCurrentDialogue();
         OnDialogueChanged(NewDialogue);
         return NewDialogue;
-    }}
+    }
     return GetCurrentDialogue();
-}}
+}
 
-bool A{world_name}NPC::HasMoreDialogue() const
-{{
+bool A${world}NPC::HasMoreDialogue() const
+{
     return CurrentDialogueIndex < NPCData.Dialogue.Num() - 1;
-}}
+}
 
-void A{world_name}NPC::ResetDialogue()
-{{
+void A${world}NPC::ResetDialogue()
+{
     CurrentDialogueIndex = 0;
-}}
+}
 
-void A{world_name}NPC::StartInteraction(AActor* InteractingActor)
-{{
+void A${world}NPC::StartInteraction(AActor* InteractingActor)
+{
     if (bCanInteract)
-    {{
+    {
         OnInteractionStarted(InteractingActor);
         UE_LOG(LogTemp, Warning, TEXT("Started interaction with %s"), *NPCData.NPCName);
-    }}
-}}
+    }
+}
 
-void A{world_name}NPC::EndInteraction()
-{{
+void A${world}NPC::EndInteraction()
+{
     OnInteractionEnded();
     ResetDialogue();
-}}
+}
 
-void A{world_name}NPC::OnInteractionSphereBeginOverlap(UPrimitiveComponent* OverlappedComponent, AActor* OtherActor, UPrimitiveComponent* OtherComp, int32 OtherBodyIndex, bool bFromSweep, const FHitResult& SweepResult)
-{{
+void A${world}NPC::OnInteractionSphereBeginOverlap(UPrimitiveComponent* OverlappedComponent, AActor* OtherActor, UPrimitiveComponent* OtherComp, int32 OtherBodyIndex, bool bFromSweep, const FHitResult& SweepResult)
+{
     // Handle player entering interaction range
     if (OtherActor && OtherActor->IsA<APawn>())
-    {{
+    {
         UE_LOG(LogTemp, Warning, TEXT("Player entered interaction range of %s"), *NPCData.NPCName);
-    }}
-}}
+    }
+}
 
-void A{world_name}NPC::OnInteractionSphereEndOverlap(UPrimitiveComponent* OverlappedComponent, AActor* OtherActor, UPrimitiveComponent* OtherComp, int32 OtherBodyIndex)
-{{
+void A${world}NPC::OnInteractionSphereEndOverlap(UPrimitiveComponent* OverlappedComponent, AActor* OtherActor, UPrimitiveComponent* OtherComp, int32 OtherBodyIndex)
+{
     // Handle player leaving interaction range
     if (OtherActor && OtherActor->IsA<APawn>())
-    {{
+    {
         EndInteraction();
         UE_LOG(LogTemp, Warning, TEXT("Player left interaction range of %s"), *NPCData.NPCName);
-    }}
-}}
+    }
+}
 
-void A{world_name}NPC::UpdateBehavior()
-{{
+void A${world}NPC::UpdateBehavior()
+{
     switch (NPCData.Behavior)
-    {{
+    {
         case ENPCBehavior::Patrol:
             HandlePatrolBehavior();
             break;
@@ -868,227 +847,327 @@ void A{world_name}NPC::UpdateBehavior()
         default:
             // Handled in Blueprint or other systems
             break;
-    }}
-}}
+    }
+}
 
-void A{world_name}NPC::HandlePatrolBehavior()
-{{
+void A${world}NPC::HandlePatrolBehavior()
+{
     // Basic patrol logic - can be expanded in Blueprint
-}}
+}
 
-void A{world_name}NPC::HandleAggressiveBehavior()
-{{
+void A${world}NPC::HandleAggressiveBehavior()
+{
     // Basic aggressive behavior - can be expanded in Blueprint
-}}
+}
 
 // NPC Manager Implementation
-A{world_name}NPCManager::A{world_name}NPCManager()
-{{
+A${world}NPCManager::A${world}NPCManager()
+{
     PrimaryActorTick.bCanEverTick = false;
-}}
+}
 
-void A{world_name}NPCManager::BeginPlay()
-{{
+void A${world}NPCManager::BeginPlay()
+{
     Super::BeginPlay();
 
+    // NPCDatabase may have been filled in the editor
+    RebuildNPCColumns();
     LoadNPCsFromJSON();
     SpawnAllNPCs();
-}}
+}
 
-void A{world_name}NPCManager::LoadNPCsFromJSON()
-{{
-    FString FilePath = FPaths::ProjectContentDir() + TEXT("Data/NPCData.json");
-    FString JsonString;
+void A${world}NPCManager::RebuildNPCColumns()
+{
+    NPCIDs.Reset(NPCDatabase.Num());
+    NPCIDToIndex.Reset();
+    for (int32 i = 0; i < NPCDatabase.Num(); i++)
+    {
+        NPCIDs.Add(NPCDatabase[i].NPCID);
+        if (!NPCIDToIndex.Contains(NPCDatabase[i].NPCID))
+        {
+            NPCIDToIndex.Add(NPCDatabase[i].NPCID, i);
+        }
+    }
+}
+
+void A${world}NPCManager::LoadNPCsFromJSON()
+{
+    // Built on first use; FString keys compare and hash case-insensitively, as == does
+    static const TMap<FString, ENPCType> NPCTypesByName = {
+        { TEXT("friendly"), ENPCType::Friendly },
+        { TEXT("hostile"), ENPCType::Hostile }
+    };
+    static const TPair<FString, ENPCBehavior> BehaviorKeywords[] = {
+        { TEXT("patrol"), ENPCBehavior::Patrol },
+        { TEXT("aggressive"), ENPCBehavior::Aggressive }
+    };
+
+    TArray<TSharedPtr<FJsonValue>> NPCArray;
+    if (!F${world}JsonUtils::LoadArray(TEXT("Data/NPCData.json"), TEXT("npcs"), NPCArray))
+    {
+        return;
+    }
+
+    NPCDatabase.Reserve(NPCDatabase.Num() + NPCArray.Num());
+    NPCIDs.Reserve(NPCIDs.Num() + NPCArray.Num());
+    for (const TSharedPtr<FJsonValue>& NPCValue : NPCArray)
+    {
+        const TSharedPtr<FJsonObject>& NPCObj = NPCValue->AsObject();
+
+        F${world}NPCData NewNPC;
+        NewNPC.NPCID = NPCObj->GetStringField(TEXT("id"));
+        NewNPC.NPCName = NPCObj->GetStringField(TEXT("name"));
+        NewNPC.Role = NPCObj->GetStringField(TEXT("role"));
+        NewNPC.Location = NPCObj->GetStringField(TEXT("location"));
+
+        // Parse NPC type
+        const ENPCType* Type = NPCTypesByName.Find(NPCObj->GetStringField(TEXT("type")));
+        NewNPC.NPCType = Type ? *Type : ENPCType::Neutral;
+
+        // Parse behavior: first keyword contained in the description wins
+        const FString BehaviorString = NPCObj->GetStringField(TEXT("behavior"));
+        NewNPC.Behavior = ENPCBehavior::Stationary;
+        for (const TPair<FString, ENPCBehavior>& Keyword : BehaviorKeywords)
+        {
+            if (BehaviorString.Contains(Keyword.Key))
+            {
+                NewNPC.Behavior = Keyword.Value;
+                break;
+            }
+        }
 
-    if (FFileHelper::LoadFileToString(JsonString, *FilePath))
-    {{
-        TSharedPtr<FJsonObject> JsonObject;
-        TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(JsonString);
-
-        if (FJsonSerializer::Deserialize(Reader, JsonObject))
-        {{
-            const TArray<TSharedPtr<FJsonValue>>* NPCArray;
-            if (JsonObject->TryGetArrayField(TEXT("npcs"), NPCArray))
-            {{
-                for (const TSharedPtr<FJsonValue>& NPCValue : *NPCArray)
-                {{
-                    const TSharedPtr<FJsonObject>& NPCObj = NPCValue->AsObject();
-
-                    F{world_name}NPCData NewNPC;
-                    NewNPC.NPCID = NPCObj->GetStringField(TEXT("id"));
-                    NewNPC.NPCName = NPCObj->GetStringField(TEXT("name"));
-                    NewNPC.Role = NPCObj->GetStringField(TEXT("role"));
-                    NewNPC.Location = NPCObj->GetStringField(TEXT("location"));
-
-                    // Parse NPC type
-                    FString TypeString = NPCObj->GetStringField(TEXT("type"));
-                    if (TypeString == TEXT("friendly"))
-                        NewNPC.NPCType = ENPCType::Friendly;
-                    else if (TypeString == TEXT("hostile"))
-                        NewNPC.NPCType = ENPCType::Hostile;
-                    else
-                        NewNPC.NPCType = ENPCType::Neutral;
-
-                    // Parse behavior
-                    FString BehaviorString = NPCObj->GetStringField(TEXT("behavior"));
-                    if (BehaviorString.Contains(TEXT("patrol")))
-                        NewNPC.Behavior = ENPCBehavior::Patrol;
-                    else if (BehaviorString.Contains(TEXT("aggressive")))
-                        NewNPC.Behavior = ENPCBehavior::Aggressive;
-                    else
-                        NewNPC.Behavior = ENPCBehavior::Stationary;
-
-                    // Parse dialogue
-                    const TArray<TSharedPtr<FJsonValue>>* DialogueArray;
-                    if (NPCObj->TryGetArrayField(TEXT("dialogue"), DialogueArray))
-                    {{
-                        for (const TSharedPtr<FJsonValue>& DialogueValue : *DialogueArray)
-                        {{
-                            NewNPC.Dialogue.Add(DialogueValue->AsString());
-                        }}
-                    }}
-
-                    // Parse stats
-                    const TSharedPtr<FJsonObject>* StatsObj;
-                    if (NPCObj->TryGetObjectField(TEXT("stats"), StatsObj))
-                    {{
-                        NewNPC.Stats.Health = (*StatsObj)->GetIntegerField(TEXT("health"));
-                        NewNPC.Stats.Attack = (*StatsObj)->GetIntegerField(TEXT("attack"));
-                        NewNPC.Stats.Defense = (*StatsObj)->GetIntegerField(TEXT("defense"));
-                    }}
-
-                    // Parse inventory
-                    const TArray<TSharedPtr<FJsonValue>>* InventoryArray;
-                    if (NPCObj->TryGetArrayField(TEXT("inventory"), InventoryArray))
-                    {{
-                        for (const TSharedPtr<FJsonValue>& ItemValue : *InventoryArray)
-                        {{
-                            NewNPC.Inventory.Add(ItemValue->AsString());
-                        }}
-                    }}
-
-                    NPCDatabase.Add(NewNPC);
-                }}
-            }}
-        }}
-    }}
-}}
+        // Parse dialogue
+        const TArray<TSharedPtr<FJsonValue>>* DialogueArray;
+        if (NPCObj->TryGetArrayField(TEXT("dialogue"), DialogueArray))
+        {
+            NewNPC.Dialogue.Reserve(DialogueArray->Num());
+            for (const TSharedPtr<FJsonValue>& DialogueValue : *DialogueArray)
+            {
+                NewNPC.Dialogue.Add(DialogueValue->AsString());
+            }
+        }
+
+        // Parse stats
+        const TSharedPtr<FJsonObject>* StatsObj;
+        if (NPCObj->TryGetObjectField(TEXT("stats"), StatsObj))
+        {
+            NewNPC.Stats.Health = (*StatsObj)->GetIntegerField(TEXT("health"));
+            NewNPC.Stats.Attack = (*StatsObj)->GetIntegerField(TEXT("attack"));
+            NewNPC.Stats.Defense = (*StatsObj)->GetIntegerField(TEXT("defense"));
+        }
+
+        // Parse inventory
+        const TArray<TSharedPtr<FJsonValue>>* InventoryArray;
+        if (NPCObj->TryGetArrayField(TEXT("inventory"), InventoryArray))
+        {
+            NewNPC.Inventory.Reserve(InventoryArray->Num());
+            for (const TSharedPtr<FJsonValue>& ItemValue : *InventoryArray)
+            {
+                NewNPC.Inventory.Add(ItemValue->AsString());
+            }
+        }
 
-A{world_name}NPC* A{world_name}NPCManager::SpawnNPC(const FString& NPCID, const FVector& Location, const FRotator& Rotation)
-{{
+        NPCIDs.Add(NewNPC.NPCID);
+        if (!NPCIDToIndex.Contains(NewNPC.NPCID))
+        {
+            NPCIDToIndex.Add(NewNPC.NPCID, NPCDatabase.Num());
+        }
+        NPCDatabase.Add(MoveTemp(NewNPC));
+    }
+}
+
+A${world}NPC* A${world}NPCManager::SpawnNPC(const FString& NPCID, const FVector& Location, const FRotator& Rotation)
+{
     if (!NPCClass)
-    {{
+    {
         UE_LOG(LogTemp, Error, TEXT("NPC Class not set in NPCManager"));
         return nullptr;
-    }}
+    }
 
-    // Find NPC data
-    F{world_name}NPCData* NPCData = NPCDatabase.FindByPredicate([&NPCID](const F{world_name}NPCData& Data)
-    {{
-        return Data.NPCID == NPCID;
-    }});
+    // Find NPC data with one hash lookup
+    const int32* DataIndex = NPCIDToIndex.Find(NPCID);
+    const F${world}NPCData* NPCData = DataIndex ? &NPCDatabase[*DataIndex] : nullptr;
 
     if (!NPCData)
-    {{
+    {
         UE_LOG(LogTemp, Error, TEXT("NPC data not found for ID: %s"), *NPCID);
         return nullptr;
-    }}
+    }
 
     // Spawn NPC
-    A{world_name}NPC* SpawnedNPC = GetWorld()->SpawnActor<A{world_name}NPC>(NPCClass, Location, Rotation);
+    A${world}NPC* SpawnedNPC = GetWorld()->SpawnActor<A${world}NPC>(NPCClass, Location, Rotation);
     if (SpawnedNPC)
-    {{
+    {
         SpawnedNPC->InitializeFromData(*NPCData);
         SpawnedNPCs.Add(SpawnedNPC);
+        if (!NPCByID.Contains(NPCID))
+        {
+            NPCByID.Add(NPCID, SpawnedNPC);
+        }
+        NPCsByType.FindOrAdd(NPCData->NPCType).Add(SpawnedNPC);
+        SpawnedNPC->OnDestroyed.AddDynamic(this, &A${world}NPCManager::HandleNPCDestroyed);
         UE_LOG(LogTemp, Warning, TEXT("Spawned NPC: %s"), *NPCData->NPCName);
-    }}
+    }
 
     return SpawnedNPC;
-}}
-
-A{world_name}NPC* A{world_name}NPCManager::FindNPCByID(const FString& NPCID)
-{{
-    for (A{world_name}NPC* NPC : SpawnedNPCs)
-    {{
-        if (NPC && NPC->NPCData.NPCID == NPCID)
-        {{
-            return NPC;
-        }}
-    }}
-    return nullptr;
-}}
-
-TArray<A{world_name}NPC*> A{world_name}NPCManager::GetNPCsByType(ENPCType NPCType)
-{{
-    TArray<A{world_name}NPC*> FilteredNPCs;
-
-    for (A{world_name}NPC* NPC : SpawnedNPCs)
-    {{
-        if (NPC && NPC->NPCData.NPCType == NPCType)
-        {{
-            FilteredNPCs.Add(NPC);
-        }}
-    }}
+}
+
+A${world}NPC* A${world}NPCManager::FindNPCByID(const FString& NPCID)
+{
+    return NPCByID.FindRef(NPCID);
+}
+
+void A${world}NPCManager::RemoveSpawnedNPC(A${world}NPC* NPC)
+{
+    if (!NPC || !SpawnedNPCs.Contains(NPC))
+    {
+        return;
+    }
+
+    NPC->OnDestroyed.RemoveDynamic(this, &A${world}NPCManager::HandleNPCDestroyed);
+    SpawnedNPCs.RemoveSingle(NPC);
+
+    const F${world}NPCData& Data = NPC->GetNPCData();
+    if (TArray<TWeakObjectPtr<A${world}NPC>>* Bucket = NPCsByType.Find(Data.NPCType))
+    {
+        Bucket->RemoveSingle(TWeakObjectPtr<A${world}NPC>(NPC));
+    }
+
+    // Hand the ID over to the next spawned NPC sharing it, if any
+    if (NPCByID.FindRef(Data.NPCID) == NPC)
+    {
+        NPCByID.Remove(Data.NPCID);
+        for (A${world}NPC* Other : SpawnedNPCs)
+        {
+            if (Other && Other->GetNPCData().NPCID == Data.NPCID)
+            {
+                NPCByID.Add(Data.NPCID, Other);
+                break;
+            }
+        }
+    }
+}
+
+void A${world}NPCManager::HandleNPCDestroyed(AActor* DestroyedActor)
+{
+    RemoveSpawnedNPC(Cast<A${world}NPC>(DestroyedActor));
+}
+
+TArray<A${world}NPC*> A${world}NPCManager::GetNPCsByType(ENPCType NPCType)
+{
+    TArray<A${world}NPC*> FilteredNPCs;
+
+    if (TArray<TWeakObjectPtr<A${world}NPC>>* Bucket = NPCsByType.Find(NPCType))
+    {
+        // Drop NPCs destroyed since the last query so later calls copy without checks
+        Bucket->RemoveAll([](const TWeakObjectPtr<A${world}NPC>& NPC) { return !NPC.IsValid(); });
+
+        FilteredNPCs.Reserve(Bucket->Num());
+        for (const TWeakObjectPtr<A${world}NPC>& NPC : *Bucket)
+        {
+            FilteredNPCs.Add(NPC.Get());
+        }
+    }
 
     return FilteredNPCs;
-}}
+}
 
-void A{world_name}NPCManager::SpawnAllNPCs()
-{{
+void A${world}NPCManager::SpawnAllNPCs()
+{
     // Spawn NPCs at default locations - can be customized
-    for (int32 i = 0; i < NPCDatabase.Num(); i++)
-    {{
+    for (int32 i = 0; i < NPCIDs.Num(); i++)
+    {
         FVector SpawnLocation = FVector(i * 500.0f, 0.0f, 100.0f); // Spread NPCs out
-        SpawnNPC(NPCDatabase[i].NPCID, SpawnLocation, FRotator::ZeroRotator);
-    }}
-}}'''
+        SpawnNPC(NPCIDs[i], SpawnLocation, FRotator::ZeroRotator);
+    }
+}''')
 
-        return header, implementation
+_JSON_UTILS_HEADER_TPL = _SourceTemplate('''#pragma once
 
-    def _generate_environment_system_cpp(self, json_data: Dict[str, Any], world_name: str) -> tuple[str, str]:
-        """Generate Environment System C++ files"""
-        env_data = json_data.get("environment", {})
+#include "CoreMinimal.h"
+#include "Dom/JsonValue.h"
+
+// Shared loader for the JSON data files generated alongside this module
+struct GAMEMODULE_API F${world}JsonUtils
+{
+    // Reads Content/<RelativePath> and copies out the array stored under ArrayField
+    static bool LoadArray(const FString& RelativePath, const FString& ArrayField, TArray<TSharedPtr<FJsonValue>>& OutArray);
+};''')
+
+_JSON_UTILS_CPP_TPL = _SourceTemplate('''#include "${world}JsonUtils.h"
+#include "Misc/FileHelper.h"
+#include "Misc/Paths.h"
+#include "Dom/JsonObject.h"
+#include "Serialization/JsonSerializer.h"
+#include "Serialization/JsonReader.h"
+
+bool F${world}JsonUtils::LoadArray(const FString& RelativePath, const FString& ArrayField, TArray<TSharedPtr<FJsonValue>>& OutArray)
+{
+    const FString FilePath = FPaths::ProjectContentDir() + RelativePath;
+    FString JsonString;
+
+    if (!FFileHelper::LoadFileToString(JsonString, *FilePath))
+    {
+        return false;
+    }
+
+    TSharedPtr<FJsonObject> JsonObject;
+    TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(JsonString);
+    if (!FJsonSerializer::Deserialize(Reader, JsonObject) || !JsonObject.IsValid())
+    {
+        return false;
+    }
 
-        header = f'''#pragma once
+    const TArray<TSharedPtr<FJsonValue>>* Array;
+    if (!JsonObject->TryGetArrayField(ArrayField, Array))
+    {
+        return false;
+    }
+
+    OutArray = *Array;
+    return true;
+}''')
+
+_ENVIRONMENT_HEADER_TPL = _SourceTemplate('''#pragma once
 
 #include "CoreMinimal.h"
 #include "GameFramework/Actor.h"
-#include "{world_name}Environment.generated.h"
+#include "${world}Environment.generated.h"
 
 USTRUCT(BlueprintType)
-struct F{world_name}EnvironmentData
-{{
+struct F${world}EnvironmentData
+{
     GENERATED_BODY()
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Environment")
-    FString EnvironmentType = TEXT("{env_data.get('type', 'forest')}");
+    FString EnvironmentType = TEXT("${env_type}");
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Environment")
-    FString Setting = TEXT("{env_data.get('setting', 'A mysterious location')}");
+    FString Setting = TEXT("${setting}");
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Environment")
-    FString Lighting = TEXT("{env_data.get('lighting', 'dynamic')}");
+    FString Lighting = TEXT("${lighting}");
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Environment")
-    FString Weather = TEXT("{env_data.get('weather', 'clear')}");
+    FString Weather = TEXT("${weather}");
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Environment")
-    FString Atmosphere = TEXT("{env_data.get('atmosphere', 'mysterious')}");
-}};
+    FString Atmosphere = TEXT("${atmosphere}");
+};
 
 UCLASS(BlueprintType, Blueprintable)
-class GAMEMODULE_API A{world_name}Environment : public AActor
-{{
+class GAMEMODULE_API A${world}Environment : public AActor
+{
     GENERATED_BODY()
 
 public:
-    A{world_name}Environment();
+    A${world}Environment();
 
 protected:
     virtual void BeginPlay() override;
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Environment")
-    F{world_name}EnvironmentData EnvironmentData;
+    F${world}EnvironmentData EnvironmentData;
 
 public:
     UFUNCTION(BlueprintCallable, Category = "Environment")
@@ -1096,55 +1175,48 @@ public:
 
     UFUNCTION(BlueprintCallable, Category = "Environment")
     void ApplyEnvironmentSettings();
-}};'''
+};''')
 
-        implementation = f'''#include "{world_name}Environment.h"
+_ENVIRONMENT_CPP_TPL = _SourceTemplate('''#include "${world}Environment.h"
 #include "Engine/Engine.h"
 
-A{world_name}Environment::A{world_name}Environment()
-{{
+A${world}Environment::A${world}Environment()
+{
     PrimaryActorTick.bCanEverTick = false;
-}}
+}
 
-void A{world_name}Environment::BeginPlay()
-{{
+void A${world}Environment::BeginPlay()
+{
     Super::BeginPlay();
     LoadEnvironmentFromJSON();
     ApplyEnvironmentSettings();
-}}
+}
 
-void A{world_name}Environment::LoadEnvironmentFromJSON()
-{{
+void A${world}Environment::LoadEnvironmentFromJSON()
+{
     // Load environment data from JSON
     UE_LOG(LogTemp, Warning, TEXT("Loading environment: %s"), *EnvironmentData.EnvironmentType);
-}}
+}
 
-void A{world_name}Environment::ApplyEnvironmentSettings()
-{{
+void A${world}Environment::ApplyEnvironmentSettings()
+{
     // Apply environment settings to the world
     UE_LOG(LogTemp, Warning, TEXT("Applied environment settings for %s"), *EnvironmentData.Setting);
-}}'''
-
-        return header, implementation
+}''')
 
-    def _generate_player_controller_cpp(self, json_data: Dict[str, Any], world_name: str) -> tuple[str, str]:
-        """Generate Player Controller C++ files"""
-        physics_data = json_data.get("physics", {})
-        abilities = physics_data.get("player_abilities", ["walk", "run", "jump"])
-
-        header = f'''#pragma once
+_PLAYER_CONTROLLER_HEADER_TPL = _SourceTemplate('''#pragma once
 
 #include "CoreMinimal.h"
 #include "GameFramework/PlayerController.h"
-#include "{world_name}PlayerController.generated.h"
+#include "${world}PlayerController.generated.h"
 
 UCLASS(BlueprintType, Blueprintable)
-class GAMEMODULE_API A{world_name}PlayerController : public APlayerController
-{{
+class GAMEMODULE_API A${world}PlayerController : public APlayerController
+{
     GENERATED_BODY()
 
 public:
-    A{world_name}PlayerController();
+    A${world}PlayerController();
 
 protected:
     virtual void BeginPlay() override;
@@ -1154,10 +1226,10 @@ protected:
     TArray<FString> PlayerAbilities;
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Player Settings")
-    float MovementSpeed = {physics_data.get('movement_speed', 5.0)};
+    float MovementSpeed = ${movement_speed};
 
     UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Player Settings")
-    float JumpHeight = {physics_data.get('jump_height', 2.0)};
+    float JumpHeight = ${jump_height};
 
 public:
     UFUNCTION(BlueprintCallable, Category = "Player")
@@ -1165,252 +1237,135 @@ public:
 
     UFUNCTION(BlueprintCallable, Category = "Player")
     void LoadPlayerSettings();
-}};'''
+};''')
+
+# Constructor body filling PlayerAbilities from one static table; left out when
+# there are no abilities, since C++ has no zero-length arrays
+_ABILITY_INIT_BLOCK = '''    static const TCHAR* const DefaultAbilities[] = {{ TEXT("{abilities}") }};
+    PlayerAbilities.Reserve(UE_ARRAY_COUNT(DefaultAbilities));
+    for (const TCHAR* Ability : DefaultAbilities)
+    {{
+        PlayerAbilities.Add(Ability);
+    }}
+'''
 
-        implementation = f'''#include "{world_name}PlayerController.h"
+_PLAYER_CONTROLLER_CPP_TPL = _SourceTemplate('''#include "${world}PlayerController.h"
 #include "Engine/Engine.h"
 
-A{world_name}PlayerController::A{world_name}PlayerController()
-{{
+A${world}PlayerController::A${world}PlayerController()
+{
     // Initialize player abilities
-    {chr(10).join([f'    PlayerAbilities.Add(TEXT("{ability}"));' for ability in abilities])}
-}}
+${ability_init}}
 
-void A{world_name}PlayerController::BeginPlay()
-{{
+void A${world}PlayerController::BeginPlay()
+{
     Super::BeginPlay();
     LoadPlayerSettings();
-}}
+}
 
-void A{world_name}PlayerController::SetupInputComponent()
-{{
+void A${world}PlayerController::SetupInputComponent()
+{
     Super::SetupInputComponent();
     // Setup input bindings here
-}}
+}
 
-bool A{world_name}PlayerController::HasAbility(const FString& AbilityName) const
-{{
+bool A${world}PlayerController::HasAbility(const FString& AbilityName) const
+{
     return PlayerAbilities.Contains(AbilityName);
-}}
+}
 
-void A{world_name}PlayerController::LoadPlayerSettings()
-{{
+void A${world}PlayerController::LoadPlayerSettings()
+{
     UE_LOG(LogTemp, Warning, TEXT("Loaded player settings - Speed: %f, Jump: %f"), MovementSpeed, JumpHeight);
-}}'''
-
-        return header, implementation
-
-    def _create_blueprint_quest_data(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create Blueprint-compatible quest data"""
-        quests = json_data.get("quests", [])
+}''')
 
-        blueprint_data = {
-            "QuestSystemData": {
-                "TotalQuests": len(quests),
-                "MainQuests": len([q for q in quests if q.get("type") == "main"]),
-                "SideQuests": len([q for q in quests if q.get("type") == "side"]),
-                "Quests": []
-            }
-        }
+_BUILD_CS_TPL = _SourceTemplate('''using UnrealBuildTool;
 
-        for quest in quests:
-            bp_quest = {
-                "ID": quest.get("id", ""),
-                "Name": quest.get("name", ""),
-                "Type": quest.get("type", "main"),
-                "Objective": quest.get("objective", ""),
-                "Description": quest.get("description", ""),
-                "Requirements": quest.get("requirements", []),
-                "Rewards": {
-                    "Experience": quest.get("rewards", {}).get("experience", 0),
-                    "Gold": quest.get("rewards", {}).get("gold", 0),
-                    "Items": quest.get("rewards", {}).get("items", [])
-                },
-                "Location": quest.get("location", ""),
-                "EstimatedTime": quest.get("estimated_time", ""),
-                "Status": "NotStarted"
-            }
-            blueprint_data["QuestSystemData"]["Quests"].append(bp_quest)
+public class ${world} : ModuleRules
+{
+    public ${world}(ReadOnlyTargetRules Target) : base(Target)
+    {
+        PCHUsage = PCHUsageMode.UseExplicitOrSharedPCHs;
 
-        return blueprint_data
-
-    def _create_blueprint_npc_data(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create Blueprint-compatible NPC data"""
-        npcs = json_data.get("npcs", [])
-
-        blueprint_data = {
-            "NPCSystemData": {
-                "TotalNPCs": len(npcs),
-                "FriendlyNPCs": len([n for n in npcs if n.get("type") == "friendly"]),
-                "HostileNPCs": len([n for n in npcs if n.get("type") == "hostile"]),
-                "NPCs": []
-            }
-        }
-
-        for npc in npcs:
-            bp_npc = {
-                "ID": npc.get("id", ""),
-                "Name": npc.get("name", ""),
-                "Role": npc.get("role", ""),
-                "Type": npc.get("type", "neutral"),
-                "Location": npc.get("location", ""),
-                "Dialogue": npc.get("dialogue", []),
-                "Behavior": npc.get("behavior", "stationary"),
-                "Stats": {
-                    "Health": npc.get("stats", {}).get("health", 100),
-                    "Attack": npc.get("stats", {}).get("attack", 10),
-                    "Defense": npc.get("stats", {}).get("defense", 10)
-                },
-                "Inventory": npc.get("inventory", []),
-                "SpawnLocation": {"X": 0, "Y": 0, "Z": 0}
-            }
-            blueprint_data["NPCSystemData"]["NPCs"].append(bp_npc)
-
-        return blueprint_data
-
-    def _create_blueprint_environment_data(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create Blueprint-compatible environment data"""
-        env = json_data.get("environment", {})
-
-        return {
-            "EnvironmentData": {
-                "Type": env.get("type", "forest"),
-                "Setting": env.get("setting", ""),
-                "Terrain": env.get("terrain", []),
-                "Lighting": env.get("lighting", "dynamic"),
-                "Weather": env.get("weather", "clear"),
-                "Atmosphere": env.get("atmosphere", "mysterious"),
-                "Size": env.get("size", "medium"),
-                "Assets": env.get("assets", [])
-            }
-        }
-
-    def _create_blueprint_asset_data(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create Blueprint-compatible asset data"""
-        assets = json_data.get("assets_required", {})
-
-        return {
-            "AssetData": {
-                "Models": assets.get("models", []),
-                "Textures": assets.get("textures", []),
-                "Sounds": assets.get("sounds", []),
-                "Effects": assets.get("effects", []),
-                "Animations": assets.get("animations", [])
-            }
-        }
-
-    def _create_varest_compatible_data(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create VaRest plugin compatible data structure"""
-        return {
-            "WorldData": {
-                "Metadata": json_data.get("metadata", {}),
-                "Environment": json_data.get("environment", {}),
-                "Quests": json_data.get("quests", []),
-                "NPCs": json_data.get("npcs", []),
-                "Physics": json_data.get("physics", {}),
-                "WinConditions": json_data.get("win_conditions", []),
-                "LoseConditions": json_data.get("lose_conditions", []),
-                "AssetsRequired": json_data.get("assets_required", {})
-            },
-            "VaRestMetadata": {
-                "Version": "1.0",
-                "GeneratedBy": "TTG Genesis",
-                "Timestamp": "2025-01-01T00:00:00Z",
-                "Format": "VaRest Compatible"
-            }
-        }
-
-    def _generate_build_cs(self, world_name: str) -> str:
-        """Generate Build.cs file for UE5 module compilation"""
-        return f'''using UnrealBuildTool;
-
-public class {world_name} : ModuleRules
-{{
-    public {world_name}(ReadOnlyTargetRules Target) : base(Target)
-    {{
-        PCHUsage = PCHUsageMode.UseExplicitOrSharedPCHs;
-
-        PublicDependencyModuleNames.AddRange(new string[]
-        {{
-            "Core",
-            "CoreUObject",
-            "Engine",
-            "InputCore",
-            "Json",
-            "JsonUtilities"
-        }});
+        PublicDependencyModuleNames.AddRange(new string[]
+        {
+            "Core",
+            "CoreUObject",
+            "Engine",
+            "InputCore",
+            "Json",
+            "JsonUtilities"
+        });
 
         PrivateDependencyModuleNames.AddRange(new string[]
-        {{
+        {
             "Slate",
             "SlateCore",
             "UMG",
             "HTTP",
             "VaRest"
-        }});
-    }}
-}}'''
+        });
+    }
+}''')
 
-    def _generate_module_header(self, world_name: str) -> str:
-        """Generate module header file"""
-        return f'''#pragma once
+_MODULE_HEADER_TPL = _SourceTemplate('''#pragma once
 
 #include "CoreMinimal.h"
 #include "Modules/ModuleManager.h"
 
-class F{world_name}Module : public IModuleInterface
-{{
+class F${world}Module : public IModuleInterface
+{
 public:
     virtual void StartupModule() override;
     virtual void ShutdownModule() override;
-}};'''
+};''')
 
-    def _generate_module_cpp(self, world_name: str) -> str:
-        """Generate module implementation file"""
-        return f'''#include "{world_name}Module.h"
+_MODULE_CPP_TPL = _SourceTemplate('''#include "${world}Module.h"
 
-#define LOCTEXT_NAMESPACE "F{world_name}Module"
+#define LOCTEXT_NAMESPACE "F${world}Module"
 
-void F{world_name}Module::StartupModule()
-{{
+void F${world}Module::StartupModule()
+{
     // This code will execute after your module is loaded into memory; the exact timing is specified in the .uplugin file per-module
-    UE_LOG(LogTemp, Warning, TEXT("{world_name} Module Started"));
-}}
+    UE_LOG(LogTemp, Warning, TEXT("${world} Module Started"));
+}
 
-void F{world_name}Module::ShutdownModule()
-{{
+void F${world}Module::ShutdownModule()
+{
     // This function may be called during shutdown to clean up your module. For modules that support dynamic reloading,
     // we call this function before unloading the module.
-    UE_LOG(LogTemp, Warning, TEXT("{world_name} Module Shutdown"));
-}}
+    UE_LOG(LogTemp, Warning, TEXT("${world} Module Shutdown"));
+}
 
 #undef LOCTEXT_NAMESPACE
 
-IMPLEMENT_MODULE(F{world_name}Module, {world_name})'''
+IMPLEMENT_MODULE(F${world}Module, ${world})''')
 
-    def _generate_integration_readme(self, json_data: Dict[str, Any], world_name: str) -> str:
-        """Generate integration README for UE5"""
-        metadata = json_data.get("metadata", {})
-        quests = json_data.get("quests", [])
-        npcs = json_data.get("npcs", [])
+# (file name suffix after the world name, template) for the module boilerplate
+_MODULE_SOURCES = (
+    (".Build.cs", _BUILD_CS_TPL),
+    ("Module.h", _MODULE_HEADER_TPL),
+    ("Module.cpp", _MODULE_CPP_TPL),
+)
 
-        return f'''# {world_name} - UE5 Integration Guide
+_INTEGRATION_README_TPL = _SourceTemplate('''# ${world} - UE5 Integration Guide
 
-## Generated World: {metadata.get("level_name", "Unknown")}
-**Description**: {metadata.get("description", "No description available")}
-**Theme**: {metadata.get("theme", "Unknown")}
-**Difficulty**: {metadata.get("difficulty", "Medium")}
-**Estimated Playtime**: {metadata.get("estimated_playtime", "Unknown")}
+## Generated World: ${level_name}
+**Description**: ${description}
+**Theme**: ${theme}
+**Difficulty**: ${difficulty}
+**Estimated Playtime**: ${estimated_playtime}
 
 ## Files Generated
 
 ### C++ Files (ue5-c++/)
-- `{world_name}QuestSystem.h/.cpp` - Quest management system
-- `{world_name}NPCSystem.h/.cpp` - NPC management and interaction
-- `{world_name}Environment.h/.cpp` - Environment and world settings
-- `{world_name}PlayerController.h/.cpp` - Player controller with abilities
-- `{world_name}Module.h/.cpp` - Module definition
-- `{world_name}.Build.cs` - Build configuration
+- `${world}QuestSystem.h/.cpp` - Quest management system
+- `${world}NPCSystem.h/.cpp` - NPC management and interaction
+- `${world}JsonUtils.h/.cpp` - Shared JSON data file loader
+- `${world}Environment.h/.cpp` - Environment and world settings
+- `${world}PlayerController.h/.cpp` - Player controller with abilities
+- `${world}Module.h/.cpp` - Module definition
+- `${world}.Build.cs` - Build configuration
 
 ### Blueprint Data Files (ue5-exports/)
 - `QuestData.json` - Quest system data for Blueprints
@@ -1427,11 +1382,11 @@ IMPLEMENT_MODULE(F{world_name}Module, {world_name})'''
 3. Add the module to your project's `.uproject` file:
 ```json
 "Modules": [
-    {{
-        "Name": "{world_name}",
+    {
+        "Name": "${world}",
         "Type": "Runtime",
         "LoadingPhase": "Default"
-    }}
+    }
 ]
 ```
 4. Regenerate project files and compile
@@ -1439,9 +1394,9 @@ IMPLEMENT_MODULE(F{world_name}Module, {world_name})'''
 ### 2. Blueprint Integration
 1. Copy JSON files to `Content/Data/` folder in your UE5 project
 2. Create Blueprint classes inheriting from the generated C++ classes:
-   - `BP_{world_name}QuestSystem` from `A{world_name}QuestSystem`
-   - `BP_{world_name}NPCManager` from `A{world_name}NPCManager`
-   - `BP_{world_name}Environment` from `A{world_name}Environment`
+   - `BP_${world}QuestSystem` from `A${world}QuestSystem`
+   - `BP_${world}NPCManager` from `A${world}NPCManager`
+   - `BP_${world}Environment` from `A${world}Environment`
 
 ### 3. VaRest Integration (Optional)
 If using VaRest plugin:
@@ -1450,44 +1405,44 @@ If using VaRest plugin:
 3. Create Blueprint logic to parse and apply the world data
 
 ## World Statistics
-- **Total Quests**: {len(quests)}
-- **Main Quests**: {len([q for q in quests if q.get("type") == "main"])}
-- **Side Quests**: {len([q for q in quests if q.get("type") == "side"])}
-- **Total NPCs**: {len(npcs)}
-- **Friendly NPCs**: {len([n for n in npcs if n.get("type") == "friendly"])}
-- **Hostile NPCs**: {len([n for n in npcs if n.get("type") == "hostile"])}
+- **Total Quests**: ${total_quests}
+- **Main Quests**: ${main_quests}
+- **Side Quests**: ${side_quests}
+- **Total NPCs**: ${total_npcs}
+- **Friendly NPCs**: ${friendly_npcs}
+- **Hostile NPCs**: ${hostile_npcs}
 
 ## Quest List
-{chr(10).join([f"- **{q.get('name', 'Unknown')}** ({q.get('type', 'unknown')}): {q.get('objective', 'No objective')}" for q in quests])}
+${quest_lines}
 
 ## NPC List
-{chr(10).join([f"- **{n.get('name', 'Unknown')}** ({n.get('type', 'unknown')}): {n.get('role', 'No role')}" for n in npcs])}
+${npc_lines}
 
 ## Required Assets
 ### Models
-{chr(10).join([f"- {asset}" for asset in json_data.get("assets_required", {}).get("models", [])])}
+${models_lines}
 
 ### Textures
-{chr(10).join([f"- {asset}" for asset in json_data.get("assets_required", {}).get("textures", [])])}
+${textures_lines}
 
 ### Sounds
-{chr(10).join([f"- {asset}" for asset in json_data.get("assets_required", {}).get("sounds", [])])}
+${sounds_lines}
 
 ### Effects
-{chr(10).join([f"- {asset}" for asset in json_data.get("assets_required", {}).get("effects", [])])}
+${effects_lines}
 
 ## Usage Examples
 
 ### Starting a Quest (C++)
 ```cpp
-A{world_name}QuestSystem* QuestSystem = GetWorld()->SpawnActor<A{world_name}QuestSystem>();
+A${world}QuestSystem* QuestSystem = GetWorld()->SpawnActor<A${world}QuestSystem>();
 bool Success = QuestSystem->StartQuest(TEXT("quest_1"));
 ```
 
 ### Spawning an NPC (C++)
 ```cpp
-A{world_name}NPCManager* NPCManager = GetWorld()->SpawnActor<A{world_name}NPCManager>();
-A{world_name}NPC* SpawnedNPC = NPCManager->SpawnNPC(TEXT("npc_1"), FVector(0,0,0), FRotator::ZeroRotator);
+A${world}NPCManager* NPCManager = GetWorld()->SpawnActor<A${world}NPCManager>();
+A${world}NPC* SpawnedNPC = NPCManager->SpawnNPC(TEXT("npc_1"), FVector(0,0,0), FRotator::ZeroRotator);
 ```
 
 ### Blueprint Usage
@@ -1503,32 +1458,510 @@ Use the generated Blueprint classes and bind to the provided events:
 - VaRest compatibility ensures easy data manipulation
 
 Generated by TTG Genesis - Text to Game World Generator
-'''
+''')
+
+@functools.lru_cache(maxsize=128)
+def _render_for_world(template: _SourceTemplate, world_name: str) -> bytes:
+    """Render a source that depends only on the world name; reruns reuse the text"""
+    return template.substitute(world=world_name)
+
+# \W is exactly "not str.isalnum() and not _", so this strips what isalnum() rejects
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
+
+def _alnum_only(text: str) -> str:
+    """Keep only the characters for which str.isalnum() is true, for world names"""
+    return _NON_ALNUM_RE.sub("", text)
+
+def _bullet_lines(items: Any) -> str:
+    """Markdown bullet list, one "- item" line per entry"""
+    # str.join builds a list from a generator anyway; a list comprehension skips that step
+    return "\n".join([f"- {item}" for item in items])
+
+def _dir_prefix(path: Path) -> str:
+    """Directory as a string prefix for file names, matching str(path / name)"""
+    text = str(path)
+    return "" if text == "." else os.path.join(text, "")
+
+# slots= needs Python 3.10; older interpreters still get a frozen dataclass
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class WorldInput:
+    """Top-level sections of the prompt parser output, resolved and checked once"""
+    metadata: Dict[str, Any]
+    environment: Dict[str, Any]
+    quests: List[Dict[str, Any]]
+    npcs: List[Dict[str, Any]]
+    physics: Dict[str, Any]
+    win_conditions: List[Any]
+    lose_conditions: List[Any]
+    assets_required: Dict[str, Any]
+    # Type tallies taken while the records are checked, shared by every export
+    main_quest_count: int = 0
+    side_quest_count: int = 0
+    friendly_npc_count: int = 0
+    hostile_npc_count: int = 0
+
+    @classmethod
+    def from_json(cls, json_data: Dict[str, Any]) -> "WorldInput":
+        """
+        Pull each section out of json_data, treating missing or null ones as empty
+
+        Raises:
+            ValueError: If a section or a quest/NPC entry has the wrong JSON type
+        """
+        if not isinstance(json_data, dict):
+            raise ValueError(f"World data must be an object, got {type(json_data).__name__}")
+
+        def section(key: str, kind: type) -> Any:
+            value = json_data.get(key)
+            if value is None:
+                return kind()
+            if not isinstance(value, kind):
+                expected = "an object" if kind is dict else "a list"
+                raise ValueError(f"'{key}' must be {expected}, got {type(value).__name__}")
+            return value
+
+        def check_records(key: str) -> List[Dict[str, Any]]:
+            records = section(key, list)
+            for i, record in enumerate(records):
+                if not isinstance(record, dict):
+                    raise ValueError(f"'{key}[{i}]' must be an object, got {type(record).__name__}")
+            return records
+
+        quests = check_records("quests")
+        npcs = check_records("npcs")
+
+        # Plain == tests rather than a Counter: type values come from user JSON and may be unhashable
+        main_count = side_count = 0
+        for quest in quests:
+            quest_type = quest.get("type")
+            if quest_type == "main":
+                main_count += 1
+            elif quest_type == "side":
+                side_count += 1
+        friendly_count = hostile_count = 0
+        for npc in npcs:
+            npc_type = npc.get("type")
+            if npc_type == "friendly":
+                friendly_count += 1
+            elif npc_type == "hostile":
+                hostile_count += 1
+
+        return cls(
+            metadata=section("metadata", dict),
+            environment=section("environment", dict),
+            quests=quests,
+            npcs=npcs,
+            physics=section("physics", dict),
+            win_conditions=section("win_conditions", list),
+            lose_conditions=section("lose_conditions", list),
+            assets_required=section("assets_required", dict),
+            main_quest_count=main_count,
+            side_quest_count=side_count,
+            friendly_npc_count=friendly_count,
+            hostile_npc_count=hostile_count,
+        )
+
+class UE5CodeGenerator:
+    """
+    Comprehensive UE5 code generator that creates C++ headers, implementations,
+    and Blueprint-compatible JSON from TTG Genesis world data
+    """
+    # Fixed attribute set: no per-instance __dict__, and compiled builds get plain fields
+    __slots__ = ("output_base_path", "cpp_output_path", "blueprint_output_path",
+                 "_base_prefix", "_cpp_prefix", "_blueprint_prefix")
+
+    def __init__(self, output_base_path: str = ".") -> None:
+        self.output_base_path = Path(output_base_path)
+        self.cpp_output_path = self.output_base_path / "ue5-c++"
+        self.blueprint_output_path = self.output_base_path / "ue5-exports"
+
+        # Create output directories
+        self.cpp_output_path.mkdir(parents=True, exist_ok=True)
+        self.blueprint_output_path.mkdir(parents=True, exist_ok=True)
+
+        # Output file paths are built by plain string concatenation on these
+        self._base_prefix = _dir_prefix(self.output_base_path)
+        self._cpp_prefix = _dir_prefix(self.cpp_output_path)
+        self._blueprint_prefix = _dir_prefix(self.blueprint_output_path)
+
+    def generate_all(self, json_data: Dict[str, Any], world_name: str = "GeneratedWorld") -> Dict[str, str]:
+        """
+        Generate all UE5 compatible files from JSON data
+
+        Args:
+            json_data: The world data from prompt parser (or an already built WorldInput)
+            world_name: Name for the generated world/classes
+
+        Returns:
+            Dictionary of generated file paths
+
+        Raises:
+            ValueError: If json_data does not have the prompt parser's shape
+        """
+        logger.info(f"Generating UE5 files for world: {world_name}")
+        return self._write_jobs(self._render_all(json_data, world_name))
+
+    def generate_from_json_path(self, json_file_path: str, world_name: Optional[str] = None) -> Dict[str, str]:
+        """
+        Generate all UE5 files from a JSON file created by the prompt parser
+
+        Args:
+            json_file_path: Path to the JSON file containing world data
+            world_name: Name for the generated world (auto-detected if None)
+
+        Returns:
+            Dictionary of generated file paths
+        """
+        json_data, world_name = self._load_world(json_file_path, world_name)
+        return self.generate_all(json_data, world_name)
+
+    @staticmethod
+    def _load_world(json_file_path: str, world_name: Optional[str]) -> Tuple[Dict[str, Any], str]:
+        """Parse a world file and settle its world name"""
+        # One read and one parse of the raw bytes, without a text decoding layer
+        with open(json_file_path, 'rb') as f:
+            json_data = _json_loads(f.read())
+
+        if world_name is None:
+            # Auto-generate world name from metadata
+            level_name = json_data.get("metadata", {}).get("level_name", "GeneratedWorld")
+            world_name = _alnum_only(level_name)
+            if not world_name:
+                world_name = "GeneratedWorld"
+
+        return json_data, world_name
+
+    def _render_all(self, json_data: Dict[str, Any], world_name: str) -> List[WriteJob]:
+        """Render every output file in memory without touching the disk"""
+        # Resolve and check the sections once; the renderers below read plain fields
+        world = json_data if isinstance(json_data, WorldInput) else WorldInput.from_json(json_data)
+
+        # C++ files, Blueprint JSON files and utility files
+        return (self._generate_cpp_files(world, world_name)
+                + self._generate_blueprint_files(world, world_name)
+                + self._generate_utility_files(world, world_name))
+
+    def _write_jobs(self, jobs: List[WriteJob]) -> Dict[str, str]:
+        """Write rendered files and return their paths keyed by file name"""
+        # The writes are independent, so overlap their disk latency on a thread pool
+        with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+            paths = list(executor.map(self._write_job, jobs))
+
+        generated_files = {name: path for (name, _, _), path in zip(jobs, paths)}
+
+        logger.info(f"Generated {len(generated_files)} files successfully")
+        return generated_files
+
+    def _generate_cpp_files(self, world: WorldInput, world_name: str) -> List[WriteJob]:
+        """Generate C++ header and implementation files"""
+        cpp_prefix = self._cpp_prefix + world_name
+        jobs = []
+
+        # Quest System
+        quest_header, quest_cpp = self._generate_quest_system_cpp(world, world_name)
+        jobs.append((f"{world_name}QuestSystem.h", f"{cpp_prefix}QuestSystem.h", quest_header))
+        jobs.append((f"{world_name}QuestSystem.cpp", f"{cpp_prefix}QuestSystem.cpp", quest_cpp))
+
+        # NPC System
+        npc_header, npc_cpp = self._generate_npc_system_cpp(world, world_name)
+        jobs.append((f"{world_name}NPCSystem.h", f"{cpp_prefix}NPCSystem.h", npc_header))
+        jobs.append((f"{world_name}NPCSystem.cpp", f"{cpp_prefix}NPCSystem.cpp", npc_cpp))
+
+        # JSON loading shared by the quest and NPC systems
+        jobs.append((f"{world_name}JsonUtils.h", f"{cpp_prefix}JsonUtils.h", _render_for_world(_JSON_UTILS_HEADER_TPL, world_name)))
+        jobs.append((f"{world_name}JsonUtils.cpp", f"{cpp_prefix}JsonUtils.cpp", _render_for_world(_JSON_UTILS_CPP_TPL, world_name)))
+
+        # Environment System
+        env_header, env_cpp = self._generate_environment_system_cpp(world, world_name)
+        jobs.append((f"{world_name}Environment.h", f"{cpp_prefix}Environment.h", env_header))
+        jobs.append((f"{world_name}Environment.cpp", f"{cpp_prefix}Environment.cpp", env_cpp))
+
+        # Player Controller
+        controller_header, controller_cpp = self._generate_player_controller_cpp(world, world_name)
+        jobs.append((f"{world_name}PlayerController.h", f"{cpp_prefix}PlayerController.h", controller_header))
+        jobs.append((f"{world_name}PlayerController.cpp", f"{cpp_prefix}PlayerController.cpp", controller_cpp))
 
-    def _write_file(self, filepath: Path, content: str) -> str:
+        return jobs
+
+    def _generate_blueprint_files(self, world: WorldInput, world_name: str) -> List[WriteJob]:
+        """Generate Blueprint-compatible JSON files"""
+        jobs = []
+
+        # Quest data for Blueprints
+        quest_bp_data = self._create_blueprint_quest_data(world)
+        jobs.append(("QuestData.json", self._blueprint_prefix + "QuestData.json", quest_bp_data))
+
+        # NPC data for Blueprints
+        npc_bp_data = self._create_blueprint_npc_data(world)
+        jobs.append(("NPCData.json", self._blueprint_prefix + "NPCData.json", npc_bp_data))
+
+        # Environment data for Blueprints
+        env_bp_data = self._create_blueprint_environment_data(world)
+        jobs.append(("EnvironmentData.json", self._blueprint_prefix + "EnvironmentData.json", env_bp_data))
+
+        # Asset list for content browser
+        asset_data = self._create_blueprint_asset_data(world)
+        jobs.append(("AssetList.json", self._blueprint_prefix + "AssetList.json", asset_data))
+
+        # Complete world data (VaRest compatible)
+        varest_data = self._create_varest_compatible_data(world)
+        jobs.append(("WorldData_VaRest.json", self._blueprint_prefix + "WorldData_VaRest.json", varest_data))
+
+        return jobs
+
+    def _generate_utility_files(self, world: WorldInput, world_name: str) -> List[WriteJob]:
+        """Generate utility files for UE5 integration"""
+        cpp_prefix = self._cpp_prefix + world_name
+        # Build.cs and the module header/implementation depend only on the world name
+        jobs = [(world_name + suffix, cpp_prefix + suffix, _render_for_world(template, world_name))
+                for suffix, template in _MODULE_SOURCES]
+
+        # README for integration
+        readme = self._generate_integration_readme(world, world_name)
+        jobs.append(("UE5_Integration_README.md", self._base_prefix + "UE5_Integration_README.md", readme))
+
+        return jobs
+
+    def _generate_quest_system_cpp(self, world: WorldInput, world_name: str) -> tuple[bytes, bytes]:
+        """Generate Quest System C++ header and implementation"""
+        # Header file
+        header = _render_for_world(_QUEST_HEADER_TPL, world_name)
+
+        # Implementation file
+        implementation = _render_for_world(_QUEST_CPP_TPL, world_name)
+
+        return header, implementation
+
+    def _generate_npc_system_cpp(self, world: WorldInput, world_name: str) -> tuple[bytes, bytes]:
+        """Generate NPC System C++ header and implementation"""
+
+        # Header file
+        header = _render_for_world(_NPC_HEADER_TPL, world_name)
+
+        # Implementation file
+        implementation = _render_for_world(_NPC_CPP_TPL, world_name)
+
+        return header, implementation
+
+    def _generate_environment_system_cpp(self, world: WorldInput, world_name: str) -> tuple[bytes, bytes]:
+        """Generate Environment System C++ files"""
+        env_data = world.environment
+
+        header = _ENVIRONMENT_HEADER_TPL.substitute(
+            world=world_name,
+            env_type=env_data.get('type', 'forest'),
+            setting=env_data.get('setting', 'A mysterious location'),
+            lighting=env_data.get('lighting', 'dynamic'),
+            weather=env_data.get('weather', 'clear'),
+            atmosphere=env_data.get('atmosphere', 'mysterious')
+        )
+
+        implementation = _render_for_world(_ENVIRONMENT_CPP_TPL, world_name)
+
+        return header, implementation
+
+    def _generate_player_controller_cpp(self, world: WorldInput, world_name: str) -> tuple[bytes, bytes]:
+        """Generate Player Controller C++ files"""
+        physics_data = world.physics
+        abilities = physics_data.get("player_abilities", ["walk", "run", "jump"])
+
+        header = _PLAYER_CONTROLLER_HEADER_TPL.substitute(
+            world=world_name,
+            movement_speed=physics_data.get('movement_speed', 5.0),
+            jump_height=physics_data.get('jump_height', 2.0)
+        )
+
+        implementation = _PLAYER_CONTROLLER_CPP_TPL.substitute(
+            world=world_name,
+            ability_init=_ABILITY_INIT_BLOCK.format(abilities='"), TEXT("'.join(map(str, abilities))) if abilities else ""
+        )
+
+        return header, implementation
+
+    def _create_blueprint_quest_data(self, world: WorldInput) -> Dict[str, Any]:
+        """Create Blueprint-compatible quest data"""
+        quests = world.quests
+
+        bp_quests = []
+        for quest in quests:
+            # Bound once per record; each record is read field by field below
+            get = quest.get
+            rewards = get("rewards", {})
+            bp_quests.append({
+                "ID": get("id", ""),
+                "Name": get("name", ""),
+                "Type": get("type", "main"),
+                "Objective": get("objective", ""),
+                "Description": get("description", ""),
+                "Requirements": get("requirements", []),
+                "Rewards": {
+                    "Experience": rewards.get("experience", 0),
+                    "Gold": rewards.get("gold", 0),
+                    "Items": rewards.get("items", [])
+                },
+                "Location": get("location", ""),
+                "EstimatedTime": get("estimated_time", ""),
+                "Status": "NotStarted"
+            })
+
+        return {
+            "QuestSystemData": {
+                "TotalQuests": len(quests),
+                "MainQuests": world.main_quest_count,
+                "SideQuests": world.side_quest_count,
+                "Quests": bp_quests
+            }
+        }
+
+    def _create_blueprint_npc_data(self, world: WorldInput) -> Dict[str, Any]:
+        """Create Blueprint-compatible NPC data"""
+        npcs = world.npcs
+
+        bp_npcs = []
+        for npc in npcs:
+            get = npc.get
+            stats = get("stats", {})
+            bp_npcs.append({
+                "ID": get("id", ""),
+                "Name": get("name", ""),
+                "Role": get("role", ""),
+                "Type": get("type", "neutral"),
+                "Location": get("location", ""),
+                "Dialogue": get("dialogue", []),
+                "Behavior": get("behavior", "stationary"),
+                "Stats": {
+                    "Health": stats.get("health", 100),
+                    "Attack": stats.get("attack", 10),
+                    "Defense": stats.get("defense", 10)
+                },
+                "Inventory": get("inventory", []),
+                "SpawnLocation": {"X": 0, "Y": 0, "Z": 0}
+            })
+
+        return {
+            "NPCSystemData": {
+                "TotalNPCs": len(npcs),
+                "FriendlyNPCs": world.friendly_npc_count,
+                "HostileNPCs": world.hostile_npc_count,
+                "NPCs": bp_npcs
+            }
+        }
+
+    def _create_blueprint_environment_data(self, world: WorldInput) -> Dict[str, Any]:
+        """Create Blueprint-compatible environment data"""
+        env = world.environment
+
+        return {
+            "EnvironmentData": {
+                "Type": env.get("type", "forest"),
+                "Setting": env.get("setting", ""),
+                "Terrain": env.get("terrain", []),
+                "Lighting": env.get("lighting", "dynamic"),
+                "Weather": env.get("weather", "clear"),
+                "Atmosphere": env.get("atmosphere", "mysterious"),
+                "Size": env.get("size", "medium"),
+                "Assets": env.get("assets", [])
+            }
+        }
+
+    def _create_blueprint_asset_data(self, world: WorldInput) -> Dict[str, Any]:
+        """Create Blueprint-compatible asset data"""
+        assets = world.assets_required
+
+        return {
+            "AssetData": {
+                "Models": assets.get("models", []),
+                "Textures": assets.get("textures", []),
+                "Sounds": assets.get("sounds", []),
+                "Effects": assets.get("effects", []),
+                "Animations": assets.get("animations", [])
+            }
+        }
+
+    def _create_varest_compatible_data(self, world: WorldInput) -> Dict[str, Any]:
+        """Create VaRest plugin compatible data structure"""
+        return {
+            "WorldData": {
+                "Metadata": world.metadata,
+                "Environment": world.environment,
+                "Quests": world.quests,
+                "NPCs": world.npcs,
+                "Physics": world.physics,
+                "WinConditions": world.win_conditions,
+                "LoseConditions": world.lose_conditions,
+                "AssetsRequired": world.assets_required
+            },
+            "VaRestMetadata": {
+                "Version": "1.0",
+                "GeneratedBy": "TTG Genesis",
+                "Timestamp": "2025-01-01T00:00:00Z",
+                "Format": "VaRest Compatible"
+            }
+        }
+
+    def _generate_integration_readme(self, world: WorldInput, world_name: str) -> Tuple[bytes, ...]:
+        """Generate integration README for UE5"""
+        metadata = world.metadata
+        quests = world.quests
+        npcs = world.npcs
+        assets = world.assets_required
+
+        # Chunks go to the file with vectored writes; the full README is never joined
+        return _INTEGRATION_README_TPL.substitute_chunks(
+            world=world_name,
+            level_name=metadata.get("level_name", "Unknown"),
+            description=metadata.get("description", "No description available"),
+            theme=metadata.get("theme", "Unknown"),
+            difficulty=metadata.get("difficulty", "Medium"),
+            estimated_playtime=metadata.get("estimated_playtime", "Unknown"),
+            total_quests=len(quests),
+            main_quests=world.main_quest_count,
+            side_quests=world.side_quest_count,
+            total_npcs=len(npcs),
+            friendly_npcs=world.friendly_npc_count,
+            hostile_npcs=world.hostile_npc_count,
+            quest_lines="\n".join([f"- **{q.get('name', 'Unknown')}** ({q.get('type', 'unknown')}): {q.get('objective', 'No objective')}" for q in quests]),
+            npc_lines="\n".join([f"- **{n.get('name', 'Unknown')}** ({n.get('type', 'unknown')}): {n.get('role', 'No role')}" for n in npcs]),
+            models_lines=_bullet_lines(assets.get("models", ())),
+            textures_lines=_bullet_lines(assets.get("textures", ())),
+            sounds_lines=_bullet_lines(assets.get("sounds", ())),
+            effects_lines=_bullet_lines(assets.get("effects", ()))
+        )
+
+    def _write_job(self, job: WriteJob) -> str:
+        """Write one rendered file and return its path ("" on failure)"""
+        _, filepath, payload = job
+        if isinstance(payload, (bytes, str, tuple)):
+            return self._write_file(filepath, payload)
+        return self._write_json_file(filepath, payload)
+
+    def _write_file(self, filepath: str, content: Union[bytes, str, Tuple[bytes, ...]]) -> str:
         """Write content to file and return the path"""
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            if isinstance(content, str):
+                content = content.encode('utf-8')
+            _write_bytes(filepath, content)
             logger.info(f"Generated: {filepath}")
-            return str(filepath)
+            return filepath
         except Exception as e:
             logger.error(f"Failed to write {filepath}: {e}")
             return ""
 
-    def _write_json_file(self, filepath: Path, data: Dict[str, Any]) -> str:
+    def _write_json_file(self, filepath: str, data: Dict[str, Any]) -> str:
         """Write JSON data to file and return the path"""
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
+            # Serialize up front and write once; json.dump would issue a write per token
+            _write_bytes(filepath, _json_dumps_pretty(data))
             logger.info(f"Generated JSON: {filepath}")
-            return str(filepath)
+            return filepath
         except Exception as e:
             logger.error(f"Failed to write JSON {filepath}: {e}")
             return ""
 
 # Convenience functions for easy usage
-def generate_ue5_files_from_json(json_file_path: str, world_name: str = None, output_path: str = ".") -> Dict[str, str]:
+def generate_ue5_files_from_json(json_file_path: str, world_name: Optional[str] = None, output_path: str = ".") -> Dict[str, str]:
     """
     Generate UE5 files from a JSON file created by the prompt parser
 
@@ -1541,24 +1974,14 @@ def generate_ue5_files_from_json(json_file_path: str, world_name: str = None, ou
         Dictionary of generated file paths
     """
     try:
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            json_data = json.load(f)
-
-        if world_name is None:
-            # Auto-generate world name from metadata
-            level_name = json_data.get("metadata", {}).get("level_name", "GeneratedWorld")
-            world_name = "".join(c for c in level_name if c.isalnum())
-            if not world_name:
-                world_name = "GeneratedWorld"
-
         generator = UE5CodeGenerator(output_path)
-        return generator.generate_all(json_data, world_name)
+        return generator.generate_from_json_path(json_file_path, world_name)
 
     except Exception as e:
         logger.error(f"Failed to generate UE5 files: {e}")
         return {}
 
-def generate_ue5_files_from_prompt(prompt: str, world_name: str = None, output_path: str = ".") -> Dict[str, str]:
+def generate_ue5_files_from_prompt(prompt: str, world_name: Optional[str] = None, output_path: str = ".") -> Dict[str, str]:
     """
     Generate UE5 files directly from a prompt (uses prompt parser)
 
@@ -1586,7 +2009,7 @@ def generate_ue5_files_from_prompt(prompt: str, world_name: str = None, output_p
         if world_name is None:
             # Auto-generate world name from metadata
             level_name = json_data.get("metadata", {}).get("level_name", "GeneratedWorld")
-            world_name = "".join(c for c in level_name if c.isalnum())
+            world_name = _alnum_only(level_name)
             if not world_name:
                 world_name = "GeneratedWorld"
 
@@ -1598,10 +2021,30 @@ def generate_ue5_files_from_prompt(prompt: str, world_name: str = None, output_p
         logger.error(f"Failed to generate UE5 files from prompt: {e}")
         return {}
 
+# Set in each batch worker process so all files it renders share one generator
+_worker_generator: Optional[UE5CodeGenerator] = None
+
+def _init_batch_worker(output_path: str) -> None:
+    global _worker_generator
+    _worker_generator = UE5CodeGenerator(output_path)
+
+def _render_world_file(json_file: str, world_name: str, generator: Optional[UE5CodeGenerator] = None) -> List[WriteJob]:
+    """Load and render one world file for batch_generate_ue5_files ([] on failure)"""
+    try:
+        generator = generator or _worker_generator
+        return generator._render_all(*generator._load_world(json_file, world_name))
+    except Exception as e:
+        logger.error(f"Failed to generate UE5 files: {e}")
+        return []
+
 def batch_generate_ue5_files(json_files: List[str], output_path: str = ".") -> Dict[str, Dict[str, str]]:
     """
     Generate UE5 files for multiple JSON world files
 
+    Worlds are rendered in parallel worker processes; files are then written
+    in input order, so a later world still overwrites shared outputs such as
+    QuestData.json, as it did when worlds were processed one by one.
+
     Args:
         json_files: List of JSON file paths
         output_path: Base output directory for generated files
@@ -1610,13 +2053,28 @@ def batch_generate_ue5_files(json_files: List[str], output_path: str = ".") -> D
         Dictionary mapping file names to their generated files
     """
     results = {}
-
+    world_names = []
     for json_file in json_files:
-        try:
-            filename = os.path.basename(json_file).replace('.json', '')
-            world_name = "".join(c for c in filename if c.isalnum())
+        filename = os.path.basename(json_file).replace('.json', '')
+        world_names.append(_alnum_only(filename))
+
+    # One generator writes every world; each worker process builds its own once
+    generator = UE5CodeGenerator(output_path)
+    if len(json_files) > 1:
+        # Rendering is CPU-bound Python, so use processes rather than threads
+        with ProcessPoolExecutor(max_workers=min(len(json_files), os.cpu_count() or 1),
+                                 initializer=_init_batch_worker, initargs=(output_path,)) as executor:
+            rendered = list(executor.map(_render_world_file, json_files, world_names))
+    else:
+        rendered = [_render_world_file(json_file, world_name, generator)
+                    for json_file, world_name in zip(json_files, world_names)]
 
-            generated_files = generate_ue5_files_from_json(json_file, world_name, output_path)
+    for json_file, world_name, jobs in zip(json_files, world_names, rendered):
+        try:
+            generated_files = {}
+            if jobs:
+                logger.info(f"Generating UE5 files for world: {world_name}")
+                generated_files = generator._write_jobs(jobs)
             results[json_file] = generated_files
 
             logger.info(f"Generated {len(generated_files)} files for {json_file}")
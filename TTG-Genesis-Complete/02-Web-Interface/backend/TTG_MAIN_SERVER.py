@@ -6,12 +6,27 @@ TTG Genesis UE5 Server - Working Version
 
 import os
 import sys
+import gzip
+import logging
 import json
+import re
 import uuid
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from flask import Flask, request, jsonify
 
+try:
+    import orjson  # Optional C-accelerated JSON; Flask's jsonify is used without it
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
 # Add UE5 integration to path
 sys.path.append(str(Path(__file__).parent.parent.parent / "04-UE5-Integration"))
 
@@ -60,57 +75,173 @@ if PROMPT_PARSER_AVAILABLE:
         config = OllamaConfig(model="llama3")  # Use llama3 for better results
         prompt_parser = PromptParser(config)
         print("Prompt Parser initialized with Llama3")
+        if OLLAMA_AVAILABLE:
+            # Load the model in the background so the first request does not pay the cold start
+            threading.Thread(target=prompt_parser.warm_up, name='ollama-warmup', daemon=True).start()
     except Exception as e:
         print(f"Failed to initialize prompt parser: {e}")
 
-# Global cache
-json_cache = {}
+# Worlds kept for step 2 (UE5 project creation) by world id, least recently used first
+JSON_CACHE_SIZE = 512
+json_cache = OrderedDict()
+json_cache_lock = threading.Lock()
+
+# Generated worlds keyed by a hash of (prompt, options), least recently used first
+WORLD_CACHE_SIZE = 128
+world_cache = OrderedDict()
+world_cache_lock = threading.Lock()
+
+# Multi-prompt generation overlaps the blocking Ollama calls on a small thread pool
+MAX_BATCH_PROMPTS = 16
+BATCH_WORKERS = 4
+
+def _jsonify(payload):
+    """JSON response for an API payload, serialized by orjson when it is installed"""
+    if orjson is None:
+        return jsonify(payload)
+    # Non-string keys are stringified as json.dumps would instead of raising
+    return app.response_class(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS),
+                              mimetype='application/json')
+
+def _digest(value) -> str:
+    """SHA-256 of a JSON value serialized with sorted keys"""
+    if orjson is not None:
+        encoded = orjson.dumps(value, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    else:
+        encoded = json.dumps(value, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+def _new_world_id() -> str:
+    """Random version 4 UUID string for a newly generated world"""
+    # GET /api/world serves worlds by id, so ids must come from the OS CSPRNG, not a guessable PRNG
+    return str(uuid.uuid4())
+
+# Strings up to this length in step 2 world data are interned: keys, NPC types and
+# stock dialogue lines repeat across every cached world
+_INTERN_MAX_LEN = 40
+
+def _intern_strings(value):
+    """Copy JSON-shaped data, interning dict keys and short string values"""
+    if isinstance(value, dict):
+        return {sys.intern(k) if isinstance(k, str) else k: _intern_strings(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_intern_strings(v) for v in value]
+    if isinstance(value, str) and len(value) <= _INTERN_MAX_LEN:
+        return sys.intern(value)
+    return value
+
+def _cache_for_project(world_data: dict, prompt: str, options: dict) -> str:
+    """Keep generated world data for step 2 (UE5 project creation) and return its world id"""
+    world_id = world_data['id']
+    entry = {
+        # Long-lived copy shares its repeated strings with every other cached world
+        'world_data': _intern_strings(world_data),
+        'prompt': prompt,
+        'options': options,
+        # Generated just now, so the world's own timestamp saves another clock read
+        'created_at': world_data.get('created_at') or datetime.now().isoformat()
+    }
+    with json_cache_lock:
+        json_cache[world_id] = entry
+        if len(json_cache) > JSON_CACHE_SIZE:
+            json_cache.popitem(last=False)
+    return world_id
+
+def _project_world(world_id: str):
+    """Step 2 cache entry for a world id, or None once unknown or evicted"""
+    with json_cache_lock:
+        entry = json_cache.get(world_id)
+        if entry is not None:
+            json_cache.move_to_end(world_id)
+    return entry
+
+def _freeze_world(world_data: dict) -> bytes:
+    """Serialized snapshot of world data, immune to later mutation of the original"""
+    if orjson is not None:
+        return orjson.dumps(world_data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(world_data).encode('utf-8')
+
+def _thaw_world(snapshot: bytes) -> dict:
+    """Fresh mutable world data from a snapshot; decoding JSON beats copy.deepcopy on this shape"""
+    return orjson.loads(snapshot) if orjson is not None else json.loads(snapshot)
+
+def _cache_key(prompt: str, options: dict) -> str:
+    """Content hash of a normalized prompt and its generation options"""
+    return _digest([prompt.strip().lower(), options])
 
 def generate_intelligent_world_data(prompt: str, options: dict) -> dict:
-    """Generate world data using LLM analysis or intelligent fallback"""
+    """Generate world data, reusing a cached LLM result for a repeated prompt"""
+    # Near-duplicate prompts are matched by the prompt parser's own semantic cache
+    key = _cache_key(prompt, options)
+    with world_cache_lock:
+        cached = world_cache.get(key)
+        if cached is not None:
+            world_cache.move_to_end(key)
+
+    if cached is not None:
+        logger.debug("Reusing cached world for prompt: %s", prompt)
+        world_data = _thaw_world(cached)
+        # Each request still gets its own world so step 2 caches stay independent
+        world_data['id'] = _new_world_id()
+        world_data['description'] = prompt
+        world_data['created_at'] = datetime.now().isoformat()
+        return world_data
+
+    world_data, from_llm = _generate_world_data(prompt, options)
+    # Fallback worlds are never cached, so the LLM is retried on the next request
+    if from_llm:
+        with world_cache_lock:
+            world_cache[key] = _freeze_world(world_data)
+            if len(world_cache) > WORLD_CACHE_SIZE:
+                world_cache.popitem(last=False)
+    return world_data
+
+def _generate_world_data(prompt: str, options: dict) -> tuple:
+    """Generate world data using LLM analysis or intelligent fallback, and whether it came from validated LLM output"""
 
     # Try LLM-based generation first
     if prompt_parser and OLLAMA_AVAILABLE:
         try:
-            print(f"🤖 Using LLM to analyze prompt: {prompt}")
-            llm_data = prompt_parser.parse_prompt(prompt)
+            logger.debug("Using LLM to analyze prompt: %s", prompt)
+            llm_data, from_llm = prompt_parser.parse_prompt_checked(prompt)
 
             # Convert LLM format to our expected format
             world_data = convert_llm_to_world_data(llm_data, prompt, options)
-            print("✅ LLM-based world generation successful")
-            return world_data
+            logger.debug("LLM-based world generation successful")
+            return world_data, from_llm
 
         except Exception as e:
-            print(f"⚠️ LLM generation failed: {e}, using intelligent fallback")
+            logger.warning("LLM generation failed: %s, using intelligent fallback", e)
 
     # Intelligent fallback - analyze prompt keywords
-    print(f"🧠 Using intelligent analysis for prompt: {prompt}")
-    return analyze_prompt_intelligently(prompt, options)
+    logger.debug("Using intelligent analysis for prompt: %s", prompt)
+    return analyze_prompt_intelligently(prompt, options), False
 
 def convert_llm_to_world_data(llm_data: dict, prompt: str, options: dict) -> dict:
     """Convert LLM-generated data to our world data format"""
 
-    print(f"🔄 Converting LLM data to UE5 format...")
-    print(f"🔍 LLM data keys: {list(llm_data.keys())}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Converting LLM data to UE5 format, keys: %s", list(llm_data.keys()))
 
-    world_id = str(uuid.uuid4())
+    world_id = _new_world_id()
     metadata = llm_data.get('metadata', {})
 
-    # Convert complex LLM NPCs to simple format
+    # Convert complex LLM NPCs to simple format, spaced 200 units apart by list position
     simple_npcs = []
     if options.get('includeNPCs') and llm_data.get('npcs'):
-        for i, npc in enumerate(llm_data['npcs']):
-            if isinstance(npc, dict):
-                simple_npc = {
-                    'name': npc.get('name', f'NPC_{i}'),
-                    'type': npc.get('type', 'friendly'),
-                    'dialogue': npc.get('dialogue', ['Hello!', 'How can I help?']),
-                    'location': {'x': i * 200, 'y': 0, 'z': 0},  # Simple location
-                    'health': npc.get('stats', {}).get('health', 100),
-                    'level': 1
-                }
-                simple_npcs.append(simple_npc)
-                print(f"✅ Converted NPC: {simple_npc['name']} ({simple_npc['type']})")
+        npcs = llm_data['npcs']
+        simple_npcs = [
+            {
+                'name': npc.get('name', f'NPC_{i}'),
+                'type': npc.get('type', 'friendly'),
+                'dialogue': npc.get('dialogue', ['Hello!', 'How can I help?']),
+                'location': {'x': x, 'y': 0, 'z': 0},  # Simple location
+                'health': npc.get('stats', {}).get('health', 100),
+                'level': 1
+            }
+            for i, (npc, x) in enumerate(zip(npcs, range(0, len(npcs) * 200, 200)))
+            if isinstance(npc, dict)
+        ]
 
     # Convert complex LLM quests to simple format
     simple_quests = []
@@ -137,7 +268,6 @@ def convert_llm_to_world_data(llm_data: dict, prompt: str, options: dict) -> dic
                     'rewards': rewards if rewards else ['Experience']
                 }
                 simple_quests.append(simple_quest)
-                print(f"✅ Converted Quest: {simple_quest['name']}")
 
     # Override theme detection - analyze the original prompt
     prompt_lower = prompt.lower()
@@ -157,7 +287,7 @@ def convert_llm_to_world_data(llm_data: dict, prompt: str, options: dict) -> dic
         'metadata': metadata
     }
 
-    print(f"✅ Converted to simple format: {len(simple_npcs)} NPCs, {len(simple_quests)} quests")
+    logger.debug("Converted to simple format: %d NPCs, %d quests", len(simple_npcs), len(simple_quests))
     return world_data
 
 def analyze_prompt_intelligently(prompt: str, options: dict) -> dict:
@@ -172,7 +302,7 @@ def analyze_prompt_intelligently(prompt: str, options: dict) -> dict:
     # Generate world name from prompt
     world_name = generate_world_name(prompt, theme_analysis['type'])
 
-    world_id = str(uuid.uuid4())
+    world_id = _new_world_id()
 
     world_data = {
         'id': world_id,
@@ -193,39 +323,71 @@ def analyze_prompt_intelligently(prompt: str, options: dict) -> dict:
 
     return world_data
 
+# Theme detection with priority order (more specific themes first)
+THEME_KEYWORDS = (
+    ('alien', ('alien', 'extraterrestrial', 'ufo', 'space', 'sci-fi', 'futuristic', 'cyberpunk', 'martian', 'galactic')),
+    ('horror', ('horror', 'scary', 'haunted', 'ghost', 'zombie', 'dark', 'spooky')),
+    ('medieval', ('medieval', 'castle', 'knight', 'dragon', 'sword', 'kingdom', 'fortress')),
+    ('underwater', ('underwater', 'ocean', 'sea', 'submarine', 'coral', 'aquatic')),
+    ('arctic', ('arctic', 'ice', 'snow', 'frozen', 'cold', 'winter', 'tundra')),
+    ('desert', ('desert', 'sand', 'oasis', 'pyramid', 'dune', 'sahara')),
+    ('fantasy', ('magic', 'wizard', 'fairy', 'forest', 'crystal', 'magical', 'enchanted')),
+    ('modern', ('city', 'urban', 'modern', 'street', 'building', 'car', 'metropolitan'))
+)
+
+def _keyword_pattern(keywords) -> re.Pattern:
+    """Compile keywords into one alternation that matches any of them as a substring"""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+def _keyword_ranks(themes) -> dict:
+    """Map each keyword to the priority rank of the first theme listing it (0 is most specific)"""
+    ranks = {}
+    for rank, (theme, keywords) in enumerate(themes):
+        for keyword in keywords:
+            ranks.setdefault(keyword, rank)
+    return ranks
+
+THEME_KEYWORD_RANKS = _keyword_ranks(THEME_KEYWORDS)
+
+# All theme keywords in one pass: the lookahead reports a match at every position, and
+# alternatives are listed in priority order so each position yields its highest-priority keyword
+THEME_SCAN_PATTERN = re.compile('(?=(%s))' % _keyword_pattern(THEME_KEYWORD_RANKS).pattern)
+SIZE_PATTERN = _keyword_pattern(('big', 'large', 'huge', 'massive'))
+
+# Prompt triggers for contextual NPCs and quests, one compiled scan per group
+BATTLE_TRIGGERS = _keyword_pattern(('defeat', 'fight', 'battle'))
+DEFEAT_TRIGGERS = _keyword_pattern(('defeat', 'fight'))
+HELP_TRIGGERS = _keyword_pattern(('quest', 'help'))
+
 def analyze_theme(prompt_lower: str, words: list = None) -> dict:
     """Analyze the theme/environment from prompt"""
 
-    # Theme detection with priority order (more specific themes first)
-    theme_keywords = {
-        'alien': ['alien', 'extraterrestrial', 'ufo', 'space', 'sci-fi', 'futuristic', 'cyberpunk', 'martian', 'galactic'],
-        'horror': ['horror', 'scary', 'haunted', 'ghost', 'zombie', 'dark', 'spooky'],
-        'medieval': ['medieval', 'castle', 'knight', 'dragon', 'sword', 'kingdom', 'fortress'],
-        'underwater': ['underwater', 'ocean', 'sea', 'submarine', 'coral', 'aquatic'],
-        'arctic': ['arctic', 'ice', 'snow', 'frozen', 'cold', 'winter', 'tundra'],
-        'desert': ['desert', 'sand', 'oasis', 'pyramid', 'dune', 'sahara'],
-        'fantasy': ['magic', 'wizard', 'fairy', 'forest', 'crystal', 'magical', 'enchanted'],
-        'modern': ['city', 'urban', 'modern', 'street', 'building', 'car', 'metropolitan']
-    }
-
     detected_theme = 'fantasy'  # default
 
-    # Check themes in priority order
-    for theme, keywords in theme_keywords.items():
-        if any(keyword in prompt_lower for keyword in keywords):
-            detected_theme = theme
-            print(f"🎯 Detected theme: {detected_theme} (found keywords: {[kw for kw in keywords if kw in prompt_lower]})")
-            break
+    # Single scan for the best-ranked theme with any keyword in the prompt
+    best_rank = len(THEME_KEYWORDS)
+    for match in THEME_SCAN_PATTERN.finditer(prompt_lower):
+        rank = THEME_KEYWORD_RANKS[match.group(1)]
+        if rank < best_rank:
+            best_rank = rank
+            if rank == 0:
+                break
+
+    if best_rank < len(THEME_KEYWORDS):
+        detected_theme, keywords = THEME_KEYWORDS[best_rank]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Detected theme: %s (found keywords: %s)", detected_theme,
+                         [kw for kw in keywords if kw in prompt_lower])
 
     return {
         'type': detected_theme,
         'atmosphere': 'mysterious' if 'dark' in prompt_lower else 'adventurous',
-        'size': 'large' if any(word in prompt_lower for word in ['big', 'large', 'huge', 'massive']) else 'medium'
+        'size': 'large' if SIZE_PATTERN.search(prompt_lower) else 'medium'
     }
 
 def generate_world_name(prompt: str, theme: str) -> str:
     """Generate a world name from the prompt"""
-    words = prompt.split()[:4]  # Take first 4 words
+    words = prompt.split(maxsplit=4)[:4]  # Take first 4 words without splitting the rest of the prompt
     name_words = [word.capitalize() for word in words if word.isalpha()]
     if name_words:
         return ' '.join(name_words)
@@ -238,7 +400,7 @@ def generate_contextual_npcs(prompt_lower: str, theme: str) -> list:
     npcs = []
 
     if theme == 'alien':
-        if 'defeat' in prompt_lower or 'fight' in prompt_lower or 'battle' in prompt_lower:
+        if BATTLE_TRIGGERS.search(prompt_lower):
             npcs.extend([
                 {
                     'name': 'Alien Warrior',
@@ -259,7 +421,7 @@ def generate_contextual_npcs(prompt_lower: str, theme: str) -> list:
             ])
 
         # Add friendly alien if not purely combat
-        if 'quest' in prompt_lower or 'help' in prompt_lower:
+        if HELP_TRIGGERS.search(prompt_lower):
             npcs.append({
                 'name': 'Alien Informant',
                 'type': 'friendly',
@@ -296,7 +458,7 @@ def generate_contextual_quests(prompt_lower: str, theme: str) -> list:
     quests = []
 
     if theme == 'alien':
-        if 'defeat' in prompt_lower or 'fight' in prompt_lower:
+        if DEFEAT_TRIGGERS.search(prompt_lower):
             quest = {
                 'name': 'Alien Invasion Defense',
                 'description': 'Defeat the alien invaders to save the city',
@@ -308,9 +470,7 @@ def generate_contextual_quests(prompt_lower: str, theme: str) -> list:
                 'rewards': ['Plasma Rifle', '500 Credits', 'Hero Badge'],
                 'npc': 'Alien Informant'
             }
-            # Ensure it's a proper dictionary
-            if isinstance(quest, dict):
-                quests.append(quest)
+            quests.append(quest)
 
         if 'city' in prompt_lower:
             quest = {
@@ -323,9 +483,7 @@ def generate_contextual_quests(prompt_lower: str, theme: str) -> list:
                 ],
                 'rewards': ['Advanced Armor', '1000 Credits']
             }
-            # Ensure it's a proper dictionary
-            if isinstance(quest, dict):
-                quests.append(quest)
+            quests.append(quest)
 
     elif theme == 'fantasy':
         quest = {
@@ -334,340 +492,326 @@ def generate_contextual_quests(prompt_lower: str, theme: str) -> list:
             'objectives': ['Find 5 magical crystals', 'Return to the Elder'],
             'rewards': ['Magic Staff', '100 Gold']
         }
-        # Ensure it's a proper dictionary
-        if isinstance(quest, dict):
-            quests.append(quest)
+        quests.append(quest)
 
-    # Final validation - ensure all quests are dictionaries
-    validated_quests = []
-    for quest in quests:
-        if isinstance(quest, dict):
-            validated_quests.append(quest)
-        else:
-            print(f"⚠️ Warning: Invalid quest type {type(quest)}: {quest}")
+    return quests
 
-    return validated_quests
+def _keep_dicts(items: list, label: str) -> list:
+    """Entries of items that are dicts, logging any others; items itself when all are"""
+    if all(isinstance(item, dict) for item in items):
+        return items
+    for i, item in enumerate(items):
+        if not isinstance(item, dict):
+            logger.warning("%s %d is not a dict, skipping: %s", label, i, type(item))
+    return [item for item in items if isinstance(item, dict)]
 
 def validate_world_data(world_data):
     """Validate and fix world data structure"""
     if not isinstance(world_data, dict):
-        print(f"❌ Critical Error: world_data is not a dict: {type(world_data)}")
-        print(f"world_data content: {world_data}")
+        logger.error("world_data is not a dict: %s", type(world_data))
+        logger.error("world_data content: %s", world_data)
         return None
 
     # Ensure required fields exist
     if 'id' not in world_data:
-        world_data['id'] = str(uuid.uuid4())
-    if 'name' not in world_data:
-        world_data['name'] = 'Generated World'
-    if 'theme' not in world_data:
-        world_data['theme'] = 'fantasy'
-
-    # Validate NPCs
-    if 'npcs' in world_data:
-        if not isinstance(world_data['npcs'], list):
-            print(f"⚠️ Warning: NPCs is not a list, converting: {type(world_data['npcs'])}")
-            world_data['npcs'] = []
+        world_data['id'] = _new_world_id()
+    world_data.setdefault('name', 'Generated World')
+    world_data.setdefault('theme', 'fantasy')
+
+    # NPCs and quests must be lists of dicts
+    for field, label in (('npcs', 'NPC'), ('quests', 'Quest')):
+        if field not in world_data:
+            continue
+        items = world_data[field]
+        if isinstance(items, list):
+            world_data[field] = _keep_dicts(items, label)
         else:
-            # Validate each NPC
-            valid_npcs = []
-            for i, npc in enumerate(world_data['npcs']):
-                if isinstance(npc, dict):
-                    valid_npcs.append(npc)
-                else:
-                    print(f"⚠️ Warning: NPC {i} is not a dict, skipping: {type(npc)}")
-            world_data['npcs'] = valid_npcs
-
-    # Validate Quests
-    if 'quests' in world_data:
-        if not isinstance(world_data['quests'], list):
-            print(f"⚠️ Warning: Quests is not a list, converting: {type(world_data['quests'])}")
-            world_data['quests'] = []
-        else:
-            # Validate each quest
-            valid_quests = []
-            for i, quest in enumerate(world_data['quests']):
-                if isinstance(quest, dict):
-                    valid_quests.append(quest)
-                else:
-                    print(f"⚠️ Warning: Quest {i} is not a dict, skipping: {type(quest)}")
-            world_data['quests'] = valid_quests
-
-    print(f"✅ World data validation complete. NPCs: {len(world_data.get('npcs', []))}, Quests: {len(world_data.get('quests', []))}")
+            logger.warning("%ss is not a list, converting: %s", label, type(items))
+            world_data[field] = []
+
+    logger.debug("World data validation complete. NPCs: %d, Quests: %d",
+                 len(world_data.get('npcs', [])), len(world_data.get('quests', [])))
     return world_data
 
+# Theme NPC/quest payloads are built once at import; callers treat them as read-only
+_FANTASY_NPCS = (
+    {
+        'name': 'Village Elder',
+        'type': 'friendly',
+        'health': 100,
+        'level': 5,
+        'faction': 'village',
+        'quest_giver': True,
+        'dialogue': ['Welcome, young adventurer!', 'I have a quest for you.', 'The village needs your help.'],
+        'location': {'x': 0, 'y': 0, 'z': 0}
+    },
+    {
+        'name': 'Fairy Merchant',
+        'type': 'friendly',
+        'health': 50,
+        'level': 3,
+        'faction': 'fairy',
+        'merchant': True,
+        'dialogue': ['Welcome to my shop!', 'I have magical items for sale.', 'Take a look at my wares.'],
+        'location': {'x': 200, 'y': 100, 'z': 0}
+    },
+    {
+        'name': 'Forest Guardian',
+        'type': 'neutral',
+        'health': 150,
+        'level': 8,
+        'faction': 'nature',
+        'quest_giver': True,
+        'dialogue': ['The forest speaks to me.', 'I protect this sacred grove.', 'What brings you here?'],
+        'location': {'x': 400, 'y': 300, 'z': 0}
+    }
+)
+
+_CYBERPUNK_NPCS = (
+    {
+        'name': 'Hacker',
+        'type': 'friendly',
+        'health': 80,
+        'level': 6,
+        'faction': 'underground',
+        'quest_giver': True,
+        'dialogue': ['Hey, need some tech work?', 'I can hack anything.', 'The corps are watching.'],
+        'location': {'x': 0, 'y': 0, 'z': 0}
+    },
+    {
+        'name': 'Street Vendor',
+        'type': 'friendly',
+        'health': 60,
+        'level': 2,
+        'faction': 'street',
+        'merchant': True,
+        'dialogue': ['Fresh synth-meat!', 'Best prices in the district.', 'Stay safe out there.'],
+        'location': {'x': 200, 'y': 100, 'z': 0}
+    },
+    {
+        'name': 'Corporate Agent',
+        'type': 'hostile',
+        'health': 120,
+        'level': 7,
+        'faction': 'corporate',
+        'quest_giver': False,
+        'dialogue': ['Unauthorized access detected.', 'You will be terminated.', 'Surrender now.'],
+        'location': {'x': 400, 'y': 300, 'z': 0}
+    }
+)
+
+_MEDIEVAL_NPCS = (
+    {
+        'name': 'Knight Commander',
+        'type': 'friendly',
+        'health': 150,
+        'level': 10,
+        'faction': 'kingdom',
+        'quest_giver': True,
+        'dialogue': ['Greetings, brave warrior!', 'The kingdom needs your sword.', 'Honor and glory await.'],
+        'location': {'x': 0, 'y': 0, 'z': 0}
+    },
+    {
+        'name': 'Blacksmith',
+        'type': 'friendly',
+        'health': 100,
+        'level': 4,
+        'faction': 'craftsmen',
+        'merchant': True,
+        'dialogue': ['Fine weapons for sale!', 'I forge the best steel.', 'What can I make for you?'],
+        'location': {'x': 200, 'y': 100, 'z': 0}
+    },
+    {
+        'name': 'Wise Wizard',
+        'type': 'friendly',
+        'health': 80,
+        'level': 12,
+        'faction': 'magic',
+        'quest_giver': True,
+        'dialogue': ['Magic flows through this land.', 'I sense great power in you.', 'The ancient spells call.'],
+        'location': {'x': 400, 'y': 300, 'z': 0}
+    }
+)
+
+_DEFAULT_NPCS = (
+    {
+        'name': 'Local Guide',
+        'type': 'friendly',
+        'health': 100,
+        'level': 3,
+        'faction': 'local',
+        'quest_giver': True,
+        'dialogue': ['Welcome to our world!', 'I can help you get started.', 'Adventure awaits!'],
+        'location': {'x': 0, 'y': 0, 'z': 0}
+    },
+)
+
+_FANTASY_QUESTS = (
+    {
+        'name': 'Crystal Collection',
+        'type': 'main',
+        'objective': 'Collect 5 magical crystals',
+        'description': 'The village needs magical crystals to power their defenses',
+        'rewards': {'experience': 100, 'gold': 50},
+        'location': {'x': 300, 'y': 200, 'z': 0}
+    },
+    {
+        'name': 'Fairy Rescue',
+        'type': 'side',
+        'objective': 'Rescue a trapped fairy',
+        'description': 'A fairy is trapped in a spider web',
+        'rewards': {'experience': 50, 'gold': 25},
+        'location': {'x': 500, 'y': 300, 'z': 0}
+    },
+    {
+        'name': 'Forest Guardian',
+        'type': 'main',
+        'objective': 'Defeat the corrupted guardian',
+        'description': 'The forest guardian has been corrupted by dark magic',
+        'rewards': {'experience': 200, 'gold': 100},
+        'location': {'x': 700, 'y': 400, 'z': 0}
+    }
+)
+
+_CYBERPUNK_QUESTS = (
+    {
+        'name': 'Data Heist',
+        'type': 'main',
+        'objective': 'Steal corporate data',
+        'description': 'Infiltrate the corporate building and steal classified data',
+        'rewards': {'experience': 150, 'credits': 100},
+        'location': {'x': 300, 'y': 200, 'z': 0}
+    },
+    {
+        'name': 'Street Justice',
+        'type': 'side',
+        'objective': 'Stop street gang activity',
+        'description': 'Help clean up the streets from gang violence',
+        'rewards': {'experience': 75, 'credits': 50},
+        'location': {'x': 500, 'y': 300, 'z': 0}
+    },
+    {
+        'name': 'System Override',
+        'type': 'main',
+        'objective': 'Hack the mainframe',
+        'description': 'Override the corporate security system',
+        'rewards': {'experience': 250, 'credits': 150},
+        'location': {'x': 700, 'y': 400, 'z': 0}
+    }
+)
+
+_MEDIEVAL_QUESTS = (
+    {
+        'name': 'Dragon Slayer',
+        'type': 'main',
+        'objective': 'Defeat the dragon',
+        'description': 'The kingdom is under threat from a fearsome dragon',
+        'rewards': {'experience': 300, 'gold': 200},
+        'location': {'x': 300, 'y': 200, 'z': 0}
+    },
+    {
+        'name': 'Royal Delivery',
+        'type': 'side',
+        'objective': 'Deliver royal message',
+        'description': 'Carry an important message to the neighboring kingdom',
+        'rewards': {'experience': 100, 'gold': 75},
+        'location': {'x': 500, 'y': 300, 'z': 0}
+    },
+    {
+        'name': 'Ancient Relic',
+        'type': 'main',
+        'objective': 'Find the ancient relic',
+        'description': 'Recover a powerful relic from the ancient ruins',
+        'rewards': {'experience': 400, 'gold': 300},
+        'location': {'x': 700, 'y': 400, 'z': 0}
+    }
+)
+
+_DEFAULT_QUESTS = (
+    {
+        'name': 'Exploration',
+        'type': 'main',
+        'objective': 'Explore the world',
+        'description': 'Discover the secrets of this mysterious world',
+        'rewards': {'experience': 100, 'gold': 50},
+        'location': {'x': 300, 'y': 200, 'z': 0}
+    },
+)
+
+_THEME_NPCS = {
+    'fantasy': _FANTASY_NPCS,
+    'cyberpunk': _CYBERPUNK_NPCS,
+    'medieval': _MEDIEVAL_NPCS
+}
+
+_THEME_QUESTS = {
+    'fantasy': _FANTASY_QUESTS,
+    'cyberpunk': _CYBERPUNK_QUESTS,
+    'medieval': _MEDIEVAL_QUESTS
+}
+
+_BASE_ENVIRONMENT = MappingProxyType({
+    'lighting': 'dynamic_lighting',
+    'weather': 'clear',
+    'atmosphere': 'normal',
+    'size': 'medium'
+})
+
+_THEME_ENVIRONMENTS = MappingProxyType({
+    'fantasy': MappingProxyType({
+        'atmosphere': 'magical',
+        'assets': ('trees', 'bushes', 'rocks', 'flowers', 'mushrooms', 'crystals', 'magic_portals')
+    }),
+    'cyberpunk': MappingProxyType({
+        'lighting': 'neon_lighting',
+        'weather': 'rainy',
+        'atmosphere': 'urban',
+        'assets': ('buildings', 'neon_signs', 'vehicles', 'street_lights', 'holograms', 'security_cameras')
+    }),
+    'medieval': MappingProxyType({
+        'atmosphere': 'historical',
+        'assets': ('castles', 'towers', 'walls', 'banners', 'torches', 'stone_paths', 'moats')
+    }),
+    'desert': MappingProxyType({
+        'weather': 'hot',
+        'atmosphere': 'arid',
+        'assets': ('sand_dunes', 'cacti', 'rocks', 'oasis', 'ruins', 'tents')
+    })
+})
+_DEFAULT_ENVIRONMENT = MappingProxyType({
+    'assets': ('trees', 'rocks', 'buildings', 'paths')
+})
+
 def generate_theme_npcs(theme: str, include_npcs: bool) -> list:
     """Generate NPCs based on theme"""
     if not include_npcs:
         return []
-    
-    npcs = []
-    
-    if theme == "fantasy":
-        npcs = [
-            {
-                'name': 'Village Elder',
-                'type': 'friendly',
-                'health': 100,
-                'level': 5,
-                'faction': 'village',
-                'quest_giver': True,
-                'dialogue': ['Welcome, young adventurer!', 'I have a quest for you.', 'The village needs your help.'],
-                'location': {'x': 0, 'y': 0, 'z': 0}
-            },
-            {
-                'name': 'Fairy Merchant',
-                'type': 'friendly',
-                'health': 50,
-                'level': 3,
-                'faction': 'fairy',
-                'merchant': True,
-                'dialogue': ['Welcome to my shop!', 'I have magical items for sale.', 'Take a look at my wares.'],
-                'location': {'x': 200, 'y': 100, 'z': 0}
-            },
-            {
-                'name': 'Forest Guardian',
-                'type': 'neutral',
-                'health': 150,
-                'level': 8,
-                'faction': 'nature',
-                'quest_giver': True,
-                'dialogue': ['The forest speaks to me.', 'I protect this sacred grove.', 'What brings you here?'],
-                'location': {'x': 400, 'y': 300, 'z': 0}
-            }
-        ]
-    elif theme == "cyberpunk":
-        npcs = [
-            {
-                'name': 'Hacker',
-                'type': 'friendly',
-                'health': 80,
-                'level': 6,
-                'faction': 'underground',
-                'quest_giver': True,
-                'dialogue': ['Hey, need some tech work?', 'I can hack anything.', 'The corps are watching.'],
-                'location': {'x': 0, 'y': 0, 'z': 0}
-            },
-            {
-                'name': 'Street Vendor',
-                'type': 'friendly',
-                'health': 60,
-                'level': 2,
-                'faction': 'street',
-                'merchant': True,
-                'dialogue': ['Fresh synth-meat!', 'Best prices in the district.', 'Stay safe out there.'],
-                'location': {'x': 200, 'y': 100, 'z': 0}
-            },
-            {
-                'name': 'Corporate Agent',
-                'type': 'hostile',
-                'health': 120,
-                'level': 7,
-                'faction': 'corporate',
-                'quest_giver': False,
-                'dialogue': ['Unauthorized access detected.', 'You will be terminated.', 'Surrender now.'],
-                'location': {'x': 400, 'y': 300, 'z': 0}
-            }
-        ]
-    elif theme == "medieval":
-        npcs = [
-            {
-                'name': 'Knight Commander',
-                'type': 'friendly',
-                'health': 150,
-                'level': 10,
-                'faction': 'kingdom',
-                'quest_giver': True,
-                'dialogue': ['Greetings, brave warrior!', 'The kingdom needs your sword.', 'Honor and glory await.'],
-                'location': {'x': 0, 'y': 0, 'z': 0}
-            },
-            {
-                'name': 'Blacksmith',
-                'type': 'friendly',
-                'health': 100,
-                'level': 4,
-                'faction': 'craftsmen',
-                'merchant': True,
-                'dialogue': ['Fine weapons for sale!', 'I forge the best steel.', 'What can I make for you?'],
-                'location': {'x': 200, 'y': 100, 'z': 0}
-            },
-            {
-                'name': 'Wise Wizard',
-                'type': 'friendly',
-                'health': 80,
-                'level': 12,
-                'faction': 'magic',
-                'quest_giver': True,
-                'dialogue': ['Magic flows through this land.', 'I sense great power in you.', 'The ancient spells call.'],
-                'location': {'x': 400, 'y': 300, 'z': 0}
-            }
-        ]
-    else:
-        # Default NPCs
-        npcs = [
-            {
-                'name': 'Local Guide',
-                'type': 'friendly',
-                'health': 100,
-                'level': 3,
-                'faction': 'local',
-                'quest_giver': True,
-                'dialogue': ['Welcome to our world!', 'I can help you get started.', 'Adventure awaits!'],
-                'location': {'x': 0, 'y': 0, 'z': 0}
-            }
-        ]
-    
-    return npcs
+
+    # Shallow copy: the NPC dicts are shared templates and must not be mutated in place
+    return list(_THEME_NPCS.get(theme, _DEFAULT_NPCS))
 
 def generate_theme_quests(theme: str, include_quests: bool) -> list:
     """Generate quests based on theme"""
     if not include_quests:
         return []
-    
-    quests = []
-    
-    if theme == "fantasy":
-        quests = [
-            {
-                'name': 'Crystal Collection',
-                'type': 'main',
-                'objective': 'Collect 5 magical crystals',
-                'description': 'The village needs magical crystals to power their defenses',
-                'rewards': {'experience': 100, 'gold': 50},
-                'location': {'x': 300, 'y': 200, 'z': 0}
-            },
-            {
-                'name': 'Fairy Rescue',
-                'type': 'side',
-                'objective': 'Rescue a trapped fairy',
-                'description': 'A fairy is trapped in a spider web',
-                'rewards': {'experience': 50, 'gold': 25},
-                'location': {'x': 500, 'y': 300, 'z': 0}
-            },
-            {
-                'name': 'Forest Guardian',
-                'type': 'main',
-                'objective': 'Defeat the corrupted guardian',
-                'description': 'The forest guardian has been corrupted by dark magic',
-                'rewards': {'experience': 200, 'gold': 100},
-                'location': {'x': 700, 'y': 400, 'z': 0}
-            }
-        ]
-    elif theme == "cyberpunk":
-        quests = [
-            {
-                'name': 'Data Heist',
-                'type': 'main',
-                'objective': 'Steal corporate data',
-                'description': 'Infiltrate the corporate building and steal classified data',
-                'rewards': {'experience': 150, 'credits': 100},
-                'location': {'x': 300, 'y': 200, 'z': 0}
-            },
-            {
-                'name': 'Street Justice',
-                'type': 'side',
-                'objective': 'Stop street gang activity',
-                'description': 'Help clean up the streets from gang violence',
-                'rewards': {'experience': 75, 'credits': 50},
-                'location': {'x': 500, 'y': 300, 'z': 0}
-            },
-            {
-                'name': 'System Override',
-                'type': 'main',
-                'objective': 'Hack the mainframe',
-                'description': 'Override the corporate security system',
-                'rewards': {'experience': 250, 'credits': 150},
-                'location': {'x': 700, 'y': 400, 'z': 0}
-            }
-        ]
-    elif theme == "medieval":
-        quests = [
-            {
-                'name': 'Dragon Slayer',
-                'type': 'main',
-                'objective': 'Defeat the dragon',
-                'description': 'The kingdom is under threat from a fearsome dragon',
-                'rewards': {'experience': 300, 'gold': 200},
-                'location': {'x': 300, 'y': 200, 'z': 0}
-            },
-            {
-                'name': 'Royal Delivery',
-                'type': 'side',
-                'objective': 'Deliver royal message',
-                'description': 'Carry an important message to the neighboring kingdom',
-                'rewards': {'experience': 100, 'gold': 75},
-                'location': {'x': 500, 'y': 300, 'z': 0}
-            },
-            {
-                'name': 'Ancient Relic',
-                'type': 'main',
-                'objective': 'Find the ancient relic',
-                'description': 'Recover a powerful relic from the ancient ruins',
-                'rewards': {'experience': 400, 'gold': 300},
-                'location': {'x': 700, 'y': 400, 'z': 0}
-            }
-        ]
-    else:
-        # Default quests
-        quests = [
-            {
-                'name': 'Exploration',
-                'type': 'main',
-                'objective': 'Explore the world',
-                'description': 'Discover the secrets of this mysterious world',
-                'rewards': {'experience': 100, 'gold': 50},
-                'location': {'x': 300, 'y': 200, 'z': 0}
-            }
-        ]
-    
-    return quests
+
+    # Shallow copy: the quest dicts are shared templates and must not be mutated in place
+    return list(_THEME_QUESTS.get(theme, _DEFAULT_QUESTS))
 
 def generate_theme_environment(theme: str, environment_type: str, include_environment: bool) -> dict:
     """Generate environment data based on theme"""
     if not include_environment:
         return {}
-    
-    environment = {
-        'type': environment_type,
-        'lighting': 'dynamic_lighting',
-        'weather': 'clear',
-        'atmosphere': 'normal',
-        'size': 'medium'
-    }
-    
-    if theme == "fantasy":
-        environment.update({
-            'atmosphere': 'magical',
-            'assets': ['trees', 'bushes', 'rocks', 'flowers', 'mushrooms', 'crystals', 'magic_portals']
-        })
-    elif theme == "cyberpunk":
-        environment.update({
-            'lighting': 'neon_lighting',
-            'weather': 'rainy',
-            'atmosphere': 'urban',
-            'assets': ['buildings', 'neon_signs', 'vehicles', 'street_lights', 'holograms', 'security_cameras']
-        })
-    elif theme == "medieval":
-        environment.update({
-            'atmosphere': 'historical',
-            'assets': ['castles', 'towers', 'walls', 'banners', 'torches', 'stone_paths', 'moats']
-        })
-    elif theme == "desert":
-        environment.update({
-            'weather': 'hot',
-            'atmosphere': 'arid',
-            'assets': ['sand_dunes', 'cacti', 'rocks', 'oasis', 'ruins', 'tents']
-        })
-    else:
-        environment.update({
-            'assets': ['trees', 'rocks', 'buildings', 'paths']
-        })
-    
+
+    environment = {'type': environment_type, **_BASE_ENVIRONMENT}
+    for key, value in _THEME_ENVIRONMENTS.get(theme, _DEFAULT_ENVIRONMENT).items():
+        # Asset tuples become fresh lists so the response keeps its list shape
+        environment[key] = list(value) if isinstance(value, tuple) else value
+
     return environment
 
-@app.route('/')
-def index():
-    return '''
+# The page is static: encode, compress and tag it once at import
+INDEX_HTML = '''
 <!DOCTYPE html>
 <html>
 <head>
@@ -1088,8 +1232,7 @@ def index():
         }
 
         // Display JSON data with syntax highlighting
-        function displayJSON(data) {
-            const jsonDisplay = document.getElementById('json-display');
+        function highlightJSON(data) {
             const formattedJSON = JSON.stringify(data, null, 2);
 
             // Simple syntax highlighting using replace with regex
@@ -1099,7 +1242,51 @@ def index():
             highlighted = highlighted.replace(/: (\\d+)/g, ': <span style="color: #ffa07a;">$1</span>');
             highlighted = highlighted.replace(/: (true|false|null)/g, ': <span style="color: #ff6b6b;">$1</span>');
 
-            jsonDisplay.innerHTML = highlighted;
+            return highlighted;
+        }
+
+        // Stringify + highlight large worlds in a worker built from highlightJSON itself,
+        // so the page stays responsive; null when workers are unavailable
+        function createJSONHighlighter() {
+            if (!window.Worker || !window.Blob || !window.URL) {
+                return null;
+            }
+            try {
+                const source = highlightJSON.toString() +
+                    '\\nself.onmessage = (event) => self.postMessage({ seq: event.data.seq, html: highlightJSON(event.data.data) });';
+                return new Worker(URL.createObjectURL(new Blob([source], { type: 'application/javascript' })));
+            } catch (error) {
+                return null;
+            }
+        }
+
+        let jsonHighlighter = createJSONHighlighter();
+        let jsonRenderSeq = 0;  // Only the latest displayJSON call is rendered
+        let pendingJSON = null;
+
+        if (jsonHighlighter) {
+            jsonHighlighter.onmessage = (event) => {
+                if (event.data.seq === jsonRenderSeq) {
+                    document.getElementById('json-display').innerHTML = event.data.html;
+                    pendingJSON = null;
+                }
+            };
+            jsonHighlighter.onerror = () => {
+                // Fall back to the main thread for this and every later render
+                jsonHighlighter = null;
+                if (pendingJSON !== null) {
+                    displayJSON(pendingJSON);
+                }
+            };
+        }
+
+        function displayJSON(data) {
+            if (!jsonHighlighter) {
+                document.getElementById('json-display').innerHTML = highlightJSON(data);
+                return;
+            }
+            pendingJSON = data;
+            jsonHighlighter.postMessage({ seq: ++jsonRenderSeq, data: data });
         }
 
         // Create 3D preview of the world
@@ -1298,11 +1485,31 @@ def index():
     </script>
 </body>
 </html>
-    '''
+    '''.encode('utf-8')
+INDEX_HTML_GZIP = gzip.compress(INDEX_HTML, 9, mtime=0)
+INDEX_ETAG = hashlib.sha1(INDEX_HTML).hexdigest()
+INDEX_GZIP_ETAG = INDEX_ETAG + '-gzip'
+
+@app.route('/')
+def index():
+    use_gzip = request.accept_encodings['gzip'] > 0
+    body, etag = (INDEX_HTML_GZIP, INDEX_GZIP_ETAG) if use_gzip else (INDEX_HTML, INDEX_ETAG)
+
+    # Browsers revalidate on every load and get a bodiless 304 while the page is unchanged
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(body, mimetype='text/html')
+        if use_gzip:
+            response.headers['Content-Encoding'] = 'gzip'
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.vary.add('Accept-Encoding')
+    return response
 
 @app.route('/api/status')
 def api_status():
-    return jsonify({
+    return _jsonify({
         'status': 'running',
         'ue5_available': UE5_AVAILABLE,
         'cached_worlds': len(json_cache)
@@ -1316,24 +1523,17 @@ def api_generate_json():
         options = data.get('options', {})
         
         if not prompt:
-            return jsonify({'success': False, 'error': 'Prompt is required'}), 400
+            return _jsonify({'success': False, 'error': 'Prompt is required'}), 400
         
         # Use intelligent world generation based on prompt analysis
-        print(f"🎯 Analyzing prompt: '{prompt}'")
+        logger.debug("Analyzing prompt: '%s'", prompt)
         world_data = generate_intelligent_world_data(prompt, options)
-        print(f"🔍 Debug - Generated world_data type: {type(world_data)}")
-        print(f"🔍 Debug - Generated world_data keys: {list(world_data.keys()) if isinstance(world_data, dict) else 'Not a dict'}")
-        world_id = world_data['id']
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Generated world_data type: %s", type(world_data))
+            logger.debug("Generated world_data keys: %s", list(world_data.keys()) if isinstance(world_data, dict) else 'Not a dict')
+        world_id = _cache_for_project(world_data, prompt, options)
         
-        # Cache for step 2
-        json_cache[world_id] = {
-            'world_data': world_data,
-            'prompt': prompt,
-            'options': options,
-            'created_at': datetime.now().isoformat()
-        }
-        
-        return jsonify({
+        return _jsonify({
             'success': True,
             'world_id': world_id,
             'world_data': world_data,
@@ -1341,7 +1541,58 @@ def api_generate_json():
         })
         
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/generate-json-batch', methods=['POST'])
+def api_generate_json_batch():
+    try:
+        data = request.get_json()
+        prompts = data.get('prompts', [])
+        options = data.get('options', {})
+
+        if not isinstance(prompts, list) or not prompts or not all(isinstance(p, str) and p for p in prompts):
+            return _jsonify({'success': False, 'error': 'A non-empty list of prompts is required'}), 400
+        if len(prompts) > MAX_BATCH_PROMPTS:
+            return _jsonify({'success': False, 'error': f'At most {MAX_BATCH_PROMPTS} prompts per batch'}), 400
+
+        # LLM calls block on network I/O, so keep several of them in flight at once
+        with ThreadPoolExecutor(max_workers=min(BATCH_WORKERS, len(prompts))) as executor:
+            worlds = list(executor.map(lambda prompt: generate_intelligent_world_data(prompt, options), prompts))
+
+        return _jsonify({
+            'success': True,
+            'worlds': [
+                {'world_id': _cache_for_project(world_data, prompt, options), 'world_data': world_data}
+                for prompt, world_data in zip(prompts, worlds)
+            ],
+            'message': f'JSON data for {len(worlds)} worlds generated successfully!'
+        })
+
+    except Exception as e:
+        return _jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/world/<world_id>')
+def api_get_world(world_id):
+    cached_data = _project_world(world_id)
+    if cached_data is None:
+        return _jsonify({'success': False, 'error': 'Invalid world ID'}), 404
+
+    # Serialize and tag a world once; repeat fetches only compare the ETag. The lock keeps
+    # step 2 validation from repairing the world while it is being serialized
+    with json_cache_lock:
+        cached = cached_data.get('response')
+        if cached is None:
+            body = _freeze_world({'success': True, 'world_id': world_id, 'world_data': cached_data['world_data']})
+            cached = cached_data['response'] = (body, hashlib.blake2b(body, digest_size=16).hexdigest())
+    body, etag = cached
+
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
 
 @app.route('/api/create-ue5-project', methods=['POST'])
 def api_create_ue5_project():
@@ -1350,24 +1601,25 @@ def api_create_ue5_project():
         world_id = data.get('world_id', '')
         ue5_options = data.get('ue5_options', {})
         
-        if not world_id or world_id not in json_cache:
-            return jsonify({'success': False, 'error': 'Invalid world ID'}), 400
+        cached_data = _project_world(world_id) if world_id else None
+        if cached_data is None:
+            return _jsonify({'success': False, 'error': 'Invalid world ID'}), 400
         
         if not ue5_generator:
-            return jsonify({'success': False, 'error': 'UE5 World Generator not available'}), 500
-
-        cached_data = json_cache[world_id]
-        print(f"🔍 Debug - cached_data type: {type(cached_data)}")
-        print(f"🔍 Debug - cached_data keys: {list(cached_data.keys()) if isinstance(cached_data, dict) else 'Not a dict'}")
+            return _jsonify({'success': False, 'error': 'UE5 World Generator not available'}), 500
 
         world_data = cached_data['world_data']
-        print(f"🔍 Debug - world_data from cache type: {type(world_data)}")
-        print(f"🔍 Debug - world_data from cache: {world_data}")
-
-        # Validate world data before passing to UE5 generator
-        validated_world_data = validate_world_data(world_data)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("cached_data keys: %s", list(cached_data.keys()) if isinstance(cached_data, dict) else 'Not a dict')
+            logger.debug("world_data from cache: %s", world_data)
+
+        # Validate world data before passing to UE5 generator. Validation may repair the
+        # world in place, so it runs under the lock and drops the stale serialized response
+        with json_cache_lock:
+            validated_world_data = validate_world_data(world_data)
+            cached_data.pop('response', None)
         if validated_world_data is None:
-            return jsonify({
+            return _jsonify({
                 'success': False,
                 'error': 'Invalid world data structure - validation failed'
             }), 500
@@ -1376,20 +1628,20 @@ def api_create_ue5_project():
         ue5_result = ue5_generator.create_world_in_project(validated_world_data, ue5_options)
         
         if ue5_result.get('success'):
-            return jsonify({
+            return _jsonify({
                 'success': True,
                 'world_id': world_id,
                 'ue5_project': ue5_result,
                 'message': f'UE 5.6.0 project "{world_data["name"]}" created successfully!'
             })
         else:
-            return jsonify({
+            return _jsonify({
                 'success': False,
                 'error': ue5_result.get('error', 'UE5 project creation failed')
             }), 500
             
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/add-test-cube', methods=['POST'])
 def add_test_cube():
@@ -1400,25 +1652,25 @@ def add_test_cube():
         location = data.get('location', {'x': 500, 'y': 500, 'z': 100})
 
         if not ue5_generator:
-            return jsonify({'success': False, 'error': 'UE5 World Generator not available'}), 500
+            return _jsonify({'success': False, 'error': 'UE5 World Generator not available'}), 500
 
         # Create test cube in the project
         cube_result = ue5_generator.create_test_cube(cube_name, location)
 
         if cube_result.get('success'):
-            return jsonify({
+            return _jsonify({
                 'success': True,
                 'cube_info': cube_result,
                 'message': f'Test cube "{cube_name}" created successfully in TTGWorldGenerator project!'
             })
         else:
-            return jsonify({
+            return _jsonify({
                 'success': False,
                 'error': cube_result.get('error', 'Test cube creation failed')
             }), 500
 
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _jsonify({'success': False, 'error': str(e)}), 500
 
 if __name__ == '__main__':
     print("="*50)
@@ -1433,4 +1685,4 @@ if __name__ == '__main__':
         print(f"Base Project: TTG_WorldGenerator_Base")
     print("="*50)
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    app.run(debug=True, host='0.0.0.0', port=5000, threaded=True)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Test that the server's world cache only keeps worlds built from validated LLM output
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import TTG_MAIN_SERVER as server
+
+class FlakyParser:
+    """Stand-in prompt parser whose first parse falls back, as after an Ollama timeout"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def parse_prompt_checked(self, prompt):
+        self.calls += 1
+        if self.calls == 1:
+            return {'metadata': {'level_name': 'Fallback Realm'}}, False
+        return {'metadata': {'level_name': 'Alien Metropolis'}}, True
+
+def test_failed_parse_is_retried():
+    """A fallback world must not be cached; the next request asks the LLM again"""
+
+    print("🧪 Testing world cache after a failed LLM parse")
+    print("=" * 60)
+
+    parser = FlakyParser()
+    saved = server.prompt_parser, server.OLLAMA_AVAILABLE
+    server.prompt_parser, server.OLLAMA_AVAILABLE = parser, True
+    server.world_cache.clear()
+    try:
+        prompt = "Create an alien city where you defeat the invaders"
+        options = {'includeNPCs': True, 'includeQuests': True}
+
+        first = server.generate_intelligent_world_data(prompt, options)
+        assert first['name'] == 'Fallback Realm'
+        assert len(server.world_cache) == 0, "fallback world was cached"
+        print("✅ Fallback world was not cached")
+
+        second = server.generate_intelligent_world_data(prompt, options)
+        assert parser.calls == 2, "LLM was not retried after the failed parse"
+        assert second['name'] == 'Alien Metropolis'
+        assert len(server.world_cache) == 1
+        print("✅ LLM retried and its world cached")
+
+        third = server.generate_intelligent_world_data(prompt, options)
+        assert parser.calls == 2, "cached LLM world was not reused"
+        assert third['name'] == 'Alien Metropolis'
+        assert third['id'] != second['id']
+        print("✅ Repeat request served from the cache with a new world id")
+    finally:
+        server.prompt_parser, server.OLLAMA_AVAILABLE = saved
+        server.world_cache.clear()
+
+if __name__ == "__main__":
+    test_failed_parse_is_retried()